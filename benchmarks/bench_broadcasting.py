@@ -0,0 +1,56 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numpy as np
+
+import awkward as ak
+
+from .generators import generators, sizes
+
+
+class Arithmetic:
+    params = (["jagged", "option"], sizes)
+    param_names = ["kind", "length"]
+
+    def setup(self, kind, length):
+        self.array = generators[kind](length)
+        self.other = generators[kind](length)
+        self.outer = np.random.default_rng(0).normal(0, 1, length)
+
+    def time_scalar(self, kind, length):
+        self.array * 2.5
+
+    def time_same_structure(self, kind, length):
+        self.array + self.array
+
+    def time_outer_to_inner(self, kind, length):
+        self.array + self.outer
+
+    def time_ufunc(self, kind, length):
+        np.sqrt(self.array)
+
+    def time_comparison(self, kind, length):
+        self.array > 0
+
+    def time_where(self, kind, length):
+        ak._v2.operations.where(self.array > 0, self.array, 0)
+
+
+class Records:
+    params = sizes
+    param_names = ["length"]
+
+    def setup(self, length):
+        self.array = generators["records"](length)
+
+    def time_kinematics(self, length):
+        self.array.pt * np.cosh(self.array.eta)
+
+    def time_zip(self, length):
+        ak._v2.operations.zip(
+            {"px": self.array.pt * np.cos(self.array.phi), "charge": self.array.charge}
+        )
+
+    def time_broadcast_arrays(self, length):
+        ak._v2.operations.broadcast_arrays(
+            self.array.pt, ak._v2.operations.num(self.array)
+        )
@@ -0,0 +1,72 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+import shutil
+import tempfile
+
+import awkward as ak
+
+from .generators import generators, sizes
+
+
+class Arrow:
+    params = (["jagged", "option", "records"], sizes)
+    param_names = ["kind", "length"]
+
+    def setup(self, kind, length):
+        self.array = generators[kind](length)
+        self.arrow = ak._v2.operations.to_arrow(self.array)
+
+    def time_to_arrow(self, kind, length):
+        ak._v2.operations.to_arrow(self.array)
+
+    def time_from_arrow(self, kind, length):
+        ak._v2.operations.from_arrow(self.arrow)
+
+
+class Parquet:
+    params = (["jagged", "option", "records"], sizes)
+    param_names = ["kind", "length"]
+
+    def setup(self, kind, length):
+        self.array = generators[kind](length)
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "array.parquet")
+        self.other = os.path.join(self.directory, "other.parquet")
+        ak._v2.operations.to_parquet(self.array, self.path)
+
+    def teardown(self, kind, length):
+        shutil.rmtree(self.directory)
+
+    def time_to_parquet(self, kind, length):
+        ak._v2.operations.to_parquet(self.array, self.other)
+
+    def time_from_parquet(self, kind, length):
+        ak._v2.operations.from_parquet(self.path)
+
+
+class JSON:
+    # the builders are much slower than columnar I/O; skip the largest size
+    params = (["jagged", "option", "records"], sizes[:-1])
+    param_names = ["kind", "length"]
+
+    def setup(self, kind, length):
+        self.array = generators[kind](length)
+        self.json = ak._v2.operations.to_json(self.array)
+        self.lines = ak._v2.operations.to_json(self.array, line_delimited=True)
+        self.list = ak._v2.operations.to_list(self.array)
+
+    def time_to_json(self, kind, length):
+        ak._v2.operations.to_json(self.array)
+
+    def time_to_json_lines(self, kind, length):
+        ak._v2.operations.to_json(self.array, line_delimited=True)
+
+    def time_from_json(self, kind, length):
+        ak._v2.operations.from_json(self.json)
+
+    def time_to_list(self, kind, length):
+        ak._v2.operations.to_list(self.array)
+
+    def time_from_iter(self, kind, length):
+        ak._v2.operations.from_iter(self.list)
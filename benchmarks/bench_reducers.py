@@ -0,0 +1,57 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+from .generators import doubly_jagged, generators, sizes
+
+reducers = [
+    "count",
+    "count_nonzero",
+    "sum",
+    "prod",
+    "any",
+    "all",
+    "min",
+    "max",
+    "argmin",
+    "argmax",
+    "mean",
+    "var",
+    "describe",
+]
+
+
+class Reducers:
+    params = (["jagged", "option"], reducers, sizes)
+    param_names = ["kind", "reducer", "length"]
+
+    def setup(self, kind, reducer, length):
+        self.array = generators[kind](length)
+        self.reducer = getattr(ak._v2.operations, reducer)
+
+    def time_innermost(self, kind, reducer, length):
+        self.reducer(self.array, axis=-1)
+
+    def time_outermost(self, kind, reducer, length):
+        self.reducer(self.array, axis=0)
+
+    def time_all_values(self, kind, reducer, length):
+        self.reducer(self.array, axis=None)
+
+    def peakmem_innermost(self, kind, reducer, length):
+        self.reducer(self.array, axis=-1)
+
+
+class NestedReducers:
+    params = (["sum", "max", "argmax"], sizes)
+    param_names = ["reducer", "length"]
+
+    def setup(self, reducer, length):
+        self.array = doubly_jagged(length)
+        self.reducer = getattr(ak._v2.operations, reducer)
+
+    def time_axis_1(self, reducer, length):
+        self.reducer(self.array, axis=1)
+
+    def time_axis_2(self, reducer, length):
+        self.reducer(self.array, axis=2)
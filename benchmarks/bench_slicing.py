@@ -0,0 +1,63 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numpy as np
+
+import awkward as ak
+
+from .generators import generators, sizes
+
+
+class Slicing:
+    params = (list(generators), sizes)
+    param_names = ["kind", "length"]
+
+    def setup(self, kind, length):
+        self.array = generators[kind](length)
+        self.carry = np.random.default_rng(0).integers(0, length, length)
+
+    def time_range(self, kind, length):
+        self.array[10:-10]
+
+    def time_carry(self, kind, length):
+        self.array[self.carry]
+
+    def time_mask(self, kind, length):
+        self.array[self.carry % 2 == 0]
+
+
+class JaggedSlicing:
+    params = (["jagged", "option", "records"], sizes)
+    param_names = ["kind", "length"]
+
+    def setup(self, kind, length):
+        self.array = generators[kind](length)
+        if kind == "records":
+            self.values = self.array["pt"]
+        else:
+            self.values = self.array
+
+    def time_inner_range(self, kind, length):
+        self.array[:, 1:]
+
+    def time_jagged_mask(self, kind, length):
+        self.array[self.values > 0]
+
+    def time_local_index(self, kind, length):
+        ak._v2.operations.local_index(self.array)
+
+
+class Fields:
+    params = sizes
+    param_names = ["length"]
+
+    def setup(self, length):
+        self.array = generators["records"](length)
+
+    def time_field(self, length):
+        self.array["pt"]
+
+    def time_fields(self, length):
+        self.array[["pt", "eta"]]
+
+    def time_unzip(self, length):
+        ak._v2.operations.unzip(self.array)
@@ -0,0 +1,65 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+from .generators import generators, sizes
+
+
+class Sorting:
+    params = (["jagged", "option"], sizes)
+    param_names = ["kind", "length"]
+
+    def setup(self, kind, length):
+        self.array = generators[kind](length)
+
+    def time_sort(self, kind, length):
+        ak._v2.operations.sort(self.array, axis=-1)
+
+    def time_argsort(self, kind, length):
+        ak._v2.operations.argsort(self.array, axis=-1)
+
+    def time_sort_descending(self, kind, length):
+        ak._v2.operations.sort(self.array, axis=-1, ascending=False)
+
+
+class Combinatorics:
+    params = (["jagged", "records"], sizes)
+    param_names = ["kind", "length"]
+
+    def setup(self, kind, length):
+        self.array = generators[kind](length)
+
+    def time_combinations(self, kind, length):
+        ak._v2.operations.combinations(self.array, 2)
+
+    def time_argcombinations(self, kind, length):
+        ak._v2.operations.argcombinations(self.array, 2)
+
+    def time_cartesian(self, kind, length):
+        ak._v2.operations.cartesian([self.array, self.array])
+
+    def peakmem_cartesian(self, kind, length):
+        ak._v2.operations.cartesian([self.array, self.array])
+
+
+class Restructuring:
+    params = (list(generators), sizes)
+    param_names = ["kind", "length"]
+
+    def setup(self, kind, length):
+        self.array = generators[kind](length)
+
+    def time_flatten(self, kind, length):
+        ak._v2.operations.flatten(self.array, axis=None)
+
+    def time_num(self, kind, length):
+        ak._v2.operations.num(self.array, axis=0)
+
+    def time_concatenate(self, kind, length):
+        ak._v2.operations.concatenate([self.array, self.array])
+
+    def time_packed(self, kind, length):
+        ak._v2.operations.packed(self.array[::2])
+
+    def time_fill_none(self, kind, length):
+        ak._v2.operations.fill_none(self.array, 0, axis=None)
@@ -0,0 +1,129 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+"""
+Synthetic arrays for the benchmarks, built directly from layouts so that
+generating them is cheap and does not depend on the code being timed.
+
+Every generator takes the number of outer lists and returns the same array
+for the same arguments.
+"""
+
+import numpy as np
+
+import awkward as ak
+
+# numbers of outer lists that the benchmarks are parametrized over
+sizes = [1_000, 100_000, 1_000_000]
+
+# mean number of items in each inner list
+mean_length = 5
+
+
+def _offsets(rng, length):
+    counts = rng.poisson(mean_length, length)
+    offsets = np.empty(length + 1, np.int64)
+    offsets[0] = 0
+    np.cumsum(counts, out=offsets[1:])
+    return ak._v2.index.Index64(offsets)
+
+
+def jagged(length, seed=0):
+    """
+    `var * float64`, Poisson-distributed list lengths.
+    """
+    rng = np.random.default_rng(seed)
+    offsets = _offsets(rng, length)
+    content = ak._v2.contents.NumpyArray(rng.normal(0, 1, offsets[-1]))
+    return ak._v2.Array(ak._v2.contents.ListOffsetArray(offsets, content))
+
+
+def doubly_jagged(length, seed=0):
+    """
+    `var * var * int64`.
+    """
+    rng = np.random.default_rng(seed)
+    outer = _offsets(rng, length)
+    inner = _offsets(rng, outer[-1])
+    content = ak._v2.contents.NumpyArray(rng.integers(0, 100, inner[-1]))
+    return ak._v2.Array(
+        ak._v2.contents.ListOffsetArray(
+            outer, ak._v2.contents.ListOffsetArray(inner, content)
+        )
+    )
+
+
+def option(length, seed=0):
+    """
+    `option[var * ?float64]`: about 10% of the lists and 10% of the values are
+    None.
+    """
+    rng = np.random.default_rng(seed)
+    offsets = _offsets(rng, length)
+    content = ak._v2.contents.ByteMaskedArray(
+        ak._v2.index.Index8(rng.random(offsets[-1]) < 0.9),
+        ak._v2.contents.NumpyArray(rng.normal(0, 1, offsets[-1])),
+        valid_when=True,
+    )
+    index = np.arange(length, dtype=np.int64)
+    index[rng.random(length) < 0.1] = -1
+    return ak._v2.Array(
+        ak._v2.contents.IndexedOptionArray(
+            ak._v2.index.Index64(index),
+            ak._v2.contents.ListOffsetArray(offsets, content),
+        )
+    )
+
+
+def records(length, seed=0):
+    """
+    `var * {pt: float64, eta: float64, phi: float64, charge: int64}`, like a
+    collection of particles in each event.
+    """
+    rng = np.random.default_rng(seed)
+    offsets = _offsets(rng, length)
+    n = offsets[-1]
+    content = ak._v2.contents.RecordArray(
+        [
+            ak._v2.contents.NumpyArray(rng.exponential(20, n)),
+            ak._v2.contents.NumpyArray(rng.normal(0, 2, n)),
+            ak._v2.contents.NumpyArray(rng.uniform(-np.pi, np.pi, n)),
+            ak._v2.contents.NumpyArray(rng.choice(np.array([-1, 1]), n)),
+        ],
+        ["pt", "eta", "phi", "charge"],
+        n,
+    )
+    return ak._v2.Array(ak._v2.contents.ListOffsetArray(offsets, content))
+
+
+def union(length, seed=0):
+    """
+    `union[float64, var * int64]`: half numbers, half lists.
+    """
+    rng = np.random.default_rng(seed)
+    tags = (rng.random(length) < 0.5).astype(np.int8)
+    index = np.empty(length, np.int64)
+    numbers = tags == 0
+    index[numbers] = np.arange(numbers.sum())
+    index[~numbers] = np.arange((~numbers).sum())
+    lists = _offsets(rng, (~numbers).sum())
+    return ak._v2.Array(
+        ak._v2.contents.UnionArray(
+            ak._v2.index.Index8(tags),
+            ak._v2.index.Index64(index),
+            [
+                ak._v2.contents.NumpyArray(rng.normal(0, 1, numbers.sum())),
+                ak._v2.contents.ListOffsetArray(
+                    lists,
+                    ak._v2.contents.NumpyArray(rng.integers(0, 100, lists[-1])),
+                ),
+            ],
+        )
+    )
+
+
+generators = {
+    "jagged": jagged,
+    "option": option,
+    "records": records,
+    "union": union,
+}
@@ -0,0 +1,553 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+"""
+Generates a micro-benchmark for every specialization of every CPU kernel in
+kernel-specification.yml, runs them at several input sizes, and writes the
+throughput (elements/s and bytes/s) of each to a JSON report.
+
+The kernels' arguments are synthesized from the roles in the specification
+(the same roles that dev/generate-tests.py uses to pair up test data), so
+that they describe one consistent array at any size: `n` elements in `n / 4`
+lists of length 4, with indexes, parents, offsets, starts, and stops that
+all point inside it. Arguments without a role are filled in by name, and
+the few whose role does not fit a benchmark (such as a carry with the role of
+offsets) are overridden by kernel and name. To keep
+kernels that read or write more than the logical size within bounds, every
+buffer is padded to a capacity of `16 * n`, repeating its last value (so
+that padded offsets, starts, and stops describe empty or valid lists).
+
+Each kernel is run in a forked process (where the platform allows it) so that
+one that crashes or hangs is reported as such instead of ending the run.
+
+    python dev/generate-kernel-benchmarks.py --sizes 1000 100000 --kernel reduce
+
+The report has one entry per specialization and size; entries with a
+"status" other than "ok" are kernels that returned an error, crashed, timed
+out, or could not be benchmarked (pointer-to-pointer arguments). "bytes" is
+the logical size of the input buffers plus `n` items of each output buffer,
+so "bytes_per_second" is an estimate of the memory bandwidth that the kernel
+achieves, not a measurement.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import re
+import time
+
+import numpy
+import yaml
+
+import awkward
+
+CURRENT_DIR = os.path.dirname(os.path.realpath(__file__))
+
+# length of every list in the synthesized arrays
+LIST_LENGTH = 4
+
+# every buffer has room for this many items per element
+CAPACITY = 16
+
+
+class Argument:
+    __slots__ = ("name", "typename", "direction", "role")
+
+    def __init__(self, name, typename, direction, role="default"):
+        self.name = name
+        self.typename = typename
+        self.direction = direction
+        self.role = role
+
+    @property
+    def is_list(self):
+        return "List[" in self.typename
+
+    @property
+    def is_pointer_to_pointer(self):
+        return self.typename.count("List[") > 1
+
+    @property
+    def dtype(self):
+        typename = self.typename.replace("Const[", "").replace("List[", "").rstrip("]")
+        if typename.endswith("_t"):
+            typename = typename[:-2]
+        if typename == "bool":
+            return numpy.dtype(numpy.bool_)
+        elif typename == "float":
+            return numpy.dtype(numpy.float32)
+        elif typename == "double":
+            return numpy.dtype(numpy.float64)
+        else:
+            return numpy.dtype(typename)
+
+
+class Specification:
+    __slots__ = ("kernel", "name", "args")
+
+    def __init__(self, kernel, name, args):
+        self.kernel = kernel
+        self.name = name
+        self.args = args
+
+
+def readspec(pattern=None):
+    specs = []
+    with open(os.path.join(CURRENT_DIR, "..", "kernel-specification.yml")) as specfile:
+        indspec = yaml.safe_load(specfile)["kernels"]
+        for spec in indspec:
+            for childfunc in spec["specializations"]:
+                if (
+                    pattern is not None
+                    and re.search(pattern, spec["name"]) is None
+                    and re.search(pattern, childfunc["name"]) is None
+                ):
+                    continue
+                args = [
+                    Argument(
+                        arg["name"], arg["type"], arg["dir"], arg.get("role", "default")
+                    )
+                    for arg in childfunc["args"]
+                ]
+                specs.append(Specification(spec["name"], childfunc["name"], args))
+    return specs
+
+
+def offsets(n):
+    return numpy.arange(0, n + 1, LIST_LENGTH)
+
+
+def starts(n):
+    return numpy.arange(0, n, LIST_LENGTH)
+
+
+def stops(n):
+    return numpy.arange(LIST_LENGTH, n + 1, LIST_LENGTH)
+
+
+def parents(n):
+    return numpy.arange(n) // LIST_LENGTH
+
+
+def index(n):
+    return numpy.arange(n)
+
+
+def local_index(n):
+    return numpy.arange(n) % LIST_LENGTH
+
+
+def zeros(n):
+    return numpy.zeros(n, numpy.int64)
+
+
+def counts(n):
+    return numpy.full(n // LIST_LENGTH, LIST_LENGTH)
+
+
+def values(n, dtype):
+    rng = numpy.random.default_rng(12345)
+    if dtype.kind == "b":
+        return rng.random(n) < 0.5
+    elif dtype.kind == "f":
+        return rng.normal(0, 1, n)
+    else:
+        # small enough for any integer type and valid as an index
+        return rng.integers(0, min(n, 100), n)
+
+
+# arrays by role (with the group's number removed, as in "ListArray2-starts")
+array_roles = {
+    "BitMaskedArray-mask": lambda n: numpy.zeros(n // 8, numpy.uint8),
+    "ByteMaskedArray-mask": zeros,
+    "Identities-array": index,
+    "IndexedArray-index": index,
+    "ListArray-starts": starts,
+    "ListArray-stops": stops,
+    "ListOffsetArray-offsets": offsets,
+    "UnionArray-index": index,
+    "UnionArray-tags": zeros,
+    "rangesr-index": index,
+    "reducer-distincts": index,
+    "reducer-gaps": zeros,
+    "reducer-index": index,
+    "reducer-mask": zeros,
+    "reducer-nextcarry": index,
+    "reducer-nextparents": parents,
+    "reducer-nextshifts": zeros,
+    "reducer-offsets": offsets,
+    "reducer-parents": parents,
+    "reducer-shifts": zeros,
+    "reducer-starts": starts,
+}
+
+# scalars by role, as functions of n and the number of lists, m
+scalar_roles = {
+    "ByteMaskedArray-length": lambda n, m: n,
+    "IndexedArray-length": lambda n, m: n,
+    "ListArray-at": lambda n, m: 0,
+    "ListArray-length": lambda n, m: m,
+    "ListOffsetArray-length": lambda n, m: m,
+    "NumpyArray-length": lambda n, m: n,
+    "RegularArray-size": lambda n, m: LIST_LENGTH,
+    "UnionArray-length": lambda n, m: 1,
+    "reducer-identity": lambda n, m: 0,
+    "reducer-length": lambda n, m: n,
+    "reducer-lendistincts": lambda n, m: n,
+    "reducer-lenparents": lambda n, m: n,
+    "reducer-maxcount": lambda n, m: LIST_LENGTH,
+    "reducer-nextlen": lambda n, m: n,
+    "reducer-outindexlength": lambda n, m: n,
+    "reducer-outlength": lambda n, m: m,
+    "reducer-startslength": lambda n, m: m,
+}
+
+# lengths of buffers that are indexed by other arguments: the whole capacity
+content_lengths = ("lencontent", "contentlen", "lenindex", "lenfromindex")
+
+# arrays without a role, by a substring of their name
+array_names = [
+    ("offsets", offsets),
+    ("starts", starts),
+    ("stops", stops),
+    ("parents", parents),
+    ("index", index),
+    ("carry", index),
+    ("mask", zeros),
+    ("counts", counts),
+    ("lens", counts),
+]
+
+
+# arguments whose role in the specification (chosen to pair up test data)
+# does not describe the synthesized array, by kernel and name: scalars as
+# functions of n and m, arrays as functions of n
+overrides = {
+    ("awkward_Identities_from_ListArray", "tolength"): lambda n, m: n,
+    ("awkward_Identities_from_ListArray", "fromlength"): lambda n, m: m,
+    ("awkward_Identities_from_ListOffsetArray", "tolength"): lambda n, m: n,
+    ("awkward_Identities_from_ListOffsetArray", "fromlength"): lambda n, m: m,
+    ("awkward_Identities_from_RegularArray", "tolength"): lambda n, m: n,
+    ("awkward_Identities_from_RegularArray", "fromlength"): lambda n, m: m,
+    ("awkward_Identities_getitem_carry", "carryptr"): index,
+    ("awkward_IndexedArray_flatten_none2empty", "outindexlength"): lambda n, m: m,
+    ("awkward_ListArray_getitem_carry", "fromcarry"): parents,
+    ("awkward_ListArray_getitem_jagged_apply", "sliceindex"): local_index,
+    ("awkward_ListArray_getitem_jagged_expand", "jaggedsize"): (
+        lambda n, m: LIST_LENGTH
+    ),
+    ("awkward_ListArray_getitem_jagged_expand", "length"): lambda n, m: m,
+    ("awkward_ListArray_getitem_next_array", "fromarray"): local_index,
+    ("awkward_ListArray_getitem_next_array", "lenarray"): lambda n, m: LIST_LENGTH,
+    ("awkward_ListArray_getitem_next_array_advanced", "fromarray"): local_index,
+    ("awkward_ListArray_getitem_next_array_advanced", "fromadvanced"): index,
+    ("awkward_ListOffsetArray_reduce_nonlocal_outstartsstops_64", "distincts"): (
+        local_index
+    ),
+    ("awkward_ListOffsetArray_reduce_nonlocal_outstartsstops_64", "gaps"): (
+        lambda n: numpy.ones(n, numpy.int64)
+    ),
+    ("awkward_ListOffsetArray_reduce_nonlocal_preparenext_64", "length"): (
+        lambda n, m: m
+    ),
+    ("awkward_NumpyArray_getitem_next_array", "lenflathead"): (
+        lambda n, m: LIST_LENGTH
+    ),
+    ("awkward_NumpyArray_getitem_next_range", "lenhead"): lambda n, m: LIST_LENGTH,
+    ("awkward_NumpyArray_getitem_next_range_advanced", "lenhead"): (
+        lambda n, m: LIST_LENGTH
+    ),
+    ("awkward_NumpyArray_rearrange_shifted", "fromshifts"): zeros,
+    ("awkward_NumpyArray_rearrange_shifted", "fromoffsets"): offsets,
+    ("awkward_NumpyArray_rearrange_shifted", "fromparents"): parents,
+    ("awkward_NumpyArray_rearrange_shifted", "fromstarts"): starts,
+    ("awkward_NumpyArray_subrange_equal", "length"): lambda n, m: m,
+    ("awkward_RegularArray_getitem_next_array", "fromarray"): local_index,
+    ("awkward_RegularArray_getitem_next_array", "length"): lambda n, m: m,
+    ("awkward_RegularArray_getitem_next_array", "lenarray"): lambda n, m: LIST_LENGTH,
+    ("awkward_RegularArray_getitem_next_array_advanced", "fromarray"): local_index,
+    ("awkward_RegularArray_getitem_next_array_regularize", "fromarray"): local_index,
+    ("awkward_UnionArray_validity", "lencontents"): lambda n: numpy.array([n]),
+}
+
+# inputs that the kernel modifies and needs to be reset before every call
+consumed = {
+    ("awkward_ListOffsetArray_reduce_nonlocal_preparenext_64", "offsetscopy"),
+}
+
+
+def role_of(arg):
+    group, _, rest = arg.role.partition("-")
+    return group.rstrip("0123456789") + "-" + rest
+
+
+def scalar(kernel, arg, n):
+    m = n // LIST_LENGTH
+    role = role_of(arg)
+    if (kernel, arg.name) in overrides:
+        return overrides[kernel, arg.name](n, m)
+    elif arg.name in content_lengths:
+        return CAPACITY * n + CAPACITY
+    elif role in scalar_roles:
+        return scalar_roles[role](n, m)
+    elif arg.dtype.kind == "b":
+        return role == "ListArray-replacement"
+    elif arg.dtype.kind == "f":
+        return 1.0
+    elif role.endswith("-offset"):
+        return 0
+
+    name = arg.name
+    if "offsetslen" in name:
+        return m + 1
+    elif "starts" in name or "stops" in name or name.startswith("outer"):
+        return m
+    elif name in ("size", "width", "fromwidth", "regularsize", "nextsize", "maxcount"):
+        return LIST_LENGTH
+    elif name in ("step", "stride", "ndim", "repetitions"):
+        return 1
+    elif name == "maxlevels":
+        # depth of the quicksort kernels' stack
+        return awkward._util.kMaxLevels
+    elif "len" in name or name in ("n", "stop"):
+        return n
+    else:
+        return 0
+
+
+def array(kernel, arg, n):
+    role = role_of(arg)
+    if arg.direction == "out":
+        out = numpy.zeros(0, arg.dtype)
+    elif (kernel, arg.name) in overrides:
+        out = overrides[kernel, arg.name](n)
+    elif role in array_roles:
+        out = array_roles[role](n)
+    elif role.startswith(("NumpyArray-", "reducer-")):
+        out = values(n, arg.dtype)
+    else:
+        for substring, generate in array_names:
+            if substring in arg.name:
+                out = generate(n)
+                break
+        else:
+            out = values(n, arg.dtype)
+    out = out.astype(arg.dtype)
+    logical = out.nbytes if arg.direction == "in" else n * arg.dtype.itemsize
+
+    capacity = CAPACITY * n + CAPACITY
+    if len(out) == 0:
+        out = numpy.zeros(capacity, arg.dtype)
+    else:
+        out = numpy.pad(out, (0, capacity - len(out)), mode="edge")
+    return out, logical
+
+
+def benchmark(spec, n, min_time):
+    result = {"kernel": spec.kernel, "specialization": spec.name, "size": n}
+
+    if any(arg.is_pointer_to_pointer for arg in spec.args):
+        result["status"] = "skipped"
+        result["message"] = "pointer-to-pointer arguments are not synthesized"
+        return result
+    signature = (spec.kernel,) + tuple(
+        arg.dtype.type for arg in spec.args if arg.is_list
+    )
+    try:
+        function = awkward._cpu_kernels.kernel[signature]
+    except (KeyError, AttributeError):
+        function = None
+    if function is None:
+        result["status"] = "skipped"
+        result["message"] = "not in the CPU kernels library"
+        return result
+
+    args = []
+    nbytes = 0
+    buffers = []
+    originals = []
+    for arg, argtype in zip(spec.args, function.argtypes):
+        if arg.is_list:
+            buffer, logical = array(spec.kernel, arg, n)
+            buffers.append(buffer)
+            args.append(buffer.ctypes.data_as(argtype))
+            nbytes += logical
+            if (spec.kernel, arg.name) in consumed:
+                prefix = buffer[: logical // buffer.itemsize]
+                originals.append((prefix, prefix.copy()))
+        else:
+            args.append(scalar(spec.kernel, arg, n))
+
+    def call():
+        for buffer, original in originals:
+            numpy.copyto(buffer, original)
+        return function(*args)
+
+    error = call()
+    if error.str is not None:
+        result["status"] = "error"
+        result["message"] = error.str.decode(errors="surrogateescape")
+        return result
+
+    # call the kernel in batches of doubling size until one takes min_time,
+    # then keep the best time per call of three such batches
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(2):
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        best = min(best, (time.perf_counter() - start) / number)
+
+    result["status"] = "ok"
+    result["time"] = best
+    result["bytes"] = nbytes
+    result["elements_per_second"] = n / best
+    result["bytes_per_second"] = nbytes / best
+    return result
+
+
+def _run_in_child(connection, spec, n, min_time):
+    connection.send(benchmark(spec, n, min_time))
+    connection.close()
+
+
+def isolated_benchmark(context, spec, n, min_time, timeout):
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_run_in_child, args=(sender, spec, n, min_time), daemon=True
+    )
+    process.start()
+    sender.close()
+    if receiver.poll(timeout):
+        try:
+            result = receiver.recv()
+        except EOFError:
+            result = None
+    else:
+        result = {"status": "timeout"}
+    process.join(1)
+    if process.is_alive():
+        process.kill()
+        process.join()
+    if result is None:
+        result = {"status": "crashed", "exitcode": process.exitcode}
+    if "kernel" not in result:
+        result = dict(
+            {"kernel": spec.kernel, "specialization": spec.name, "size": n}, **result
+        )
+    return result
+
+
+def summarize(results, count):
+    ok = [x for x in results if x["status"] == "ok"]
+    largest = max((x["size"] for x in ok), default=None)
+    slowest = sorted(
+        (x for x in ok if x["size"] == largest),
+        key=lambda x: x["elements_per_second"],
+    )[:count]
+    print(f"\nslowest kernels at size {largest}:")
+    print(f"{'specialization':<64} {'elements/s':>12} {'bytes/s':>12}")
+    for x in slowest:
+        print(
+            "{:<64} {:>12.3g} {:>12.3g}".format(
+                x["specialization"], x["elements_per_second"], x["bytes_per_second"]
+            )
+        )
+    statuses = {}
+    for x in results:
+        statuses[x["status"]] = statuses.get(x["status"], 0) + 1
+    print("\n" + ", ".join(f"{v} {k}" for k, v in sorted(statuses.items())))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark every CPU kernel in kernel-specification.yml"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 100000],
+        help="numbers of elements to synthesize for each kernel (at least 16)",
+    )
+    parser.add_argument(
+        "--kernel",
+        default=None,
+        help="only benchmark kernels or specializations that match this regex",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.01,
+        help="minimum time in seconds of each batch of calls",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60,
+        help="seconds after which a kernel is stopped and reported as a timeout",
+    )
+    parser.add_argument(
+        "--output", default="kernel-benchmarks.json", help="JSON report to write"
+    )
+    parser.add_argument(
+        "--no-isolation",
+        action="store_true",
+        help="run the kernels in this process (a crash ends the run)",
+    )
+    args = parser.parse_args()
+    if min(args.sizes) < CAPACITY:
+        parser.error(f"sizes must be at least {CAPACITY}")
+
+    if args.no_isolation or "fork" not in multiprocessing.get_all_start_methods():
+        context = None
+    else:
+        context = multiprocessing.get_context("fork")
+
+    specs = readspec(args.kernel)
+    results = []
+    for spec in specs:
+        for n in args.sizes:
+            if context is None:
+                result = benchmark(spec, n, args.min_time)
+            else:
+                result = isolated_benchmark(
+                    context, spec, n, args.min_time, args.timeout
+                )
+            results.append(result)
+            if result["status"] == "ok":
+                print(
+                    "{:<64} {:>10} {:>12.3g} elements/s".format(
+                        spec.name, n, result["elements_per_second"]
+                    )
+                )
+            else:
+                print("{:<64} {:>10} {}".format(spec.name, n, result["status"]))
+
+    with open(args.output, "w") as file:
+        json.dump(
+            {
+                "awkward": awkward.__version__,
+                "numpy": numpy.__version__,
+                "machine": platform.machine(),
+                "processor": platform.processor(),
+                "python": platform.python_version(),
+                "list_length": LIST_LENGTH,
+                "sizes": args.sizes,
+                "results": results,
+            },
+            file,
+            indent=1,
+        )
+    summarize(results, 20)
+    print(f"\nwrote {args.output}")
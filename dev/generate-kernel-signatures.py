@@ -223,6 +223,8 @@ def kernel_signatures_py(specification):
 
 # fmt: off
 
+from collections.abc import Mapping
+
 from ctypes import (
     POINTER,
     Structure,
@@ -266,8 +268,38 @@ class ERROR(Structure):
     ]
 
 
+# Maps (kernel name, *types) to functions in lib, looking up each symbol and
+# setting its argtypes only when it is first requested, so that importing
+# awkward does not bind every kernel.
+class Kernels(Mapping):
+
+    def __init__(self, lib):
+        self._lib = lib
+        self._bound = {{}}
+
+    def __getitem__(self, signature):
+        f = self._bound.get(signature)
+        if f is None:
+            name, argtypes, dir = signatures[signature]
+            f = getattr(self._lib, name)
+            f.argtypes = argtypes
+            f.restype = ERROR
+            f.dir = dir
+            self._bound[signature] = f
+        return f
+
+    def __iter__(self):
+        return iter(signatures)
+
+    def __len__(self):
+        return len(signatures)
+
+
 def by_signature(lib):
-    out = {{}}
+    return Kernels(lib)
+
+
+signatures = {{}}
 """.format(
                 reproducible_datetime()
             )
@@ -282,25 +314,19 @@ def by_signature(lib):
                 dirlist = [repr(x["dir"]) for x in childfunc["args"]]
                 file.write(
                     """
-    f = lib.{}
-    f.argtypes = [{}]
-    f.restype = ERROR
-    f.dir = [{}]
-    out[{}] = f
+signatures[{}] = (
+    {!r},
+    [{}],
+    [{}],
+)
 """.format(
+                        ", ".join(special),
                         str(childfunc["name"]),
                         ", ".join(arglist),
                         ", ".join(dirlist),
-                        ", ".join(special),
                     )
                 )
 
-        file.write(
-            """
-    return out
-"""
-        )
-
     print("Done with  src/awkward/_kernel_signatures.py...")
 
 
@@ -45,6 +45,20 @@ def coverage(session):
     )
 
 
+@nox.session
+def benchmarks(session):
+    """
+    Compare the benchmarks of HEAD with main. Pass other asv arguments to run those instead.
+    """
+    session.install("asv", "virtualenv")
+    session.run(
+        "asv",
+        *session.posargs
+        if session.posargs
+        else ["continuous", "-f", "1.1", "main", "HEAD"],
+    )
+
+
 @nox.session
 def docs(session):
     """
@@ -2,6 +2,8 @@
 
 # v2: keep this file, but modify it to only get objects that exist!
 
+import importlib
+
 # NumPy-like alternatives
 import awkward.nplike
 
@@ -12,17 +14,12 @@ import awkward.forms
 import awkward.partition
 
 # internal
-import awkward._v2
 import awkward._cpu_kernels
 import awkward._libawkward
 import awkward._util
 
-# third-party connectors
+# third-party connectors (the rest are imported on first use by __getattr__)
 import awkward._connect._numpy
-import awkward._connect._numba
-import awkward._connect._numexpr
-import awkward._connect._autograd
-import awkward.numba
 
 # high-level interface
 behavior = {}
@@ -30,9 +27,6 @@ from awkward.highlevel import Array
 from awkward.highlevel import Record
 from awkward.highlevel import ArrayBuilder
 
-# third-party jax connectors
-import awkward._connect._jax
-
 # behaviors
 from awkward.behaviors.mixins import *
 from awkward.behaviors.string import *
@@ -50,7 +44,28 @@ __version__ = awkward._ext.__version__
 # call C++ startup function
 awkward._ext.startup()
 
-__all__ = [x for x in list(globals()) if not x.startswith("_") and x not in ("numpy",)]
+# modules that are imported when they are first accessed, to keep
+# "import awkward" fast: each of them sets the attribute when imported
+_lazy_modules = {
+    "_v2": "awkward._v2",
+    "numba": "awkward.numba",
+    "numexpr": "awkward._connect._numexpr",
+    "autograd": "awkward._connect._autograd",
+    "jax": "awkward._connect._jax",
+}
+
+__all__ = [
+    x
+    for x in list(globals())
+    if not x.startswith("_") and x not in ("numpy", "importlib")
+] + [x for x in _lazy_modules if not x.startswith("_")]
+
+
+def __getattr__(name):
+    if name in _lazy_modules:
+        importlib.import_module(_lazy_modules[name])
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def __dir__():
@@ -1,3 +1,14 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
 # v2: replace with src/awkward/_v2/_connect directory.
+
+import importlib
+
+# connectors to optional dependencies, imported when they are first accessed
+_lazy_modules = ("_numba", "_numexpr", "_autograd", "_jax")
+
+
+def __getattr__(name):
+    if name in _lazy_modules:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,8 +3,8 @@
 # v2: no change; keep this file.
 
 import ctypes
+import os
 import platform
-import pkg_resources
 
 import awkward._kernel_signatures
 
@@ -14,7 +14,7 @@ elif platform.system() == "Darwin":
     name = "libawkward-cpu-kernels.dylib"
 else:
     name = "libawkward-cpu-kernels.so"
-libpath = pkg_resources.resource_filename("awkward", name)
+libpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
 
 lib = ctypes.cdll.LoadLibrary(libpath)
 kernel = awkward._kernel_signatures.by_signature(lib)
@@ -3,8 +3,8 @@
 # v2: no change; keep this file.
 
 import ctypes
+import os
 import platform
-import pkg_resources
 
 if platform.system() == "Windows":
     name = "awkward.dll"
@@ -12,7 +12,7 @@ elif platform.system() == "Darwin":
     name = "libawkward.dylib"
 else:
     name = "libawkward.so"
-libpath = pkg_resources.resource_filename("awkward", name)
+libpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
 
 lib = ctypes.cdll.LoadLibrary(libpath)
 
@@ -10,6 +10,8 @@ import awkward._v2.forms
 import awkward._v2._slicing
 import awkward._v2._broadcasting
 import awkward._v2._typetracer
+import awkward._v2._virtual
+import awkward._v2._typedbuilder
 
 # internal
 import awkward._v2._util
@@ -25,6 +27,12 @@ from awkward._v2.highlevel import Array
 from awkward._v2.highlevel import Record
 from awkward._v2.highlevel import ArrayBuilder
 
+# profiling
+from awkward._v2._profile import profile
+
+# deferred evaluation
+from awkward._v2._lazy import lazy
+
 # behaviors
 import awkward._v2.behaviors.categorical
 import awkward._v2.behaviors.mixins
@@ -0,0 +1,502 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import bz2
+import json
+import lzma
+import zlib
+
+import numpy
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+_magic = b"Obj\x01"
+_sync_size = 16
+
+
+def import_snappy(name):
+    try:
+        import snappy
+
+    except ModuleNotFoundError:
+        raise ImportError(
+            f"""to use {name} on Avro files with the "snappy" codec, you must install python-snappy:
+
+    pip install python-snappy
+
+or
+
+    conda install -c conda-forge python-snappy
+"""
+        )
+
+    return snappy
+
+
+def import_zstandard(name):
+    try:
+        import zstandard
+
+    except ModuleNotFoundError:
+        raise ImportError(
+            f"""to use {name} on Avro files with the "zstandard" codec, you must install zstandard:
+
+    pip install zstandard
+
+or
+
+    conda install -c conda-forge zstandard
+"""
+        )
+
+    return zstandard
+
+
+def _read_long(data, pos):
+    # Avro "int" and "long" are zigzag-encoded varints
+    shift = 0
+    result = 0
+    while True:
+        byte = int(data[pos])
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+    return (result >> 1) ^ -(result & 1), pos
+
+
+def _read_bytes(data, pos):
+    size, pos = _read_long(data, pos)
+    return bytes(data[pos : pos + size]), pos + size
+
+
+def read_header(data):
+    """
+    Returns the schema (as JSON), codec name, sync marker, and position of
+    the first block of the Avro object container file in `data`.
+    """
+    if len(data) < len(_magic) or bytes(data[: len(_magic)]) != _magic:
+        raise ak._v2._util.error(ValueError("not an Avro object container file"))
+
+    metadata = {}
+    pos = len(_magic)
+    while True:
+        count, pos = _read_long(data, pos)
+        if count == 0:
+            break
+        if count < 0:
+            count = -count
+            _, pos = _read_long(data, pos)
+        for _ in range(count):
+            key, pos = _read_bytes(data, pos)
+            value, pos = _read_bytes(data, pos)
+            metadata[key.decode("utf-8")] = value
+
+    sync = bytes(data[pos : pos + _sync_size])
+    pos += _sync_size
+
+    schema = json.loads(metadata["avro.schema"])
+    codec = metadata.get("avro.codec", b"null").decode("utf-8")
+    if codec not in _decompressors:
+        raise ak._v2._util.error(
+            ValueError(
+                "Avro codec {} is not supported; supported codecs are {}".format(
+                    repr(codec), ", ".join(repr(x) for x in _decompressors)
+                )
+            )
+        )
+
+    return schema, codec, sync, pos
+
+
+def read_blocks(data, pos, sync):
+    """
+    Returns a list of (number of objects, start, stop) for each block, where
+    start and stop are the positions of the block's (possibly compressed) data.
+    """
+    out = []
+    while pos < len(data):
+        num_items, pos = _read_long(data, pos)
+        num_bytes, pos = _read_long(data, pos)
+        out.append((num_items, pos, pos + num_bytes))
+        pos += num_bytes
+        if bytes(data[pos : pos + _sync_size]) != sync:
+            raise ak._v2._util.error(
+                ValueError(
+                    f"Avro sync marker not found after block at byte {out[-1][1]}"
+                )
+            )
+        pos += _sync_size
+    return out
+
+
+def _decompress_snappy(raw):
+    # the last 4 bytes are a CRC32 of the uncompressed data
+    snappy = import_snappy("ak._v2.from_avro")
+    return snappy.decompress(bytes(raw[:-4]))
+
+
+def _decompress_zstandard(raw):
+    zstandard = import_zstandard("ak._v2.from_avro")
+    return zstandard.ZstdDecompressor().decompressobj().decompress(bytes(raw))
+
+
+_decompressors = {
+    "null": lambda raw: raw,
+    "deflate": lambda raw: zlib.decompress(raw, -zlib.MAX_WBITS),
+    "bzip2": bz2.decompress,
+    "xz": lzma.decompress,
+    "snappy": _decompress_snappy,
+    "zstandard": _decompress_zstandard,
+}
+
+
+def decompress(codec, raw):
+    if codec == "null":
+        return raw
+    else:
+        return _decompressors[codec](memoryview(raw))
+
+
+class ForthGenerator:
+    """
+    Translates an Avro schema into an #ak.forms.Form and an AwkwardForth
+    program that decodes a stream of objects with that schema into the Form's
+    buffers. Each buffer is an output named `"{form_key}-{attribute}"`, as in
+    #ak.to_buffers, except for constant buffers (the symbols of enums), which
+    are in `constants`.
+    """
+
+    def __init__(self, schema):
+        self._next_id = 0
+        self._declarations = []
+        self._initializations = []
+        self._names = {}
+        self.constants = {}
+        self.merges = {}
+
+        self.form, code = self._generate(schema, None, 1, ())
+
+        self.source = "\n".join(
+            ["input stream"]
+            + self._declarations
+            + self._initializations
+            + ["0 do"]
+            + code
+            + ["loop"]
+        )
+
+    def _form_key(self):
+        out = f"node{self._next_id}"
+        self._next_id += 1
+        return out
+
+    def _output(self, form_key, attribute, dtype, merge=None):
+        name = f"{form_key}-{attribute}"
+        self._declarations.append(f"output {name} {dtype}")
+        self.merges[name] = merge
+        return name
+
+    def _variable(self, form_key, attribute):
+        name = f"{form_key}-{attribute}"
+        self._declarations.append(f"variable {name}")
+        return name
+
+    def _fullname(self, schema, namespace):
+        name = schema["name"]
+        namespace = schema.get("namespace", namespace)
+        if "." not in name and namespace:
+            return f"{namespace}.{name}", namespace
+        else:
+            return name, name.rpartition(".")[0] or namespace
+
+    def _generate(self, schema, namespace, depth, visiting):
+        ind = "  " * depth
+
+        if isinstance(schema, list):
+            return self._generate_union(schema, namespace, depth, visiting)
+
+        if isinstance(schema, dict):
+            avro_type = schema["type"]
+            if isinstance(avro_type, (dict, list)):
+                return self._generate(avro_type, namespace, depth, visiting)
+        else:
+            avro_type = schema
+
+        if avro_type in _primitives:
+            dtype, word = _primitives[avro_type]
+            form_key = self._form_key()
+            data = self._output(form_key, "data", dtype)
+            form = ak._v2.forms.NumpyForm(
+                ak._v2.types.numpytype.dtype_to_primitive(np.dtype(dtype)),
+                form_key=form_key,
+            )
+            return form, [f"{ind}stream {word} {data}"]
+
+        elif avro_type in ("string", "bytes"):
+            if avro_type == "string":
+                list_parameters, item_parameters = (
+                    {"__array__": "string"},
+                    {"__array__": "char"},
+                )
+            else:
+                list_parameters, item_parameters = (
+                    {"__array__": "bytestring"},
+                    {"__array__": "byte"},
+                )
+            form_key, content_key = self._form_key(), self._form_key()
+            offsets = self._output(form_key, "offsets", "int64", ("offsets",))
+            data = self._output(content_key, "data", "uint8")
+            self._initializations.append(f"0 {offsets} <- stack")
+            form = ak._v2.forms.ListOffsetForm(
+                "i64",
+                ak._v2.forms.NumpyForm(
+                    "uint8", parameters=item_parameters, form_key=content_key
+                ),
+                parameters=list_parameters,
+                form_key=form_key,
+            )
+            return form, [
+                f"{ind}stream zigzag-> stack dup {offsets} +<- stack stream #B-> {data}"
+            ]
+
+        elif avro_type == "null":
+            form_key = self._form_key()
+            index = self._output(form_key, "index", "int64")
+            form = ak._v2.forms.IndexedOptionForm(
+                "i64", ak._v2.forms.EmptyForm(), form_key=form_key
+            )
+            return form, [f"{ind}-1 {index} <- stack"]
+
+        elif isinstance(avro_type, str) and avro_type not in _named_types:
+            # reference to a named type
+            name = avro_type
+            if "." not in name and namespace and f"{namespace}.{name}" in self._names:
+                name = f"{namespace}.{name}"
+            if name in visiting:
+                raise ak._v2._util.error(
+                    NotImplementedError(
+                        f"recursively defined Avro type {name!r} is not supported"
+                    )
+                )
+            if name not in self._names:
+                raise ak._v2._util.error(ValueError(f"unknown Avro type {avro_type!r}"))
+            definition, definition_namespace = self._names[name]
+            return self._generate(definition, definition_namespace, depth, visiting)
+
+        if avro_type in ("record", "enum", "fixed"):
+            fullname, namespace = self._fullname(schema, namespace)
+            self._names[fullname] = (schema, namespace)
+            self._names.setdefault(schema["name"], (schema, namespace))
+            visiting = visiting + (fullname,)
+
+        if avro_type == "record":
+            contents, fields, code = [], [], []
+            for field in schema["fields"]:
+                content, content_code = self._generate(
+                    field["type"], namespace, depth, visiting
+                )
+                contents.append(content)
+                fields.append(field["name"])
+                code.extend(content_code)
+            return ak._v2.forms.RecordForm(contents, fields), code
+
+        elif avro_type == "enum":
+            form_key, offsets_key, data_key = (
+                self._form_key(),
+                self._form_key(),
+                self._form_key(),
+            )
+            index = self._output(form_key, "index", "int64")
+            symbols = [x.encode("utf-8") for x in schema["symbols"]]
+            self.constants[f"{offsets_key}-offsets"] = numpy.cumsum(
+                [0] + [len(x) for x in symbols], dtype=np.int64
+            )
+            self.constants[f"{data_key}-data"] = numpy.frombuffer(
+                b"".join(symbols), dtype=np.uint8
+            )
+            form = ak._v2.forms.IndexedForm(
+                "i64",
+                ak._v2.forms.ListOffsetForm(
+                    "i64",
+                    ak._v2.forms.NumpyForm(
+                        "uint8", parameters={"__array__": "char"}, form_key=data_key
+                    ),
+                    parameters={"__array__": "string"},
+                    form_key=offsets_key,
+                ),
+                parameters={"__array__": "categorical"},
+                form_key=form_key,
+            )
+            return form, [f"{ind}stream zigzag-> {index}"]
+
+        elif avro_type == "fixed":
+            form_key = self._form_key()
+            data = self._output(form_key, "data", "uint8")
+            form = ak._v2.forms.RegularForm(
+                ak._v2.forms.NumpyForm(
+                    "uint8", parameters={"__array__": "byte"}, form_key=form_key
+                ),
+                schema["size"],
+                parameters={"__array__": "bytestring"},
+            )
+            return form, [f"{ind}{schema['size']} stream #B-> {data}"]
+
+        elif avro_type in ("array", "map"):
+            form_key = self._form_key()
+            offsets = self._output(form_key, "offsets", "int64", ("offsets",))
+            self._initializations.append(f"0 {offsets} <- stack")
+
+            if avro_type == "array":
+                content, item_code = self._generate(
+                    schema["items"], namespace, depth + 2, visiting
+                )
+            else:
+                key, key_code = self._generate("string", namespace, depth + 2, visiting)
+                value, value_code = self._generate(
+                    schema["values"], namespace, depth + 2, visiting
+                )
+                content = ak._v2.forms.RecordForm([key, value], ["key", "value"])
+                item_code = key_code + value_code
+
+            # items come in blocks, each preceded by a count; a negative count
+            # is followed by the block's size in bytes, and a zero count ends
+            # the array; the stack holds (total, count)
+            form = ak._v2.forms.ListOffsetForm("i64", content, form_key=form_key)
+            return form, (
+                [
+                    f"{ind}0 begin",
+                    f"{ind}  stream zigzag-> stack dup 0 <> while",
+                    f"{ind}  dup 0 < if negate stream zigzag-> stack drop then",
+                    f"{ind}  dup rot + swap",
+                    f"{ind}  0 do",
+                ]
+                + item_code
+                + [
+                    f"{ind}  loop",
+                    f"{ind}repeat",
+                    f"{ind}drop {offsets} +<- stack",
+                ]
+            )
+
+        else:
+            raise ak._v2._util.error(ValueError(f"unknown Avro type {avro_type!r}"))
+
+    def _generate_union(self, schema, namespace, depth, visiting):
+        ind = "  " * depth
+        branches = [
+            (i, x)
+            for i, x in enumerate(schema)
+            if x != "null" and x != {"type": "null"}
+        ]
+        nullable = len(branches) != len(schema)
+
+        if nullable:
+            option_key = self._form_key()
+            option_count = self._variable(option_key, "count")
+            option_index = self._output(
+                option_key, "index", "int64", ("option", option_count)
+            )
+
+        if len(branches) == 1:
+            inner, branch_code = self._generate(
+                branches[0][1], namespace, depth + 2, visiting
+            )
+            cases = {branches[0][0]: branch_code}
+
+        elif len(branches) > 1:
+            form_key = self._form_key()
+            tags = self._output(form_key, "tags", "int8")
+            index = self._output(form_key, "index", "int64")
+            contents = []
+            cases = {}
+            counts = []
+            for tag, (i, branch) in enumerate(branches):
+                count = self._variable(form_key, f"count{tag}")
+                counts.append(count)
+                content, branch_code = self._generate(
+                    branch, namespace, depth + 2, visiting
+                )
+                contents.append(content)
+                cases[i] = [
+                    f"{ind}    {tag} {tags} <- stack",
+                    f"{ind}    {count} @ {index} <- stack 1 {count} +!",
+                ] + branch_code
+            inner = ak._v2.forms.UnionForm("i8", "i64", contents, form_key=form_key)
+            self.merges[index] = ("union", tags, counts)
+
+        else:
+            inner = ak._v2.forms.EmptyForm()
+            cases = {}
+
+        code = [f"{ind}stream zigzag-> stack", f"{ind}case"]
+        for i in range(len(schema)):
+            code.append(f"{ind}  {i} of")
+            if i in cases:
+                if nullable:
+                    code.append(
+                        f"{ind}    {option_count} @ {option_index} <- stack 1 {option_count} +!"
+                    )
+                code.extend(cases[i])
+            else:
+                code.append(f"{ind}    -1 {option_index} <- stack")
+            code.append(f"{ind}  endof")
+        code.append(f"{ind}endcase")
+
+        if nullable:
+            form = ak._v2.forms.IndexedOptionForm("i64", inner, form_key=option_key)
+        else:
+            form = inner
+
+        return form, code
+
+
+def concatenate_outputs(generator, parts):
+    """
+    Concatenates the outputs of several runs of `generator.source` on
+    consecutive parts of the data, adjusting offsets and indexes, to make the
+    outputs of a single run over all of it. Each part is a pair of dicts:
+    outputs and variables.
+    """
+    out = {}
+    for name, merge in generator.merges.items():
+        arrays = []
+        if merge is None:
+            arrays = [outputs[name] for outputs, _ in parts]
+
+        elif merge[0] == "offsets":
+            shift = 0
+            for i, (outputs, _) in enumerate(parts):
+                offsets = outputs[name]
+                arrays.append(offsets + shift if i == 0 else offsets[1:] + shift)
+                shift += offsets[-1]
+
+        elif merge[0] == "option":
+            shift = 0
+            for outputs, variables in parts:
+                index = outputs[name]
+                arrays.append(numpy.where(index >= 0, index + shift, index))
+                shift += variables[merge[1]]
+
+        elif merge[0] == "union":
+            shifts = numpy.zeros(len(merge[2]), dtype=np.int64)
+            for outputs, variables in parts:
+                arrays.append(outputs[name] + shifts[outputs[merge[1]]])
+                shifts += [variables[x] for x in merge[2]]
+
+        out[name] = numpy.concatenate(arrays)
+
+    return out
+
+
+_primitives = {
+    "boolean": ("bool", "?->"),
+    "int": ("int32", "zigzag->"),
+    "long": ("int64", "zigzag->"),
+    "float": ("float32", "f->"),
+    "double": ("float64", "d->"),
+}
+
+_named_types = ("record", "enum", "fixed", "array", "map")
@@ -1,5 +1,10 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import concurrent.futures
+import contextlib
+import os
+import threading
+
 import numpy
 
 import awkward as ak
@@ -12,6 +17,120 @@ from awkward._v2.contents.numpyarray import NumpyArray
 if not numpy_at_least("1.13.1"):
     raise ImportError("NumPy 1.13.1 or later required")
 
+# Number of threads that elementwise ufuncs on large leaf buffers are split
+# across when no threads context is active; None means os.cpu_count().
+num_threads = 1
+
+# Buffers with fewer items than this per thread are not worth splitting.
+_min_length_per_thread = 1 << 16
+
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def threads(n):
+    """
+    Args:
+        n (None or int): Number of threads; if None, the module-level
+            `num_threads` is used.
+
+    Context manager that sets the number of threads used by the NumPy ufuncs
+    that are applied to Awkward Arrays in this thread, such as
+
+        >>> with ak._v2._connect.numpy.threads(8):
+        ...     result = np.sqrt(array.x**2 + array.y**2)
+
+    Each ufunc is still applied to one leaf buffer at a time (after
+    broadcasting), but buffers that are long enough are split into chunks
+    that are computed in a thread pool. NumPy releases the GIL in its ufunc
+    loops, so this scales with the number of cores for numeric types.
+    """
+    if n is not None and (
+        not isinstance(n, (int, numpy.integer))
+        or isinstance(n, (bool, numpy.bool_))
+        or n < 1
+    ):
+        raise ak._v2._util.error(
+            TypeError(f"num_threads must be None or a positive integer, not {n!r}")
+        )
+    previous = getattr(_local, "num_threads", None)
+    _local.num_threads = n
+    try:
+        yield
+    finally:
+        _local.num_threads = previous
+
+
+def _current_num_threads():
+    n = getattr(_local, "num_threads", None)
+    if n is None:
+        n = num_threads
+    if n is None:
+        n = os.cpu_count() or 1
+    return n
+
+
+def _ufunc_chunks(ufunc, args, kwargs, nplike):
+    # Returns (start, stop) ranges of the first axis that the ufunc can be
+    # applied to independently, or None to apply it to the whole buffers.
+    if (
+        not isinstance(nplike, ak.nplike.Numpy)
+        or not isinstance(ufunc, numpy.ufunc)
+        or ufunc.signature is not None
+        or len(kwargs) != 0
+    ):
+        return None
+
+    length = None
+    for x in args:
+        if isinstance(x, numpy.ndarray) and x.ndim != 0:
+            if x.dtype.kind == "O" or (length is not None and len(x) != length):
+                return None
+            length = len(x)
+    if length is None:
+        return None
+
+    n = min(_current_num_threads(), length // _min_length_per_thread)
+    if n <= 1:
+        return None
+    cuts = [i * length // n for i in range(n + 1)]
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+def _apply_ufunc(ufunc, method, args, kwargs, nplike):
+    chunks = _ufunc_chunks(ufunc, args, kwargs, nplike)
+    if chunks is None:
+        return getattr(ufunc, method)(*args, **kwargs)
+
+    def sliced(start, stop):
+        return [
+            x[start:stop] if isinstance(x, numpy.ndarray) and x.ndim != 0 else x
+            for x in args
+        ]
+
+    # the output types are the same for any number of items, including zero
+    empty = ufunc(*sliced(0, 0))
+    if ufunc.nout == 1:
+        empty = (empty,)
+    length = chunks[-1][1]
+    outs = tuple(numpy.empty((length,) + x.shape[1:], x.dtype) for x in empty)
+
+    # error states and contexts are thread-local, so carry the caller's
+    errstate = numpy.geterr()
+    context = ak._v2._util.ErrorContext.primary()
+
+    def run(chunk):
+        start, stop = chunk
+        with contextlib.nullcontext() if context is None else context:
+            with numpy.errstate(**errstate):
+                ufunc(*sliced(start, stop), out=tuple(x[start:stop] for x in outs))
+
+    with concurrent.futures.ThreadPoolExecutor(len(chunks)) as executor:
+        for _ in executor.map(run, chunks):
+            pass
+
+    return outs[0] if ufunc.nout == 1 else outs
+
 
 def convert_to_array(layout, args, kwargs):
     out = ak._v2.operations.to_numpy(layout, allow_missing=False)
@@ -159,6 +278,10 @@ def array_ufunc(ufunc, method, inputs, kwargs):
     if method != "__call__" or len(inputs) == 0 or "out" in kwargs:
         return NotImplemented
 
+    # let LazyArray.__array_ufunc__ record the call instead
+    if any(isinstance(x, ak._v2._lazy.LazyArray) for x in inputs):
+        return NotImplemented
+
     behavior = ak._v2._util.behavior_of(*inputs)
 
     inputs = _array_ufunc_custom_cast(inputs, behavior)
@@ -197,7 +320,7 @@ def array_ufunc(ufunc, method, inputs, kwargs):
                     jax = import_jax()
                     result = getattr(jax.numpy, ufunc.__name__)(*args, **kwargs)
                 else:
-                    result = getattr(ufunc, method)(*args, **kwargs)
+                    result = _apply_ufunc(ufunc, method, args, kwargs, nplike)
 
             else:
                 shape = None
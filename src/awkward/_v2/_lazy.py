@@ -0,0 +1,395 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numbers
+
+import numpy
+
+import awkward as ak
+from awkward._v2._connect.numpy import NDArrayOperatorsMixin
+
+np = ak.nplike.NumpyMetadata.instance()
+
+# number of items (along the first dimension) evaluated at a time by the
+# NumPy engine; every intermediate result is at most this long
+_block_length = 1 << 14
+
+_numexpr_operators = {
+    "add": "+",
+    "subtract": "-",
+    "multiply": "*",
+    "true_divide": "/",
+    "power": "**",
+    "less": "<",
+    "less_equal": "<=",
+    "greater": ">",
+    "greater_equal": ">=",
+    "equal": "==",
+    "not_equal": "!=",
+    "logical_and": "&",
+    "logical_or": "|",
+}
+
+_numexpr_unary_operators = {
+    "negative": "-",
+    "logical_not": "~",
+}
+
+_numexpr_functions = {
+    "sqrt": "sqrt",
+    "sin": "sin",
+    "cos": "cos",
+    "tan": "tan",
+    "arcsin": "arcsin",
+    "arccos": "arccos",
+    "arctan": "arctan",
+    "arctan2": "arctan2",
+    "sinh": "sinh",
+    "cosh": "cosh",
+    "tanh": "tanh",
+    "arcsinh": "arcsinh",
+    "arccosh": "arccosh",
+    "arctanh": "arctanh",
+    "exp": "exp",
+    "expm1": "expm1",
+    "log": "log",
+    "log10": "log10",
+    "log1p": "log1p",
+    "absolute": "abs",
+    "conjugate": "conj",
+}
+
+
+class _Unfusable(Exception):
+    pass
+
+
+class _Leaf:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _Call:
+    __slots__ = ("ufunc", "args")
+
+    def __init__(self, ufunc, args):
+        self.ufunc = ufunc
+        self.args = args
+
+
+def _leaves(node, out):
+    if isinstance(node, _Leaf):
+        if all(x is not node.value for x in out):
+            out.append(node.value)
+    else:
+        for arg in node.args:
+            _leaves(arg, out)
+    return out
+
+
+def _isunary(node):
+    # True if no ufunc in the chain combines two arrays, so that records can
+    # be descended into, as they are by unary ufuncs applied eagerly
+    if isinstance(node, _Leaf):
+        return True
+    elif sum(1 for x in node.args if not _isleaf_scalar(x)) > 1:
+        return False
+    else:
+        return all(_isunary(x) for x in node.args)
+
+
+def _isleaf_scalar(node):
+    return isinstance(node, _Leaf) and _isscalar(node.value)
+
+
+def _isscalar(value):
+    return isinstance(value, (numbers.Number, np.number, np.bool_))
+
+
+def _evaluate(node, lookup, memo):
+    if isinstance(node, _Leaf):
+        return lookup(node.value)
+    elif id(node) in memo:
+        return memo[id(node)]
+    else:
+        out = node.ufunc(*[_evaluate(x, lookup, memo) for x in node.args])
+        memo[id(node)] = out
+        return out
+
+
+def _expression(node, names):
+    if isinstance(node, _Leaf):
+        return names[id(node.value)]
+
+    name = node.ufunc.__name__
+    args = [_expression(x, names) for x in node.args]
+    if name in _numexpr_operators and len(args) == 2:
+        return f"({args[0]} {_numexpr_operators[name]} {args[1]})"
+    elif name in _numexpr_unary_operators and len(args) == 1:
+        return f"({_numexpr_unary_operators[name]}{args[0]})"
+    elif name in _numexpr_functions:
+        return "{}({})".format(_numexpr_functions[name], ", ".join(args))
+    else:
+        raise ak._v2._util.error(
+            ValueError(f"numexpr has no equivalent of {name}; use engine='numpy'")
+        )
+
+
+def _numpy_engine(nplike, node, lookup, raw, probe):
+    lengths = {len(x) if len(x.shape) != 0 else None for x in raw.values()}
+    if len(lengths) != 1 or None in lengths or not isinstance(node, _Call):
+        return _evaluate(node, lookup, {})
+    (length,) = lengths
+
+    out = nplike.empty((length,) + probe.shape[1:], probe.dtype)
+    for start in range(0, length, _block_length):
+        stop = min(start + _block_length, length)
+
+        def block(value):
+            x = lookup(value)
+            return x[start:stop] if id(value) in raw else x
+
+        memo = {}
+        node.ufunc(*[_evaluate(x, block, memo) for x in node.args], out=out[start:stop])
+    return out
+
+
+def _numexpr_engine(node, lookup, raw, constants, probe):
+    numexpr = ak._v2._connect.numexpr.import_numexpr()
+
+    names, local_dict = {}, {}
+    for i, key in enumerate(raw):
+        names[key] = f"x{i}"
+        local_dict[f"x{i}"] = raw[key]
+    for i, key in enumerate(constants):
+        names[key] = f"c{i}"
+        local_dict[f"c{i}"] = constants[key]
+
+    expression = _expression(node, names)
+    out = numexpr.evaluate(expression, local_dict=local_dict, global_dict={})
+    return numpy.asarray(out).astype(probe.dtype, copy=False)
+
+
+class LazyArray(NDArrayOperatorsMixin):
+    """
+    Deferred chain of ufuncs over Awkward Arrays, made by #ak._v2.lazy.
+
+    NumPy ufuncs and operators applied to a LazyArray are recorded, rather
+    than evaluated, and return a new LazyArray. Nothing is computed until
+    #compute is called.
+    """
+
+    def __init__(self, node):
+        self._node = node
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if (
+            method != "__call__"
+            or len(kwargs) != 0
+            or ufunc.nout != 1
+            or ufunc.signature is not None
+        ):
+            return NotImplemented
+
+        args = []
+        for x in inputs:
+            if isinstance(x, LazyArray):
+                args.append(x._node)
+            else:
+                args.append(_Leaf(x))
+        return LazyArray(_Call(ufunc, tuple(args)))
+
+    def __repr__(self):
+        names = {}
+        for x in _leaves(self._node, []):
+            if _isscalar(x):
+                names[id(x)] = str(x)
+            else:
+                names[id(x)] = "x{}".format(
+                    sum(1 for y in names.values() if y.startswith("x"))
+                )
+
+        def show(node):
+            if isinstance(node, _Leaf):
+                return names[id(node.value)]
+            else:
+                return "{}({})".format(
+                    node.ufunc.__name__, ", ".join(show(x) for x in node.args)
+                )
+
+        return f"<LazyArray {show(self._node)}>"
+
+    def compute(self, engine="numpy"):
+        """
+        Args:
+            engine (str): `"numpy"` evaluates the whole chain of ufuncs on
+                blocks of each buffer in turn, so that intermediate results
+                are at most a block long; `"numexpr"` passes the chain to
+                numexpr as a single expression (numexpr must be installed and
+                every ufunc must have a numexpr equivalent).
+
+        Broadcasts all of the arrays in the chain against each other once and
+        evaluates the ufuncs on the numerical buffers in a single pass, without
+        building an Awkward Array for any intermediate result. Returns an
+        #ak.Array that is equal to the result of applying the ufuncs eagerly.
+
+        If any of the arrays has records or a custom behavior (such as
+        strings) in its structure, the chain is instead applied eagerly,
+        one ufunc at a time.
+        """
+        if engine not in ("numpy", "numexpr"):
+            raise ak._v2._util.error(
+                ValueError(f"engine must be 'numpy' or 'numexpr', not {engine!r}")
+            )
+
+        values = _leaves(self._node, [])
+        behavior = ak._v2._util.behavior_of(*values)
+
+        try:
+            with ak._v2._util.OperationErrorContext(
+                "ak._v2.LazyArray.compute", {"engine": engine}
+            ):
+                out = self._fused(values, behavior, engine)
+        except _Unfusable:
+            return self._eager(values, behavior)
+        return ak._v2._util.wrap(out, behavior)
+
+    def _eager(self, values, behavior):
+        arrays = {}
+        for x in values:
+            if isinstance(x, (ak._v2.contents.Content, ak._v2.record.Record)):
+                arrays[id(x)] = ak._v2._util.wrap(x, behavior)
+            else:
+                arrays[id(x)] = x
+
+        out = _evaluate(self._node, lambda x: arrays[id(x)], {})
+        if isinstance(out, (ak._v2.contents.Content, ak._v2.record.Record)):
+            out = ak._v2._util.wrap(out, behavior)
+        return out
+
+    def _fused(self, values, behavior, engine):
+        keys, layouts, constants = [], [], {}
+        for x in values:
+            if _isscalar(x):
+                constants[id(x)] = x
+                continue
+            layout = ak._v2.operations.to_layout(x, allow_record=True, allow_other=True)
+            if not isinstance(layout, ak._v2.contents.Content):
+                raise _Unfusable  # noqa: AK101 (caught in compute)
+            keys.append(id(x))
+            layouts.append(layout)
+
+        if isinstance(self._node, _Leaf):
+            return layouts[0]
+
+        unary = len(layouts) == 1 and _isunary(self._node)
+
+        def action(inputs, **ignore):
+            for x in inputs:
+                if (
+                    x.parameter("__array__") is not None
+                    or x.parameter("__record__") is not None
+                ):
+                    raise _Unfusable  # noqa: AK101 (caught in compute)
+            if not unary and any(
+                isinstance(x, ak._v2.contents.RecordArray) for x in inputs
+            ):
+                raise _Unfusable  # noqa: AK101 (caught in compute)
+
+            inputs = ak._v2._connect.numpy._array_ufunc_deregulate(inputs)
+            if not all(isinstance(x, ak._v2.contents.NumpyArray) for x in inputs):
+                return None
+
+            nplike = ak.nplike.of(*inputs)
+            if not isinstance(nplike, (ak.nplike.Numpy, ak._v2._typetracer.TypeTracer)):
+                raise _Unfusable  # noqa: AK101 (caught in compute)
+
+            arrays = dict(zip(keys, inputs))
+
+            def empty(value):
+                if id(value) in arrays:
+                    x = arrays[id(value)]
+                    return numpy.empty((0,) + x.shape[1:], x.dtype)
+                else:
+                    return constants[id(value)]
+
+            probe = _evaluate(self._node, empty, {})
+
+            if not nplike.known_data:
+                result = nplike.empty(
+                    (inputs[0].shape[0],) + probe.shape[1:], probe.dtype
+                )
+                return (ak._v2.contents.NumpyArray(result, nplike=nplike),)
+
+            raw = {key: x.raw(nplike) for key, x in arrays.items()}
+
+            def lookup(value):
+                if id(value) in raw:
+                    return raw[id(value)]
+                else:
+                    return constants[id(value)]
+
+            if engine == "numexpr":
+                result = _numexpr_engine(self._node, lookup, raw, constants, probe)
+            else:
+                result = _numpy_engine(nplike, self._node, lookup, raw, probe)
+
+            return (ak._v2.contents.NumpyArray(result, nplike=nplike),)
+
+        if unary:
+
+            def unary_action(layout, **ignore):
+                result = action((layout,), **ignore)
+                if result is None:
+                    return None
+                else:
+                    return result[0]
+
+            return layouts[0].recursively_apply(
+                unary_action, function_name="LazyArray.compute"
+            )
+
+        else:
+            (out,) = ak._v2._broadcasting.broadcast_and_apply(
+                layouts,
+                action,
+                behavior,
+                allow_records=False,
+                function_name="LazyArray.compute",
+            )
+            return out
+
+
+def lazy(array):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+
+    Returns a #ak._v2._lazy.LazyArray that records the NumPy ufuncs and
+    operators applied to it, rather than evaluating them, until
+    #ak._v2._lazy.LazyArray.compute is called.
+
+        >>> x = ak.lazy(one)
+        >>> expression = x * two + np.sqrt(x)
+        >>> expression
+        <LazyArray add(multiply(x0, x1), sqrt(x0))>
+        >>> expression.compute()
+        <Array [[2.15, 5.88, 11.7], [], [19.7, 29.8]] type='3 * var * float64'>
+
+    Applied eagerly, `one * two + np.sqrt(one)` would allocate a new
+    jagged array for `one * two` and another for `np.sqrt(one)`; the
+    deferred expression broadcasts `one` and `two` once and evaluates the
+    whole expression on their numerical buffers in one pass, so that only
+    the final result is allocated.
+
+    Arrays, NumPy arrays and scalars may be combined with the LazyArray in
+    any order; LazyArrays may also be combined with each other.
+    """
+    with ak._v2._util.OperationErrorContext("ak._v2.lazy", dict(array=array)):
+        layout = ak._v2.operations.to_layout(
+            array, allow_record=False, allow_other=False
+        )
+        if not isinstance(array, ak._v2.highlevel.Array):
+            array = ak._v2._util.wrap(layout, ak._v2._util.behavior_of(array))
+        return LazyArray(_Leaf(array))
@@ -0,0 +1,322 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import collections
+import contextlib
+import threading
+import weakref
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+KernelCall = collections.namedtuple(
+    "KernelCall", ["operation", "kernel", "types", "lengths", "time"]
+)
+
+Allocation = collections.namedtuple(
+    "Allocation", ["operation", "function", "dtype", "nbytes"]
+)
+
+
+def _operation():
+    context = ak._v2._util.ErrorContext.primary()
+    if isinstance(context, ak._v2._util.OperationErrorContext):
+        return context.name
+    elif isinstance(context, ak._v2._util.SlicingErrorContext):
+        return "<slice>"
+    else:
+        return "<no operation>"
+
+
+def _format_bytes(nbytes):
+    for unit in ("bytes", "kB", "MB", "GB"):
+        if abs(nbytes) < 1000 or unit == "GB":
+            break
+        nbytes /= 1000
+    if unit == "bytes":
+        return f"{nbytes} {unit}"
+    else:
+        return f"{nbytes:.1f} {unit}"
+
+
+class Profile:
+    """
+    Record of the kernel calls made while an #ak.profile context was active.
+
+    Each call is a `KernelCall` namedtuple of
+
+       * `operation`: name of the outermost Awkward operation (the one that
+         would be named in an error message), `"<slice>"` for slices of
+         #ak.Array, or `"<no operation>"` for calls outside of any operation;
+       * `kernel`: name of the kernel;
+       * `types`: NumPy dtypes of the kernel's specialization;
+       * `lengths`: lengths of the arrays that were passed to the kernel;
+       * `time`: wall time of the call in seconds.
+
+    If the profile tracks memory, each buffer that is allocated through the
+    nplike is also recorded as an `Allocation` namedtuple of `operation`
+    (as above), `function` (nplike function name), `dtype` and `nbytes`, and
+    the bytes that are still referenced (live) are followed until the
+    buffers are deleted.
+    """
+
+    def __init__(self, memory=False):
+        self._memory = memory
+        self._calls = []
+        self._allocations = []
+        self._live = {}
+        self._peak = {}
+        self._total_live = 0
+        self._total_peak = 0
+        self._lock = threading.Lock()
+
+    def record(self, name_and_types, args, time):
+        call = KernelCall(
+            _operation(),
+            name_and_types[0],
+            tuple(np.dtype(x) for x in name_and_types[1:]),
+            tuple(len(x) for x in args if hasattr(x, "shape") and len(x.shape) != 0),
+            time,
+        )
+        with self._lock:
+            self._calls.append(call)
+
+    def allocated(self, array, function):
+        operation = _operation()
+        nbytes = array.nbytes
+        with self._lock:
+            self._allocations.append(
+                Allocation(operation, function, array.dtype, nbytes)
+            )
+            self._live[operation] = self._live.get(operation, 0) + nbytes
+            self._peak[operation] = max(
+                self._peak.get(operation, 0), self._live[operation]
+            )
+            self._total_live += nbytes
+            self._total_peak = max(self._total_peak, self._total_live)
+        weakref.finalize(array, self._freed, operation, nbytes)
+
+    def _freed(self, operation, nbytes):
+        with self._lock:
+            self._live[operation] -= nbytes
+            self._total_live -= nbytes
+
+    @property
+    def calls(self):
+        """
+        List of every recorded `KernelCall`, in the order that they were made.
+        """
+        with self._lock:
+            return list(self._calls)
+
+    @property
+    def time(self):
+        """
+        Total wall time spent in kernels, in seconds.
+        """
+        return sum(x.time for x in self.calls)
+
+    @property
+    def allocations(self):
+        """
+        List of every recorded `Allocation`, in the order that they were made.
+        """
+        with self._lock:
+            return list(self._allocations)
+
+    @property
+    def live(self):
+        """
+        Number of bytes allocated in the profile that are still referenced.
+        """
+        with self._lock:
+            return self._total_live
+
+    @property
+    def peak(self):
+        """
+        Maximum number of bytes allocated in the profile that were referenced
+        at the same time.
+        """
+        with self._lock:
+            return self._total_peak
+
+    def memory_by_operation(self):
+        """
+        Aggregates the allocations by operation, returning
+
+            {operation: {"allocations": n, "bytes": allocated, "peak": peak,
+                         "live": live}}
+
+        where "peak" is the maximum number of bytes allocated by the operation
+        that were referenced at the same time and "live" is the number that
+        are still referenced. Operations are ordered by decreasing peak.
+        """
+        with self._lock:
+            out = {}
+            for allocation in self._allocations:
+                operation = out.setdefault(
+                    allocation.operation,
+                    {
+                        "allocations": 0,
+                        "bytes": 0,
+                        "peak": self._peak[allocation.operation],
+                        "live": self._live[allocation.operation],
+                    },
+                )
+                operation["allocations"] += 1
+                operation["bytes"] += allocation.nbytes
+        return dict(sorted(out.items(), key=lambda x: -x[1]["peak"]))
+
+    def memory_report(self):
+        """
+        Returns a table of the bytes allocated and the peak bytes referenced
+        for each operation.
+        """
+        lines = [
+            f"{'operation':<40} {'allocations':>11} {'allocated':>12} {'peak':>12}"
+        ]
+        for name, operation in self.memory_by_operation().items():
+            lines.append(
+                "{:<40} {:>11} {:>12} {:>12}".format(
+                    name,
+                    operation["allocations"],
+                    _format_bytes(operation["bytes"]),
+                    _format_bytes(operation["peak"]),
+                )
+            )
+        lines.append(
+            f"{'total peak':<40} {'':>11} {'':>12} {_format_bytes(self.peak):>12}"
+        )
+        return "\n".join(lines)
+
+    def by_operation(self):
+        """
+        Aggregates the calls by operation and then by kernel, returning
+
+            {operation: {"calls": n, "time": seconds, "length": items,
+                         "kernels": {kernel: {"calls": n, "time": seconds,
+                                              "length": items}}}}
+
+        where "length" is the total length of the arrays passed to kernels.
+        Operations are ordered by decreasing time, as are kernels within them.
+        """
+        out = {}
+        for call in self.calls:
+            length = sum(call.lengths)
+            operation = out.setdefault(
+                call.operation, {"calls": 0, "time": 0.0, "length": 0, "kernels": {}}
+            )
+            kernel = operation["kernels"].setdefault(
+                call.kernel, {"calls": 0, "time": 0.0, "length": 0}
+            )
+            for x in (operation, kernel):
+                x["calls"] += 1
+                x["time"] += call.time
+                x["length"] += length
+
+        for operation in out.values():
+            operation["kernels"] = dict(
+                sorted(operation["kernels"].items(), key=lambda x: -x[1]["time"])
+            )
+        return dict(sorted(out.items(), key=lambda x: -x[1]["time"]))
+
+    def report(self, kernels=True):
+        """
+        Args:
+            kernels (bool): If True, list the kernels within each operation.
+
+        Returns a table of the time spent in kernels for each operation.
+        """
+        lines = [f"{'operation / kernel':<56} {'calls':>8} {'length':>12} {'ms':>10}"]
+        for name, operation in self.by_operation().items():
+            lines.append(
+                "{:<56} {:>8} {:>12} {:>10.3f}".format(
+                    name,
+                    operation["calls"],
+                    operation["length"],
+                    operation["time"] * 1e3,
+                )
+            )
+            if kernels:
+                for kname, kernel in operation["kernels"].items():
+                    lines.append(
+                        "    {:<52} {:>8} {:>12} {:>10.3f}".format(
+                            kname,
+                            kernel["calls"],
+                            kernel["length"],
+                            kernel["time"] * 1e3,
+                        )
+                    )
+        return "\n".join(lines)
+
+    def __str__(self):
+        if self._memory:
+            return self.report() + "\n\n" + self.memory_report()
+        else:
+            return self.report()
+
+    def __repr__(self):
+        return "<Profile of {} kernel calls, {:.3f} ms>".format(
+            len(self.calls), self.time * 1e3
+        )
+
+
+@contextlib.contextmanager
+def profile(memory=False):
+    """
+    Args:
+        memory (bool): If True, also record every buffer allocated through
+            the nplike and follow how many of its bytes are still referenced,
+            to find the peak memory of each operation. This adds overhead to
+            every allocation.
+
+    Records every kernel call made on the CPU while the context is active,
+    in any thread.
+
+        >>> with ak.profile() as prof:
+        ...     ak.sum(array, axis=1)
+        ...     array[array > 0]
+        ...
+        >>> print(prof)
+        operation / kernel                                          calls       length         ms
+        ak._v2.sum                                                      3         2403      0.512
+            awkward_reduce_sum                                          1         1300      0.424
+            awkward_ListOffsetArray_reduce_local_nextparents_64         1          801      0.068
+            awkward_ListOffsetArray_reduce_local_outoffsets_64          1          302      0.021
+        <slice>                                                         5         5006      0.134
+            awkward_ListArray_getitem_jagged_apply                      1         2101      0.037
+            ...
+
+    Kernel calls are attributed to the outermost Awkward operation that was
+    running when they were made (see #ak._v2._profile.Profile for the details
+    of each call). Contexts may be nested; each one records the calls made
+    while it was active.
+
+    With `memory=True`, allocations are attributed the same way:
+
+        >>> with ak.profile(memory=True) as prof:
+        ...     pairs = ak.cartesian([one, two], axis=1)
+        ...
+        >>> print(prof.memory_report())
+        operation                                allocations    allocated         peak
+        ak._v2.cartesian                                  14       1.2 GB       1.1 GB
+        total peak                                                             1.1 GB
+    """
+    prof = Profile(memory)
+    with _lock:
+        ak.nplike.profilers = ak.nplike.profilers + (prof,)
+        if memory:
+            ak.nplike.allocation_trackers = ak.nplike.allocation_trackers + (prof,)
+    try:
+        yield prof
+    finally:
+        with _lock:
+            ak.nplike.profilers = tuple(x for x in ak.nplike.profilers if x is not prof)
+            ak.nplike.allocation_trackers = tuple(
+                x for x in ak.nplike.allocation_trackers if x is not prof
+            )
+
+
+_lock = threading.Lock()
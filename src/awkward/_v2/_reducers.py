@@ -1,13 +1,145 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import concurrent.futures
+import contextlib
+import os
+import threading
+
+import numpy
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
 
+# Number of threads that reducer kernels are split across when neither
+# num_threads= nor a threads context sets it; None means os.cpu_count().
+# Set it with ak._v2.set_reducer_threads.
+num_threads = 1
+
+# Reductions over fewer items than this per thread are not worth splitting.
+_min_length_per_thread = 1 << 16
+
+_local = threading.local()
+
+
+def _check_num_threads(n):
+    if n is not None and (
+        not isinstance(n, (int, np.integer)) or isinstance(n, (bool, np.bool_)) or n < 1
+    ):
+        raise ak._v2._util.error(
+            TypeError(f"num_threads must be None or a positive integer, not {n!r}")
+        )
+
+
+@contextlib.contextmanager
+def threads(n):
+    """
+    Args:
+        n (None or int): Number of threads; if None, the current setting is
+            left unchanged.
+
+    Context manager that sets the number of threads used by the reducer
+    kernels that are called in this thread. See #ak._v2.reducer_threads.
+    """
+    _check_num_threads(n)
+    if n is None:
+        yield
+        return
+    previous = getattr(_local, "num_threads", None)
+    _local.num_threads = n
+    try:
+        yield
+    finally:
+        _local.num_threads = previous
+
+
+def _current_num_threads():
+    n = getattr(_local, "num_threads", None)
+    if n is None:
+        n = num_threads
+    if n is None:
+        n = os.cpu_count() or 1
+    return n
+
+
+def _partition(nplike, parents, outlength):
+    # Splits the (sorted) parents into contiguous chunks that start at group
+    # boundaries, so that every output group is written by exactly one chunk.
+    # Returns a list of (start, stop, low, high) or None to run serially.
+    if not isinstance(nplike, ak.nplike.Numpy) or outlength <= 0:
+        return None
+    length = parents.length
+    n = min(_current_num_threads(), length // _min_length_per_thread)
+    if n <= 1:
+        return None
+
+    p = parents.data
+    if not (p[1:] >= p[:-1]).all():
+        return None
+
+    cuts = nplike.searchsorted(p, p[nplike.arange(1, n) * length // n], "left")
+    cuts = [int(x) for x in nplike.unique(cuts) if 0 < x < length]
+    if len(cuts) == 0:
+        return None
+
+    starts = [0] + cuts
+    stops = cuts + [length]
+    lows = [0] + [int(p[x]) for x in cuts]
+    highs = lows[1:] + [outlength]
+    return list(zip(starts, stops, lows, highs))
+
 
 class Reducer:
     needs_position = False
 
+    @classmethod
+    def _apply_kernel(
+        cls, array, name_and_types, result, data, parents, outlength, *args
+    ):
+        chunks = _partition(array.nplike, parents, outlength)
+        kernel = array.nplike[name_and_types]
+        data_args = () if data is None else (data,)
+
+        if chunks is None:
+            array._handle_error(
+                kernel(
+                    result, *data_args, parents.data, parents.length, outlength, *args
+                )
+            )
+            return
+
+        # each output group is one item of the kernel's output type, or two
+        # (real and imaginary parts) for kernels that produce complex numbers
+        flat = result.view(name_and_types[1])
+        width = 2 if array.dtype.kind == "c" and flat.dtype.kind == "f" else 1
+
+        # error contexts are thread-local, so carry the caller's into the pool
+        context = ak._v2._util.ErrorContext.primary()
+
+        def run(chunk):
+            with contextlib.nullcontext() if context is None else context:
+                return run_chunk(chunk)
+
+        def run_chunk(chunk):
+            start, stop, low, high = chunk
+            out = flat[low * width : high * width]
+            error = kernel(
+                out,
+                *(x[start:stop] for x in data_args),
+                parents.data[start:stop] - low,
+                stop - start,
+                high - low,
+                *args,
+            )
+            if cls.needs_position and start != 0:
+                out[out >= 0] += start
+            return error
+
+        with concurrent.futures.ThreadPoolExecutor(len(chunks)) as executor:
+            errors = list(executor.map(run, chunks))
+        for error in errors:
+            array._handle_error(error)
+
     @classmethod
     def return_dtype(cls, given_dtype):
         if given_dtype in (np.bool_, np.int8, np.int16, np.int32):
@@ -48,35 +180,33 @@ class ArgMin(Reducer):
         result = array.nplike.empty(outlength, dtype=np.int64)
         if array.dtype.type in (np.complex128, np.complex64):
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_argmin_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         else:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_argmin",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         return ak._v2.contents.NumpyArray(result)
 
@@ -97,35 +227,33 @@ class ArgMax(Reducer):
         result = array.nplike.empty(outlength, dtype=np.int64)
         if array.dtype.type in (np.complex128, np.complex64):
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_argmax_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         else:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_argmax",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         return ak._v2.contents.NumpyArray(result)
 
@@ -143,15 +271,17 @@ class Count(Reducer):
         assert isinstance(array, ak._v2.contents.NumpyArray)
         result = array.nplike.empty(outlength, dtype=np.int64)
         assert parents.nplike is array.nplike
-        array._handle_error(
-            array.nplike[
-                "awkward_reduce_count_64", result.dtype.type, parents.dtype.type
-            ](
-                result,
-                parents.data,
-                parents.length,
-                outlength,
-            )
+        cls._apply_kernel(
+            array,
+            (
+                "awkward_reduce_count_64",
+                result.dtype.type,
+                parents.dtype.type,
+            ),
+            result,
+            None,
+            parents,
+            outlength,
         )
         return ak._v2.contents.NumpyArray(result)
 
@@ -171,35 +301,33 @@ class CountNonzero(Reducer):
         result = array.nplike.empty(outlength, dtype=np.int64)
         if array.dtype.type in (np.complex128, np.complex64):
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_countnonzero_complex",
                     result.dtype.type,
                     np.float64 if array.dtype.type == np.complex128 else np.float32,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         else:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_countnonzero",
                     result.dtype.type,
                     dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         return ak._v2.contents.NumpyArray(result)
 
@@ -226,69 +354,65 @@ class Sum(Reducer):
             if result.dtype in (np.int64, np.uint64):
                 assert parents.nplike is array.nplike
                 assert parents.nplike is array.nplike
-                array._handle_error(
-                    array.nplike[
+                cls._apply_kernel(
+                    array,
+                    (
                         "awkward_reduce_sum_int64_bool_64",
                         np.int64,
                         array.dtype.type,
                         parents.dtype.type,
-                    ](
-                        result,
-                        array.data,
-                        parents.data,
-                        parents.length,
-                        outlength,
-                    )
+                    ),
+                    result,
+                    array.data,
+                    parents,
+                    outlength,
                 )
             elif result.dtype in (np.int32, np.uint32):
                 assert parents.nplike is array.nplike
-                array._handle_error(
-                    array.nplike[
+                cls._apply_kernel(
+                    array,
+                    (
                         "awkward_reduce_sum_int32_bool_64",
                         np.int32,
                         array.dtype.type,
                         parents.dtype.type,
-                    ](
-                        result,
-                        array.data,
-                        parents.data,
-                        parents.length,
-                        outlength,
-                    )
+                    ),
+                    result,
+                    array.data,
+                    parents,
+                    outlength,
                 )
             else:
                 raise ak._v2._util.error(NotImplementedError)
         elif array.dtype.type in (np.complex128, np.complex64):
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_sum_complex",
                     np.float64 if array.dtype.type == np.complex128 else np.float32,
                     np.float64 if array.dtype.type == np.complex128 else np.float32,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         else:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_sum",
                     result.dtype.type,
                     np.int64 if array.dtype.kind == "m" else array.dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
 
         if array.dtype.kind == "m":
@@ -316,51 +440,48 @@ class Prod(Reducer):
         )
         if array.dtype == np.bool_:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_prod_bool",
                     array.dtype.type,
                     array.dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         elif array.dtype.type in (np.complex128, np.complex64):
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_prod_complex",
                     np.float64 if array.dtype.type == np.complex128 else np.float32,
                     np.float64 if array.dtype.type == np.complex128 else np.float32,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         else:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_prod",
                     result.dtype.type,
                     array.dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         if array.dtype.type in (np.complex128, np.complex64):
             return ak._v2.contents.NumpyArray(result.view(array.dtype))
@@ -383,35 +504,33 @@ class Any(Reducer):
         result = array.nplike.empty(outlength, dtype=np.bool_)
         if array.dtype.type in (np.complex128, np.complex64):
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_sum_bool_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         else:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_sum_bool",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         return ak._v2.contents.NumpyArray(result)
 
@@ -431,35 +550,33 @@ class All(Reducer):
         result = array.nplike.empty(outlength, dtype=np.bool_)
         if array.dtype.type in (np.complex128, np.complex64):
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_prod_bool_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         else:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_prod_bool",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         return ak._v2.contents.NumpyArray(result)
 
@@ -503,53 +620,50 @@ class Min(Reducer):
         )
         if array.dtype == np.bool_:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_prod_bool",
                     result.dtype.type,
                     array.dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         elif array.dtype.type in (np.complex128, np.complex64):
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_min_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                    cls._min_initial(cls.initial, dtype),
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
+                cls._min_initial(cls.initial, dtype),
             )
         else:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_min",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                    cls._min_initial(cls.initial, dtype),
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
+                cls._min_initial(cls.initial, dtype),
             )
         if array.dtype.type in (np.complex128, np.complex64):
             return ak._v2.contents.NumpyArray(
@@ -598,53 +712,50 @@ class Max(Reducer):
         )
         if array.dtype == np.bool_:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_sum_bool",
                     result.dtype.type,
                     array.dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         elif array.dtype.type in (np.complex128, np.complex64):
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_max_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                    cls._max_initial(cls.initial, dtype),
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
+                cls._max_initial(cls.initial, dtype),
             )
         else:
             assert parents.nplike is array.nplike
-            array._handle_error(
-                array.nplike[
+            cls._apply_kernel(
+                array,
+                (
                     "awkward_reduce_max",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.data,
-                    parents.length,
-                    outlength,
-                    cls._max_initial(cls.initial, dtype),
-                )
+                ),
+                result,
+                array.data,
+                parents,
+                outlength,
+                cls._max_initial(cls.initial, dtype),
             )
         if array.dtype.type in (np.complex128, np.complex64):
             return ak._v2.contents.NumpyArray(
@@ -652,3 +763,85 @@ class Max(Reducer):
             )
         else:
             return ak._v2.contents.NumpyArray(array.nplike.array(result, array.dtype))
+
+
+class _DescribeMin(Min):
+    # never has an initial value, whatever Min(initial) another thread made
+    initial = None
+
+
+class _DescribeMax(Max):
+    initial = None
+
+
+class Describe(Reducer):
+    name = "describe"
+    preferred_dtype = np.float64
+    fields = ["count", "sum", "sum2", "mean", "var", "std", "min", "max"]
+
+    def __init__(self, ddof):
+        # an instance attribute, unlike Min.initial, so that concurrent calls
+        # with different ddof don't see each other's
+        self.ddof = ddof
+
+    def apply(self, array, parents, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        nplike = array.nplike
+
+        if not nplike.known_data:
+            # run on an empty array only to find the dtypes of the statistics
+            empty = ak._v2.contents.NumpyArray(numpy.empty(0, array.dtype))
+            dtypes = [
+                x.dtype
+                for x in self.apply(
+                    empty, ak._v2.index.Index64.empty(0, ak.nplike.Numpy.instance()), 0
+                ).contents
+            ]
+            return ak._v2.contents.RecordArray(
+                [
+                    ak._v2.contents.NumpyArray(nplike.empty(outlength, dtype))
+                    for dtype in dtypes
+                ],
+                self.fields,
+                outlength,
+                nplike=nplike,
+            )
+
+        # every statistic is accumulated over the same parents, which are only
+        # computed once for all of them; each is one kernel pass over the data
+        data = array.data
+        if data.dtype.kind in "iu":
+            # square in the dtype that Sum accumulates in, so that small
+            # integer types don't overflow
+            data = data.astype(Sum.return_dtype(data.dtype.type))
+        count = Count.apply(array, parents, outlength).data
+        sumx = Sum.apply(array, parents, outlength).data
+        sumxx = Sum.apply(ak._v2.contents.NumpyArray(data * data), parents, outlength)
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            mean = nplike.true_divide(sumx, count)
+            deviation = data - mean[parents.data]
+            m2 = Sum.apply(
+                ak._v2.contents.NumpyArray(deviation * deviation), parents, outlength
+            ).data
+            var = nplike.true_divide(m2, count)
+            if self.ddof != 0:
+                var = var * nplike.true_divide(count, count - self.ddof)
+            std = nplike.sqrt(var)
+        minx = _DescribeMin.apply(array, parents, outlength)
+        maxx = _DescribeMax.apply(array, parents, outlength)
+
+        return ak._v2.contents.RecordArray(
+            [
+                ak._v2.contents.NumpyArray(count),
+                ak._v2.contents.NumpyArray(sumx),
+                sumxx,
+                ak._v2.contents.NumpyArray(mean),
+                ak._v2.contents.NumpyArray(var),
+                ak._v2.contents.NumpyArray(std),
+                minx,
+                maxx,
+            ],
+            self.fields,
+            outlength,
+            nplike=nplike,
+        )
@@ -0,0 +1,565 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import itertools
+import math
+import numbers
+
+import numpy
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+# number of objects converted at a time, column by column
+_batch_length = 1024
+
+# kinds of Python/NumPy values that each kind of NumpyForm dtype accepts
+_accepted_kinds = {"b": "b", "i": "iu", "u": "iu", "f": "iuf", "c": "iufc"}
+
+# the common Python types among them, which are checked first
+_accepted_types = {
+    "b": {bool, np.bool_},
+    "i": {int},
+    "u": {int},
+    "f": {int, float},
+    "c": {int, float, complex},
+}
+
+
+def _kind(x):
+    if isinstance(x, (bool, np.bool_)):
+        return "b"
+    elif isinstance(x, numbers.Integral):
+        return "u" if isinstance(x, np.unsignedinteger) else "i"
+    elif isinstance(x, numbers.Real):
+        return "f"
+    elif isinstance(x, numbers.Complex):
+        return "c"
+    else:
+        return "-"
+
+
+class GrowableBuffer:
+    def __init__(self, dtype, initial, resize, inner_shape=()):
+        self._data = numpy.empty((max(int(initial), 1),) + tuple(inner_shape), dtype)
+        self._length = 0
+        self._resize = resize
+
+    def __len__(self):
+        return self._length
+
+    def extend(self, values):
+        stop = self._length + len(values)
+        if stop > len(self._data):
+            capacity = len(self._data)
+            while capacity < stop:
+                capacity = int(math.ceil(capacity * self._resize))
+            data = numpy.empty((capacity,) + self._data.shape[1:], self._data.dtype)
+            data[: self._length] = self._data[: self._length]
+            self._data = data
+        self._data[self._length : stop] = values
+        self._length = stop
+
+    def truncate(self, length):
+        self._length = length
+
+    def snapshot(self):
+        return self._data[: self._length].copy()
+
+
+class Node:
+    # Each node fills its buffers from a list of Python objects (a batch),
+    # passing the list of its content's objects down to its content.
+
+    def __init__(self, form, key, contents):
+        self._form = form
+        self._key = key
+        self._contents = contents
+        self._buffers = []
+        self._length = 0
+
+    def mark(self):
+        return (
+            self._length,
+            [len(x) for x in self._buffers],
+            [x.mark() for x in self._contents],
+        )
+
+    def rollback(self, mark):
+        self._length, buffer_lengths, content_marks = mark
+        for buffer, length in zip(self._buffers, buffer_lengths):
+            buffer.truncate(length)
+        for content, content_mark in zip(self._contents, content_marks):
+            content.rollback(content_mark)
+
+    def fill(self, items):
+        self._extend(items)
+        self._length += len(items)
+
+    def check(self, obj):
+        # checks one object against the Form without filling anything,
+        # returning it with any iterators it contains replaced by lists
+        return self._contents[0].check(obj)
+
+    def error(self, message):
+        # wrapped when it leaves the TypedBuilder
+        return ValueError(f"{message} (building {self._form.type})")
+
+
+class NumpyNode(Node):
+    def __init__(self, form, key, initial, resize):
+        super().__init__(form, key, [])
+        self._dtype = ak._v2.types.numpytype.primitive_to_dtype(form.primitive)
+        self._data = GrowableBuffer(self._dtype, initial, resize, form.inner_shape)
+        self._buffers.append(self._data)
+
+    def check(self, obj):
+        self._values([obj])
+        return obj
+
+    def _extend(self, items):
+        self._data.extend(self._values(items))
+
+    def _values(self, items):
+        accepted = _accepted_kinds.get(self._dtype.kind)
+        if len(self._form.inner_shape) == 0:
+            if None in items:
+                raise self.error("missing values (None) require an option type")
+            if accepted is not None:
+                types = _accepted_types[self._dtype.kind]
+                if not all(type(x) in types for x in items) and not all(
+                    _kind(x) in accepted for x in items
+                ):
+                    raise self.error(self._cannot_convert())
+            if self._dtype.kind in "iu" and len(items) != 0:
+                info = numpy.iinfo(self._dtype)
+                if min(items) < info.min or max(items) > info.max:
+                    raise self.error(f"values out of range for {self._dtype}")
+            values = numpy.asarray(items, dtype=self._dtype)
+        else:
+            try:
+                values = numpy.asarray(items)
+            except ValueError:
+                values = None
+            if values is None or values.shape != (len(items),) + tuple(
+                self._form.inner_shape
+            ):
+                raise self.error(
+                    "values do not have shape " + str(self._form.inner_shape)
+                )
+            if accepted is not None and values.dtype.kind not in accepted:
+                raise self.error(self._cannot_convert())
+            converted = values.astype(self._dtype)
+            if self._dtype.kind in "iu" and not numpy.array_equal(converted, values):
+                raise self.error(f"values out of range for {self._dtype}")
+            values = converted
+        return values
+
+    def _cannot_convert(self):
+        return f"cannot convert values to {self._dtype}: values must be " + {
+            "b": "bool",
+            "i": "integers",
+            "u": "integers",
+            "f": "real numbers",
+            "c": "numbers",
+        }.get(self._dtype.kind, "numbers")
+
+    def _extend_bytes(self, data):
+        self._data.extend(numpy.frombuffer(data, np.uint8))
+
+    def form(self):
+        return ak._v2.forms.NumpyForm(
+            self._form.primitive,
+            self._form.inner_shape,
+            parameters=self._form.parameters,
+            form_key=self._key,
+        )
+
+    def buffers(self, container):
+        container[f"{self._key}-data"] = self._data.snapshot()
+
+
+class EmptyNode(Node):
+    def check(self, obj):
+        raise self.error("an empty list type cannot have any values")
+
+    def _extend(self, items):
+        if len(items) != 0:
+            raise self.error("an empty list type cannot have any values")
+
+    def form(self):
+        return ak._v2.forms.EmptyForm(
+            parameters=self._form.parameters, form_key=self._key
+        )
+
+    def buffers(self, container):
+        pass
+
+
+class ListNode(Node):
+    # ListForm and ListOffsetForm are both built as ListOffsetArray
+    def __init__(self, form, key, content, initial, resize):
+        super().__init__(form, key, [content])
+        self._offsets = GrowableBuffer(np.int64, initial, resize)
+        self._offsets.extend([0])
+        self._buffers.append(self._offsets)
+
+    def check(self, obj):
+        return _check_sequence(self, obj)
+
+    def _extend(self, items):
+        items = _sequences(self, items)
+        lengths = numpy.fromiter(map(len, items), np.int64, len(items))
+        last = self._offsets._data[len(self._offsets) - 1]
+        self._offsets.extend(numpy.cumsum(lengths) + last)
+        _fill_content(self, self._contents[0], items)
+
+    def form(self):
+        return ak._v2.forms.ListOffsetForm(
+            "i64",
+            self._contents[0].form(),
+            parameters=self._form.parameters,
+            form_key=self._key,
+        )
+
+    def buffers(self, container):
+        container[f"{self._key}-offsets"] = self._offsets.snapshot()
+        self._contents[0].buffers(container)
+
+
+class RegularNode(Node):
+    def check(self, obj):
+        obj = _check_sequence(self, obj)
+        if len(obj) != self._form.size:
+            raise self.error(f"all lists must have length {self._form.size}")
+        return obj
+
+    def _extend(self, items):
+        items = _sequences(self, items)
+        size = self._form.size
+        if any(len(x) != size for x in items):
+            raise self.error(f"all lists must have length {size}")
+        _fill_content(self, self._contents[0], items)
+
+    def form(self):
+        return ak._v2.forms.RegularForm(
+            self._contents[0].form(),
+            self._form.size,
+            parameters=self._form.parameters,
+            form_key=self._key,
+        )
+
+    def buffers(self, container):
+        self._contents[0].buffers(container)
+
+
+class RecordNode(Node):
+    def _keys(self):
+        if self._form.is_tuple:
+            return range(len(self._contents))
+        else:
+            return self._form.fields
+
+    def check(self, obj):
+        values, changed = [], False
+        for key, content in zip(self._keys(), self._contents):
+            try:
+                value = obj[key]
+            except (KeyError, IndexError, TypeError):
+                raise self.error(f"all records must have field {key!r}") from None
+            values.append(content.check(value))
+            changed = changed or values[-1] is not value
+        if not changed:
+            return obj
+        elif self._form.is_tuple:
+            return tuple(values)
+        else:
+            return dict(zip(self._form.fields, values))
+
+    def _extend(self, items):
+        for key, content in zip(self._keys(), self._contents):
+            try:
+                column = [x[key] for x in items]
+            except (KeyError, IndexError, TypeError):
+                raise self.error(f"all records must have field {key!r}") from None
+            content.fill(column)
+
+    def form(self):
+        return ak._v2.forms.RecordForm(
+            [x.form() for x in self._contents],
+            None if self._form.is_tuple else self._form.fields,
+            parameters=self._form.parameters,
+            form_key=self._key,
+        )
+
+    def buffers(self, container):
+        for content in self._contents:
+            content.buffers(container)
+
+
+class OptionNode(Node):
+    # all option types except UnmaskedForm are built as IndexedOptionArray
+    def __init__(self, form, key, content, initial, resize):
+        super().__init__(form, key, [content])
+        self._index = GrowableBuffer(np.int64, initial, resize)
+        self._buffers.append(self._index)
+
+    def check(self, obj):
+        if obj is None:
+            return obj
+        return self._contents[0].check(obj)
+
+    def _extend(self, items):
+        valid = numpy.fromiter((x is not None for x in items), np.bool_, len(items))
+        index = numpy.full(len(items), -1, np.int64)
+        content = self._contents[0]
+        start = content._length
+        index[valid] = numpy.arange(start, start + numpy.count_nonzero(valid))
+        self._index.extend(index)
+        content.fill([x for x in items if x is not None])
+
+    def form(self):
+        return ak._v2.forms.IndexedOptionForm(
+            "i64",
+            self._contents[0].form(),
+            parameters=self._form.parameters,
+            form_key=self._key,
+        )
+
+    def buffers(self, container):
+        container[f"{self._key}-index"] = self._index.snapshot()
+        self._contents[0].buffers(container)
+
+
+class UnmaskedNode(Node):
+    def _extend(self, items):
+        self._contents[0].fill(items)
+
+    def form(self):
+        return ak._v2.forms.UnmaskedForm(
+            self._contents[0].form(),
+            parameters=self._form.parameters,
+            form_key=self._key,
+        )
+
+    def buffers(self, container):
+        self._contents[0].buffers(container)
+
+
+class IndexedNode(Node):
+    def __init__(self, form, key, content, initial, resize):
+        super().__init__(form, key, [content])
+        self._index = GrowableBuffer(np.int64, initial, resize)
+        self._buffers.append(self._index)
+
+    def _extend(self, items):
+        start = self._contents[0]._length
+        self._index.extend(numpy.arange(start, start + len(items), dtype=np.int64))
+        self._contents[0].fill(items)
+
+    def form(self):
+        return ak._v2.forms.IndexedForm(
+            "i64",
+            self._contents[0].form(),
+            parameters=self._form.parameters,
+            form_key=self._key,
+        )
+
+    def buffers(self, container):
+        container[f"{self._key}-index"] = self._index.snapshot()
+        self._contents[0].buffers(container)
+
+
+def _sequences(node, items):
+    if node._form.parameter("__array__") == "string":
+        try:
+            return [x.encode("utf-8", "surrogateescape") for x in items]
+        except AttributeError:
+            raise node.error("all values must be str") from None
+    elif node._form.parameter("__array__") == "bytestring":
+        if not all(isinstance(x, (bytes, bytearray)) for x in items):
+            raise node.error("all values must be bytes")
+        return items
+    elif any(isinstance(x, (str, bytes, dict)) or x is None for x in items):
+        raise node.error("all values must be lists")
+    try:
+        return [x if hasattr(x, "__len__") else list(x) for x in items]
+    except TypeError:
+        raise node.error("all values must be lists") from None
+
+
+def _check_sequence(node, obj):
+    (sequence,) = _sequences(node, [obj])
+    if node._form.parameter("__array__") in ("string", "bytestring"):
+        return obj
+    checked = [node._contents[0].check(x) for x in sequence]
+    if sequence is obj and all(x is y for x, y in zip(checked, sequence)):
+        return obj
+    else:
+        return checked
+
+
+def _fill_content(node, content, items):
+    if node._form.parameter("__array__") in ("string", "bytestring"):
+        content._extend_bytes(b"".join(items))
+        content._length += sum(len(x) for x in items)
+    else:
+        content.fill(list(itertools.chain.from_iterable(items)))
+
+
+def _node(form, initial, resize, keys):
+    key = f"node{next(keys)}"
+
+    if isinstance(form, ak._v2.forms.NumpyForm):
+        return NumpyNode(form, key, initial, resize)
+
+    elif isinstance(form, ak._v2.forms.EmptyForm):
+        return EmptyNode(form, key, [])
+
+    elif isinstance(form, (ak._v2.forms.ListForm, ak._v2.forms.ListOffsetForm)):
+        content = _node(form.content, initial, resize, keys)
+        return ListNode(form, key, content, initial, resize)
+
+    elif isinstance(form, ak._v2.forms.RegularForm):
+        return RegularNode(form, key, [_node(form.content, initial, resize, keys)])
+
+    elif isinstance(form, ak._v2.forms.RecordForm):
+        contents = [_node(x, initial, resize, keys) for x in form.contents]
+        return RecordNode(form, key, contents)
+
+    elif isinstance(form, ak._v2.forms.UnmaskedForm):
+        return UnmaskedNode(form, key, [_node(form.content, initial, resize, keys)])
+
+    elif isinstance(
+        form,
+        (
+            ak._v2.forms.IndexedOptionForm,
+            ak._v2.forms.ByteMaskedForm,
+            ak._v2.forms.BitMaskedForm,
+        ),
+    ):
+        content = _node(form.content, initial, resize, keys)
+        return OptionNode(form, key, content, initial, resize)
+
+    elif isinstance(form, ak._v2.forms.IndexedForm):
+        content = _node(form.content, initial, resize, keys)
+        return IndexedNode(form, key, content, initial, resize)
+
+    elif isinstance(form, ak._v2.forms.UnionForm):
+        raise ak._v2._util.error(
+            NotImplementedError(
+                "union types can't be filled from a Form; use a builder without a form"
+            )
+        )
+
+    else:
+        raise ak._v2._util.error(AssertionError(f"unrecognized Form: {type(form)}"))
+
+
+class TypedBuilder:
+    """
+    Fills arrays of a known #ak.forms.Form from Python objects. Objects are
+    collected in batches and each batch is converted column by column, into
+    NumPy buffers (laid out by the Form) that grow by a factor of `resize`.
+
+    Lists (#ak.forms.ListForm or #ak.forms.ListOffsetForm) are built as
+    #ak.contents.ListOffsetArray and missing values (any option type other
+    than #ak.forms.UnmaskedForm) as #ak.contents.IndexedOptionArray.
+
+    This has the interface of #ak.layout.ArrayBuilder that #ak.ArrayBuilder
+    uses, but only objects can be appended, not individual commands.
+    """
+
+    def __init__(self, form, initial=1024, resize=1.5):
+        if ak._v2._util.isstr(form):
+            if ak._v2.types.numpytype.is_primitive(form):
+                form = ak._v2.forms.NumpyForm(form)
+            else:
+                form = ak._v2.forms.from_json(form)
+        elif isinstance(form, dict):
+            form = ak._v2.forms.from_iter(form)
+        if not isinstance(form, ak._v2.forms.Form):
+            raise ak._v2._util.error(
+                TypeError(
+                    "'form' argument must be a Form or its Python dict/JSON string representation"
+                )
+            )
+        if not (ak._v2._util.isnum(resize) and resize > 1):
+            raise ak._v2._util.error(ValueError("'resize' must be greater than 1"))
+
+        self._root = _node(form, initial, resize, itertools.count())
+        self._pending = []
+
+    def __len__(self):
+        return self._root._length + len(self._pending)
+
+    def fromiter(self, obj):
+        try:
+            obj = self._root.check(obj)
+        except ValueError as err:
+            raise ak._v2._util.error(err) from None
+        self._pending.append(obj)
+        if len(self._pending) >= _batch_length:
+            self._flush()
+
+    def extend(self, iterable):
+        self._flush()
+        iterator = iter(iterable)
+        while True:
+            batch = list(itertools.islice(iterator, _batch_length))
+            if len(batch) == 0:
+                break
+            self._fill(batch, False)
+
+    def _flush(self):
+        if len(self._pending) != 0:
+            batch, self._pending = self._pending, []
+            self._fill(batch, True)
+
+    def _fill(self, batch, keep_pending):
+        if not self._filled(batch, False):
+            # keep the objects before the first one that doesn't match the
+            # Form and raise its error; appended objects after it stay pending
+            for i, obj in enumerate(batch):
+                if keep_pending:
+                    self._pending = batch[i + 1 :]
+                self._filled([obj], True)
+
+    def _filled(self, batch, raise_error):
+        # a batch that fails leaves no partially filled buffers
+        mark = self._root.mark()
+        success = False
+        try:
+            self._root.fill(batch)
+            success = True
+        except ValueError as err:
+            if raise_error:
+                raise ak._v2._util.error(err) from None
+        finally:
+            if not success:
+                self._root.rollback(mark)
+        return success
+
+    def form(self):
+        return self._root.form().to_json()
+
+    def to_buffers(self):
+        self._flush()
+        container = {}
+        self._root.buffers(container)
+        return self.form(), self._root._length, container
+
+    def _commands_not_supported(self, *args, **kwargs):
+        raise ak._v2._util.error(
+            TypeError(
+                "an ArrayBuilder with a form can only be filled with append or extend"
+            )
+        )
+
+    null = (
+        boolean
+    ) = integer = real = complex = datetime = timedelta = _commands_not_supported
+    bytestring = (
+        string
+    ) = beginlist = endlist = begintuple = index = endtuple = _commands_not_supported
+    beginrecord = field = endrecord = _commands_not_supported
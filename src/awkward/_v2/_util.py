@@ -7,7 +7,6 @@ import itertools
 import numbers
 import os
 import re
-import setuptools
 import threading
 import traceback
 
@@ -46,6 +45,10 @@ def regularize_backend(backend):
 
 
 def parse_version(version):
+    # setuptools takes longer to import than the rest of awkward; only the
+    # connectors that check versions of optional dependencies need it
+    import setuptools
+
     return setuptools.extern.packaging.version.parse(version)
 
 
@@ -130,6 +133,19 @@ class ErrorContext:
 
         valuestr = None
         if isinstance(
+            value, (ak._v2.highlevel.Array, ak._v2.highlevel.Record)
+        ) and ak._v2._virtual.has_virtual_buffers(value.layout):
+            # don't read buffers just to describe the argument
+            try:
+                valuestr = "<{}-virtual type={}>".format(
+                    type(value).__name__, repr(str(value.type))
+                )
+                if len(valuestr) > width:
+                    valuestr = valuestr[: width - 3] + "..."
+            except Exception as err:
+                valuestr = f"repr-raised-{type(err).__name__}"
+
+        elif isinstance(
             value,
             (
                 ak._v2.highlevel.Array,
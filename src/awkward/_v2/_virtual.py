@@ -0,0 +1,121 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+class VirtualBuffer:
+    """
+    A buffer whose dtype and shape are known, but whose data are only generated
+    when something needs to read them.
+
+    The `length` (first dimension) may be an int or a zero-argument callable
+    that computes it, for lengths that depend on another buffer (such as the
+    last item of a ListOffsetArray's `offsets`). The `generator` is called at
+    most once; its result is kept for subsequent requests.
+
+    #ak._v2.index.Index and #ak._v2.contents.NumpyArray accept a VirtualBuffer
+    in place of an array, reporting its dtype, shape, and Form without calling
+    the `generator`.
+    """
+
+    def __init__(self, nplike, length, inner_shape, dtype, generator):
+        self._nplike = nplike
+        self._length = length
+        self._inner_shape = tuple(inner_shape)
+        self._dtype = np.dtype(dtype)
+        self._generator = generator
+        self._array = None
+
+    def __repr__(self):
+        return "<VirtualBuffer dtype={} shape={} materialized={}>".format(
+            repr(str(self._dtype)),
+            repr(self.shape if not callable(self._length) else None),
+            self.is_materialized,
+        )
+
+    @property
+    def nplike(self):
+        return self._nplike
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def length(self):
+        if callable(self._length):
+            self._length = int(self._length())
+        return self._length
+
+    @property
+    def inner_shape(self):
+        return self._inner_shape
+
+    @property
+    def shape(self):
+        return (self.length,) + self._inner_shape
+
+    @property
+    def is_materialized(self):
+        return self._array is not None
+
+    def materialize(self):
+        if self._array is None:
+            array = self._nplike.asarray(self._generator())
+            if array.dtype != self._dtype:
+                raise ak._v2._util.error(
+                    ValueError(
+                        "VirtualBuffer generator returned dtype {}, expected {}".format(
+                            array.dtype, self._dtype
+                        )
+                    )
+                )
+            if array.shape != self.shape:
+                raise ak._v2._util.error(
+                    ValueError(
+                        "VirtualBuffer generator returned shape {}, expected {}".format(
+                            array.shape, self.shape
+                        )
+                    )
+                )
+            self._array = array
+            self._generator = None
+        return self._array
+
+    def raw(self, nplike):
+        if isinstance(nplike, ak._v2._typetracer.TypeTracer) and not (
+            self.is_materialized
+        ):
+            return ak._v2._typetracer.TypeTracerArray(self._dtype, self.shape)
+        return self._nplike.raw(self.materialize(), nplike)
+
+
+def resolve_length(length):
+    if callable(length):
+        return int(length())
+    return length
+
+
+def has_virtual_buffers(layout):
+    """
+    Returns True if any #ak._v2.index.Index or #ak._v2.contents.NumpyArray
+    in `layout` has not been generated yet.
+    """
+    if isinstance(layout, ak._v2.record.Record):
+        layout = layout.array
+
+    if isinstance(layout, ak._v2.contents.NumpyArray):
+        return layout.is_virtual
+
+    for value in layout.__dict__.values():
+        if isinstance(value, ak._v2.index.Index) and value.is_virtual:
+            return True
+
+    if isinstance(layout, (ak._v2.contents.RecordArray, ak._v2.contents.UnionArray)):
+        return any(has_virtual_buffers(x) for x in layout.contents)
+    elif isinstance(layout, ak._v2.contents.EmptyArray):
+        return False
+    else:
+        return has_virtual_buffers(layout.content)
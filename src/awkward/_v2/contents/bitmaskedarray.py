@@ -53,7 +53,9 @@ class BitMaskedArray(Content):
                     )
                 )
             )
-        if not isinstance(length, ak._v2._typetracer.UnknownLengthType):
+        if not callable(length) and not isinstance(
+            length, ak._v2._typetracer.UnknownLengthType
+        ):
             if not (ak._util.isint(length) and length >= 0):
                 raise ak._v2._util.error(
                     TypeError(
@@ -70,7 +72,11 @@ class BitMaskedArray(Content):
                     )
                 )
             )
-        if length > mask.length * 8:
+        if callable(length):
+            # computed on first use, for arrays whose buffers are read on
+            # demand; it is not checked against the mask or content
+            pass
+        elif length > mask.length * 8:
             raise ak._v2._util.error(
                 ValueError(
                     "{} 'length' ({}) must be <= len(mask) * 8 ({})".format(
@@ -78,7 +84,7 @@ class BitMaskedArray(Content):
                     )
                 )
             )
-        if length > content.length:
+        if not callable(length) and length > content.length:
             raise ak._v2._util.error(
                 ValueError(
                     "{} 'length' ({}) must be <= len(content) ({})".format(
@@ -94,7 +100,10 @@ class BitMaskedArray(Content):
         self._mask = mask
         self._content = content
         self._valid_when = valid_when
-        self._length = length
+        if callable(length):
+            self._length_generator = length
+        else:
+            self._length = length
         self._lsb_order = lsb_order
         self._init(identifier, parameters, nplike)
 
@@ -642,9 +651,8 @@ class BitMaskedArray(Content):
             behavior, json_conversions
         )
 
-        for i, isvalid in enumerate(mask):
-            if not isvalid:
-                out[i] = None
+        for i in numpy.nonzero(~mask)[0].tolist():
+            out[i] = None
 
         return out
 
@@ -23,6 +23,14 @@ class Content:
     is_RecordType = False
     is_UnionType = False
 
+    def __getattr__(self, name):
+        # only reached if self._length has not been set: it was given as a
+        # zero-argument callable, to be computed on first use
+        if name == "_length" and "_length_generator" in self.__dict__:
+            self._length = int(self.__dict__.pop("_length_generator")())
+            return self._length
+        raise ak._v2._util.error(AttributeError(name))
+
     def _init(self, identifier, parameters, nplike):
         if identifier is not None and not isinstance(
             identifier, ak._v2.identifier.Identifier
@@ -877,6 +885,9 @@ class Content:
     def max(self, axis=-1, mask=True, keepdims=False, initial=None):
         return self._reduce(awkward._v2._reducers.Max(initial), axis, mask, keepdims)
 
+    def describe(self, axis=-1, mask=True, keepdims=False, ddof=0):
+        return self._reduce(awkward._v2._reducers.Describe(ddof), axis, mask, keepdims)
+
     def argsort(self, axis=-1, ascending=True, stable=False, kind=None, order=None):
         negaxis = -axis
         branch, depth = self.branch_depth
@@ -35,7 +35,11 @@ class ListOffsetArray(Content):
                     )
                 )
             )
-        if offsets.nplike.known_shape and not offsets.length >= 1:
+        if (
+            offsets.nplike.known_shape
+            and not offsets.is_virtual
+            and not offsets.length >= 1
+        ):
             raise ak._v2._util.error(
                 ValueError(
                     "{} len(offsets) ({}) must be >= 1".format(
@@ -2099,8 +2103,9 @@ class ListOffsetArray(Content):
             mini = starts_data.min()
             maxi = stops_data.max()
 
-        starts_data = starts_data - mini
-        stops_data = stops_data - mini
+        # Python ints: indexing NumPy arrays element by element is slow
+        starts_data = (starts_data - mini).tolist()
+        stops_data = (stops_data - mini).tolist()
 
         nextcontent = self._content._getitem_range(slice(mini, maxi))
 
@@ -2109,31 +2114,17 @@ class ListOffsetArray(Content):
                 None if json_conversions is None else json_conversions["convert_bytes"]
             )
             content = ak._v2._util.tobytes(nextcontent.data)
-            out = [None] * starts.length
-            if convert_bytes is None:
-                for i in range(starts.length):
-                    out[i] = content[starts_data[i] : stops_data[i]]
-            else:
-                for i in range(starts.length):
-                    out[i] = convert_bytes(content[starts_data[i] : stops_data[i]])
+            out = [content[start:stop] for start, stop in zip(starts_data, stops_data)]
+            if convert_bytes is not None:
+                out = [convert_bytes(x) for x in out]
             return out
 
         elif self.parameter("__array__") == "string":
-            data = nextcontent.data
-            if hasattr(data, "tobytes"):
-
-                def tostring(x):
-                    return x.tobytes().decode(errors="surrogateescape")
-
-            else:
-
-                def tostring(x):
-                    return x.tostring().decode(errors="surrogateescape")
-
-            out = [None] * starts.length
-            for i in range(starts.length):
-                out[i] = tostring(data[starts_data[i] : stops_data[i]])
-            return out
+            content = ak._v2._util.tobytes(nextcontent.data)
+            return [
+                content[start:stop].decode(errors="surrogateescape")
+                for start, stop in zip(starts_data, stops_data)
+            ]
 
         else:
             out = self._to_list_custom(behavior, json_conversions)
@@ -2141,11 +2132,7 @@ class ListOffsetArray(Content):
                 return out
 
             content = nextcontent._to_list(behavior, json_conversions)
-            out = [None] * starts.length
-
-            for i in range(starts.length):
-                out[i] = content[starts_data[i] : stops_data[i]]
-            return out
+            return [content[start:stop] for start, stop in zip(starts_data, stops_data)]
 
     def _to_nplike(self, nplike):
         offsets = self._offsets._to_nplike(nplike)
@@ -19,10 +19,14 @@ class NumpyArray(Content):
             nplike = ak.nplike.of(data)
         if isinstance(data, ak._v2.index.Index):
             data = data.data
-        self._data = nplike.asarray(data)
+        if isinstance(data, ak._v2._virtual.VirtualBuffer):
+            # self._data is generated on first access; see __getattr__
+            self._virtual = data
+        else:
+            self._data = nplike.asarray(data)
 
-        ak._v2.types.numpytype.dtype_to_primitive(self._data.dtype)
-        if len(self._data.shape) == 0:
+        ak._v2.types.numpytype.dtype_to_primitive(self.dtype)
+        if not self.is_virtual and len(self._data.shape) == 0:
             raise ak._v2._util.error(
                 TypeError(
                     "{} 'data' must be an array, not {}".format(
@@ -33,16 +37,31 @@ class NumpyArray(Content):
 
         self._init(identifier, parameters, nplike)
 
+    def __getattr__(self, name):
+        # only reached if self._data has not been set: it's a VirtualBuffer
+        if name == "_data" and "_virtual" in self.__dict__:
+            self._data = self._virtual.materialize()
+            return self._data
+        raise ak._v2._util.error(AttributeError(name))
+
+    @property
+    def is_virtual(self):
+        return "_data" not in self.__dict__
+
     @property
     def data(self):
         return self._data
 
     @property
     def shape(self):
+        if self.is_virtual:
+            return self._virtual.shape
         return self._data.shape
 
     @property
     def inner_shape(self):
+        if self.is_virtual:
+            return self._virtual.inner_shape
         return self._data.shape[1:]
 
     @property
@@ -51,6 +70,8 @@ class NumpyArray(Content):
 
     @property
     def dtype(self):
+        if self.is_virtual:
+            return self._virtual.dtype
         return self._data.dtype
 
     @property
@@ -69,14 +90,16 @@ class NumpyArray(Content):
             )
 
     def raw(self, nplike):
+        if self.is_virtual:
+            return self._virtual.raw(nplike)
         return self.nplike.raw(self.data, nplike)
 
     Form = NumpyForm
 
     def _form_with_key(self, getkey):
         return self.Form(
-            ak._v2.types.numpytype.dtype_to_primitive(self._data.dtype),
-            self._data.shape[1:],
+            ak._v2.types.numpytype.dtype_to_primitive(self.dtype),
+            self.inner_shape,
             has_identifier=self._identifier is not None,
             parameters=self._parameters,
             form_key=getkey(self),
@@ -99,6 +122,8 @@ class NumpyArray(Content):
 
     @property
     def length(self):
+        if self.is_virtual:
+            return self._virtual.length
         return self._data.shape[0]
 
     def _forget_length(self):
@@ -38,7 +38,11 @@ class RecordArray(Content):
         if not isinstance(contents, list):
             contents = list(contents)
 
-        if len(contents) == 0 and length is None:
+        if callable(length):
+            # computed on first use, for arrays whose buffers are read on
+            # demand; the contents' lengths are not checked against it
+            pass
+        elif len(contents) == 0 and length is None:
             raise ak._v2._util.error(
                 TypeError(
                     "{} if len(contents) == 0, a 'length' must be specified".format(
@@ -54,8 +58,10 @@ class RecordArray(Content):
                 length = ak._v2._typetracer.UnknownLength
             else:
                 length = min(lengths)
-        if not isinstance(length, ak._v2._typetracer.UnknownLengthType) and not (
-            ak._util.isint(length) and length >= 0
+        if (
+            not callable(length)
+            and not isinstance(length, ak._v2._typetracer.UnknownLengthType)
+            and not (ak._util.isint(length) and length >= 0)
         ):
             raise ak._v2._util.error(
                 TypeError(
@@ -73,7 +79,7 @@ class RecordArray(Content):
                         )
                     )
                 )
-            if content.length < length:
+            if not callable(length) and content.length < length:
                 raise ak._v2._util.error(
                     ValueError(
                         "{} len(content) ({}) must be >= length ({}) for all 'contents'".format(
@@ -129,7 +135,10 @@ class RecordArray(Content):
 
         self._contents = contents
         self._fields = fields
-        self._length = length
+        if callable(length):
+            self._length_generator = length
+        else:
+            self._length = length
         self._init(identifier, parameters, nplike)
 
     @property
@@ -1023,22 +1032,24 @@ class RecordArray(Content):
 
         if self.is_tuple and json_conversions is None:
             contents = [x._to_list(behavior, json_conversions) for x in self._contents]
-            length = self._length
-            out = [None] * length
-            for i in range(length):
-                out[i] = tuple(x[i] for x in contents)
-            return out
+            if len(contents) == 0:
+                return [()] * self._length
+            return list(zip(*self._to_list_columns(contents)))
 
         else:
             fields = self._fields
             if fields is None:
                 fields = [str(i) for i in range(len(self._contents))]
             contents = [x._to_list(behavior, json_conversions) for x in self._contents]
-            length = self._length
-            out = [None] * length
-            for i in range(length):
-                out[i] = dict(zip(fields, [x[i] for x in contents]))
-            return out
+            if len(contents) == 0:
+                return [{} for _ in range(self._length)]
+            return [
+                dict(zip(fields, values))
+                for values in zip(*self._to_list_columns(contents))
+            ]
+
+    def _to_list_columns(self, contents):
+        return [x if len(x) == self._length else x[: self._length] for x in contents]
 
     def _to_nplike(self, nplike):
         contents = [content._to_nplike(nplike) for content in self._contents]
@@ -43,7 +43,9 @@ class RegularArray(Content):
                 )
             else:
                 size = int(size)
-        if not isinstance(zeros_length, ak._v2._typetracer.UnknownLengthType):
+        if not callable(zeros_length) and not isinstance(
+            zeros_length, ak._v2._typetracer.UnknownLengthType
+        ):
             if not (ak._v2._util.isint(zeros_length) and zeros_length >= 0):
                 raise ak._v2._util.error(
                     TypeError(
@@ -57,7 +59,13 @@ class RegularArray(Content):
 
         self._content = content
         self._size = size
-        if size != 0:
+        if callable(zeros_length):
+            # computed on first use, for arrays whose buffers are read on demand
+            if size != 0:
+                self._length_generator = lambda: content.length // size
+            else:
+                self._length_generator = zeros_length
+        elif size != 0:
             self._length = content.length // size  # floor division
         else:
             self._length = zeros_length
@@ -1225,32 +1233,18 @@ class RegularArray(Content):
             )
             content = ak._v2._util.tobytes(self._content.data)
             length, size = self._length, self._size
-            out = [None] * length
-            if convert_bytes is None:
-                for i in range(length):
-                    out[i] = content[(i) * size : (i + 1) * size]
-            else:
-                for i in range(length):
-                    out[i] = convert_bytes(content[(i) * size : (i + 1) * size])
+            out = [content[i * size : (i + 1) * size] for i in range(length)]
+            if convert_bytes is not None:
+                out = [convert_bytes(x) for x in out]
             return out
 
         elif self.parameter("__array__") == "string":
-            data = self._content.data
-            if hasattr(data, "tobytes"):
-
-                def tostring(x):
-                    return x.tobytes().decode(errors="surrogateescape")
-
-            else:
-
-                def tostring(x):
-                    return x.tostring().decode(errors="surrogateescape")
-
+            content = ak._v2._util.tobytes(self._content.data)
             length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = tostring(data[(i) * size : (i + 1) * size])
-            return out
+            return [
+                content[i * size : (i + 1) * size].decode(errors="surrogateescape")
+                for i in range(length)
+            ]
 
         else:
             out = self._to_list_custom(behavior, json_conversions)
@@ -1259,10 +1253,7 @@ class RegularArray(Content):
 
             content = self._content._to_list(behavior, json_conversions)
             length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = content[(i) * size : (i + 1) * size]
-            return out
+            return [content[i * size : (i + 1) * size] for i in range(length)]
 
     def _to_nplike(self, nplike):
         content = self._content._to_nplike(nplike)
@@ -1,6 +1,8 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import copyreg
 import io
+import pickle
 import sys
 import re
 import keyword
@@ -18,6 +20,21 @@ numpy = ak.nplike.Numpy.instance()
 _dir_pattern = re.compile(r"^[a-zA-Z_]\w*$")
 
 
+def _reduce_out_of_band(obj, state):
+    # with pickle protocol 5, buffers are passed as PickleBuffers, which a
+    # buffer_callback can take without copying them into the pickle stream
+    form, length, container = state[:3]
+    container = {
+        key: pickle.PickleBuffer(numpy.ascontiguousarray(buffer))
+        for key, buffer in container.items()
+    }
+    return (
+        copyreg.__newobj__,
+        (type(obj),),
+        (form, length, container) + tuple(state[3:]),
+    )
+
+
 class Array(NDArrayOperatorsMixin, Iterable, Sized):
     """
     Args:
@@ -1346,6 +1363,11 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
             behavior = self._behavior
         return form, length, container, behavior
 
+    def __reduce_ex__(self, protocol):
+        if protocol < 5:
+            return super().__reduce_ex__(protocol)
+        return _reduce_out_of_band(self, self.__getstate__())
+
     def __setstate__(self, state):
         if isinstance(state[1], dict):
             raise ak._v2._util.error(
@@ -1934,6 +1956,11 @@ class Record(NDArrayOperatorsMixin):
             behavior = self._behavior
         return form, length, container, behavior, packed.at
 
+    def __reduce_ex__(self, protocol):
+        if protocol < 5:
+            return super().__reduce_ex__(protocol)
+        return _reduce_out_of_band(self, self.__getstate__())
+
     def __setstate__(self, state):
         if isinstance(state[1], dict):
             raise ak._v2._util.error(
@@ -2011,6 +2038,9 @@ class ArrayBuilder(Sized):
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        form (None, #ak.forms.Form, or its dict/JSON string): If not None,
+            the type of the data is fixed to this Form and no type discovery
+            is performed (see below).
 
     General tool for building arrays of nested data structures from a sequence
     of commands. Most data types can be constructed by calling commands in the
@@ -2121,10 +2151,27 @@ class ArrayBuilder(Sized):
     Note that this is a *general* method for building arrays; if the type is
     known in advance, more specialized procedures can be faster. This should
     be considered the "least effort" approach.
+
+    If the type is known in advance, pass it as a `form`. The ArrayBuilder
+    can then only be filled with #append and #extend (not the individual
+    commands, and not in Numba), and each object must match the Form: #append
+    raises ValueError for an object that doesn't. The objects are converted
+    column by column in batches (see #ak.from_iter), which is much faster
+    than type discovery.
+
+        >>> builder = ak.ArrayBuilder(form=ak.forms.from_json(
+        ...     '{"class": "RecordArray", "contents": {"x": "float64", "y": "int64"}}'
+        ... ))
+        >>> for message in queue:
+        ...     builder.append(message)
+        >>> builder.snapshot()
     """
 
-    def __init__(self, behavior=None, initial=1024, resize=1.5):
-        self._layout = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+    def __init__(self, behavior=None, initial=1024, resize=1.5, form=None):
+        if form is None:
+            self._layout = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+        else:
+            self._layout = ak._v2._typedbuilder.TypedBuilder(form, initial, resize)
         self.behavior = behavior
 
     @classmethod
@@ -2291,6 +2338,11 @@ class ArrayBuilder(Sized):
         """
         ak._v2.numba.register_and_check()
 
+        if isinstance(self._layout, ak._v2._typedbuilder.TypedBuilder):
+            raise ak._v2._util.error(
+                TypeError("an ArrayBuilder with a form can't be used in Numba")
+            )
+
         return ak._v2._connect.numba.builder.ArrayBuilderType(self._behavior)
 
     def __bool__(self):
@@ -2530,8 +2582,11 @@ class ArrayBuilder(Sized):
 
         Appends every value from `obj`.
         """
-        for x in obj:
-            self._layout.fromiter(x)
+        if isinstance(self._layout, ak._v2._typedbuilder.TypedBuilder):
+            self._layout.extend(obj)
+        else:
+            for x in obj:
+                self._layout.fromiter(x)
 
     class _Nested:
         def __init__(self, arraybuilder):
@@ -21,30 +21,44 @@ class Index:
             nplike = ak.nplike.of(data)
         self._nplike = nplike
         self._metadata = metadata
-        self._data = self._nplike.asarray(data, dtype=self._expected_dtype, order="C")
-        if len(self._data.shape) != 1:
-            raise ak._v2._util.error(TypeError("Index data must be one-dimensional"))
+        if isinstance(data, ak._v2._virtual.VirtualBuffer):
+            # self._data is generated on first access; see __getattr__
+            self._virtual = data
+            dtype = data.dtype
+            if len(data.inner_shape) != 0:
+                raise ak._v2._util.error(
+                    TypeError("Index data must be one-dimensional")
+                )
+        else:
+            self._data = self._nplike.asarray(
+                data, dtype=self._expected_dtype, order="C"
+            )
+            dtype = self._data.dtype
+            if len(self._data.shape) != 1:
+                raise ak._v2._util.error(
+                    TypeError("Index data must be one-dimensional")
+                )
 
         if self._expected_dtype is None:
-            if self._data.dtype == np.dtype(np.int8):
+            if dtype == np.dtype(np.int8):
                 self.__class__ = Index8
-            elif self._data.dtype == np.dtype(np.uint8):
+            elif dtype == np.dtype(np.uint8):
                 self.__class__ = IndexU8
-            elif self._data.dtype == np.dtype(np.int32):
+            elif dtype == np.dtype(np.int32):
                 self.__class__ = Index32
-            elif self._data.dtype == np.dtype(np.uint32):
+            elif dtype == np.dtype(np.uint32):
                 self.__class__ = IndexU32
-            elif self._data.dtype == np.dtype(np.int64):
+            elif dtype == np.dtype(np.int64):
                 self.__class__ = Index64
             else:
                 raise ak._v2._util.error(
                     TypeError(
                         "Index data must be int8, uint8, int32, uint32, int64, not "
-                        + repr(self._data.dtype)
+                        + repr(dtype)
                     )
                 )
         else:
-            if self._data.dtype != self._expected_dtype:
+            if dtype != self._expected_dtype:
                 # self._data = self._data.astype(self._expected_dtype)   # copy/convert
                 raise ak._v2._util.error(
                     NotImplementedError(
@@ -64,6 +78,17 @@ class Index:
             dtype = cls._expected_dtype
         return Index(nplike.empty(length, dtype=dtype), nplike=nplike)
 
+    def __getattr__(self, name):
+        # only reached if self._data has not been set: it's a VirtualBuffer
+        if name == "_data" and "_virtual" in self.__dict__:
+            self._data = self._virtual.materialize()
+            return self._data
+        raise ak._v2._util.error(AttributeError(name))
+
+    @property
+    def is_virtual(self):
+        return "_data" not in self.__dict__
+
     @property
     def data(self):
         return self._data
@@ -74,6 +99,8 @@ class Index:
 
     @property
     def dtype(self):
+        if self.is_virtual:
+            return self._virtual.dtype
         return self._data.dtype
 
     @property
@@ -88,6 +115,8 @@ class Index:
 
     @property
     def length(self):
+        if self.is_virtual:
+            return self._virtual.length
         return self._data.shape[0]
 
     def forget_length(self):
@@ -99,6 +128,8 @@ class Index:
         return type(self)(data.forget_length(), self._metadata, tt)
 
     def raw(self, nplike):
+        if self.is_virtual:
+            return self._virtual.raw(nplike)
         return self.nplike.raw(self.data, nplike)
 
     def __len__(self):
@@ -145,7 +176,7 @@ class Index:
 
     @property
     def form(self):
-        return _dtype_to_form[self._data.dtype]
+        return _dtype_to_form[self.dtype]
 
     def __getitem__(self, where):
         out = self._data[where]
@@ -16,6 +16,7 @@ from awkward._v2.operations.ak_copy import copy
 from awkward._v2.operations.ak_corr import corr
 from awkward._v2.operations.ak_count import count
 from awkward._v2.operations.ak_count_nonzero import count_nonzero
+from awkward._v2.operations.ak_describe import describe
 from awkward._v2.operations.ak_covar import covar
 from awkward._v2.operations.ak_fields import fields
 from awkward._v2.operations.ak_fill_none import fill_none
@@ -23,8 +24,10 @@ from awkward._v2.operations.ak_firsts import firsts
 from awkward._v2.operations.ak_flatten import flatten
 from awkward._v2.operations.ak_from_arrow import from_arrow
 from awkward._v2.operations.ak_from_arrow_schema import from_arrow_schema
+from awkward._v2.operations.ak_from_avro import from_avro
 from awkward._v2.operations.ak_from_buffers import from_buffers
 from awkward._v2.operations.ak_from_cupy import from_cupy
+from awkward._v2.operations.ak_from_file import from_file
 from awkward._v2.operations.ak_from_iter import from_iter
 from awkward._v2.operations.ak_from_jax import from_jax
 from awkward._v2.operations.ak_from_json_file import from_json_file
@@ -33,11 +36,14 @@ from awkward._v2.operations.ak_from_json_schema import from_json_schema
 from awkward._v2.operations.ak_from_numpy import from_numpy
 from awkward._v2.operations.ak_from_parquet import from_parquet
 from awkward._v2.operations.ak_from_regular import from_regular
+from awkward._v2.operations.ak_from_shared_memory import from_shared_memory
 from awkward._v2.operations.ak_full_like import full_like
 from awkward._v2.operations.ak_isclose import isclose
 from awkward._v2.operations.ak_is_none import is_none
 from awkward._v2.operations.ak_is_tuple import is_tuple
 from awkward._v2.operations.ak_is_valid import is_valid
+from awkward._v2.operations.ak_iter_json import iter_json
+from awkward._v2.operations.ak_iter_parquet import iter_parquet
 from awkward._v2.operations.ak_linear_fit import linear_fit
 from awkward._v2.operations.ak_local_index import local_index
 from awkward._v2.operations.ak_mask import mask
@@ -56,6 +62,10 @@ from awkward._v2.operations.ak_parameters import parameters
 from awkward._v2.operations.ak_prod import prod, nanprod
 from awkward._v2.operations.ak_ptp import ptp
 from awkward._v2.operations.ak_ravel import ravel
+from awkward._v2.operations.ak_reducer_threads import (
+    reducer_threads,
+    set_reducer_threads,
+)
 from awkward._v2.operations.ak_run_lengths import run_lengths
 from awkward._v2.operations.ak_singletons import singletons
 from awkward._v2.operations.ak_softmax import softmax
@@ -69,14 +79,19 @@ from awkward._v2.operations.ak_to_backend import to_backend
 from awkward._v2.operations.ak_to_buffers import to_buffers
 from awkward._v2.operations.ak_to_cupy import to_cupy
 from awkward._v2.operations.ak_to_jax import to_jax
+from awkward._v2.operations.ak_to_file import to_file
 from awkward._v2.operations.ak_to_json import to_json
 from awkward._v2.operations.ak_to_layout import to_layout
 from awkward._v2.operations.ak_to_list import to_list
 from awkward._v2.operations.ak_to_numpy import to_numpy
 from awkward._v2.operations.ak_to_pandas import to_pandas
-from awkward._v2.operations.ak_to_parquet import to_parquet
+from awkward._v2.operations.ak_to_parquet import to_parquet, ParquetWriter
 from awkward._v2.operations.ak_to_rdataframe import to_rdataframe
 from awkward._v2.operations.ak_to_regular import to_regular
+from awkward._v2.operations.ak_to_shared_memory import (
+    to_shared_memory,
+    SharedMemoryHandle,
+)
 from awkward._v2.operations.ak_type import type
 from awkward._v2.operations.ak_unflatten import unflatten
 from awkward._v2.operations.ak_unzip import unzip
@@ -6,7 +6,14 @@ np = ak.nplike.NumpyMetadata.instance()
 
 
 # @ak._v2._connect.numpy.implements("all")
-def all(array, axis=None, keepdims=False, mask_identity=False, flatten_records=False):
+def all(
+    array,
+    axis=None,
+    keepdims=False,
+    mask_identity=False,
+    flatten_records=False,
+    num_threads=None,
+):
     """
     Args:
         array: Array-like data (anything #ak.to_layout recognizes).
@@ -24,6 +31,10 @@ def all(array, axis=None, keepdims=False, mask_identity=False, flatten_records=F
             results in the operation's identity.
         flatten_records (bool): If True, axis=None combines fields from different
             records; otherwise, records raise an error.
+        num_threads (None or int): Number of threads that the reduction is
+            split across (groups of lists are reduced in parallel); if None,
+            the number set by #ak.reducer_threads or #ak.set_reducer_threads
+            (initially 1) is used.
 
     Returns True in each group of elements from `array` (many types supported,
     including all Awkward Arrays and Records) if all values are True; False
@@ -45,9 +56,11 @@ def all(array, axis=None, keepdims=False, mask_identity=False, flatten_records=F
             keepdims=keepdims,
             mask_identity=mask_identity,
             flatten_records=flatten_records,
+            num_threads=num_threads,
         ),
     ):
-        return _impl(array, axis, keepdims, mask_identity, flatten_records)
+        with ak._v2._reducers.threads(num_threads):
+            return _impl(array, axis, keepdims, mask_identity, flatten_records)
 
 
 def _impl(array, axis, keepdims, mask_identity, flatten_records):
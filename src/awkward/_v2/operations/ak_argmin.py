@@ -6,7 +6,14 @@ np = ak.nplike.NumpyMetadata.instance()
 
 
 # @ak._v2._connect.numpy.implements("argmin")
-def argmin(array, axis=None, keepdims=False, mask_identity=True, flatten_records=False):
+def argmin(
+    array,
+    axis=None,
+    keepdims=False,
+    mask_identity=True,
+    flatten_records=False,
+    num_threads=None,
+):
     """
     Args:
         array: Array-like data (anything #ak.to_layout recognizes).
@@ -24,6 +31,10 @@ def argmin(array, axis=None, keepdims=False, mask_identity=True, flatten_records
             results in the operation's identity.
         flatten_records (bool): If True, axis=None combines fields from different
             records; otherwise, records raise an error.
+        num_threads (None or int): Number of threads that the reduction is
+            split across (groups of lists are reduced in parallel); if None,
+            the number set by #ak.reducer_threads or #ak.set_reducer_threads
+            (initially 1) is used.
 
     Returns the index position of the minimum value in each group of elements
     from `array` (many types supported, including all Awkward Arrays and
@@ -52,14 +63,21 @@ def argmin(array, axis=None, keepdims=False, mask_identity=True, flatten_records
             keepdims=keepdims,
             mask_identity=mask_identity,
             flatten_records=flatten_records,
+            num_threads=num_threads,
         ),
     ):
-        return _impl(array, axis, keepdims, mask_identity, flatten_records)
+        with ak._v2._reducers.threads(num_threads):
+            return _impl(array, axis, keepdims, mask_identity, flatten_records)
 
 
 # @ak._v2._connect.numpy.implements("nanargmin")
 def nanargmin(
-    array, axis=None, keepdims=False, mask_identity=True, flatten_records=False
+    array,
+    axis=None,
+    keepdims=False,
+    mask_identity=True,
+    flatten_records=False,
+    num_threads=None,
 ):
     """
     Args:
@@ -78,6 +96,10 @@ def nanargmin(
             results in the operation's identity.
         flatten_records (bool): If True, axis=None combines fields from different
             records; otherwise, records raise an error.
+        num_threads (None or int): Number of threads that the reduction is
+            split across (groups of lists are reduced in parallel); if None,
+            the number set by #ak.reducer_threads or #ak.set_reducer_threads
+            (initially 1) is used.
 
     Like #ak.argmin, but treating NaN ("not a number") values as missing.
 
@@ -97,11 +119,13 @@ def nanargmin(
             keepdims=keepdims,
             mask_identity=mask_identity,
             flatten_records=flatten_records,
+            num_threads=num_threads,
         ),
     ):
         array = ak._v2.operations.ak_nan_to_none._impl(array, False, None)
 
-        return _impl(array, axis, keepdims, mask_identity, flatten_records)
+        with ak._v2._reducers.threads(num_threads):
+            return _impl(array, axis, keepdims, mask_identity, flatten_records)
 
 
 def _impl(array, axis, keepdims, mask_identity, flatten_records):
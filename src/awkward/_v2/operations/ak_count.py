@@ -5,7 +5,14 @@ import awkward as ak
 np = ak.nplike.NumpyMetadata.instance()
 
 
-def count(array, axis=None, keepdims=False, mask_identity=False, flatten_records=False):
+def count(
+    array,
+    axis=None,
+    keepdims=False,
+    mask_identity=False,
+    flatten_records=False,
+    num_threads=None,
+):
     """
     Args:
         array: Array-like data (anything #ak.to_layout recognizes).
@@ -23,6 +30,10 @@ def count(array, axis=None, keepdims=False, mask_identity=False, flatten_records
             results in the operation's identity.
         flatten_records (bool): If True, axis=None combines fields from different
             records; otherwise, records raise an error.
+        num_threads (None or int): Number of threads that the reduction is
+            split across (groups of lists are reduced in parallel); if None,
+            the number set by #ak.reducer_threads or #ak.set_reducer_threads
+            (initially 1) is used.
 
     Counts elements of `array` (many types supported, including all
     Awkward Arrays and Records). The identity of counting is `0` and it is
@@ -87,9 +98,11 @@ def count(array, axis=None, keepdims=False, mask_identity=False, flatten_records
             keepdims=keepdims,
             mask_identity=mask_identity,
             flatten_records=flatten_records,
+            num_threads=num_threads,
         ),
     ):
-        return _impl(array, axis, keepdims, mask_identity, flatten_records)
+        with ak._v2._reducers.threads(num_threads):
+            return _impl(array, axis, keepdims, mask_identity, flatten_records)
 
 
 def _impl(array, axis, keepdims, mask_identity, flatten_records):
@@ -7,7 +7,12 @@ np = ak.nplike.NumpyMetadata.instance()
 
 # @ak._v2._connect.numpy.implements("count_nonzero")
 def count_nonzero(
-    array, axis=None, keepdims=False, mask_identity=False, flatten_records=False
+    array,
+    axis=None,
+    keepdims=False,
+    mask_identity=False,
+    flatten_records=False,
+    num_threads=None,
 ):
     """
     Args:
@@ -26,6 +31,10 @@ def count_nonzero(
             results in the operation's identity.
         flatten_records (bool): If True, axis=None combines fields from different
             records; otherwise, records raise an error.
+        num_threads (None or int): Number of threads that the reduction is
+            split across (groups of lists are reduced in parallel); if None,
+            the number set by #ak.reducer_threads or #ak.set_reducer_threads
+            (initially 1) is used.
 
     Counts nonzero elements of `array` (many types supported, including all
     Awkward Arrays and Records). The identity of counting is `0` and it is
@@ -49,9 +58,11 @@ def count_nonzero(
             keepdims=keepdims,
             mask_identity=mask_identity,
             flatten_records=flatten_records,
+            num_threads=num_threads,
         ),
     ):
-        return _impl(array, axis, keepdims, mask_identity, flatten_records)
+        with ak._v2._reducers.threads(num_threads):
+            return _impl(array, axis, keepdims, mask_identity, flatten_records)
 
 
 def _impl(array, axis, keepdims, mask_identity, flatten_records):
@@ -0,0 +1,110 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def describe(
+    x,
+    ddof=0,
+    axis=None,
+    keepdims=False,
+    mask_identity=True,
+    flatten_records=False,
+):
+    """
+    Args:
+        x: The data on which to compute the statistics (anything #ak.to_layout
+            recognizes).
+        ddof (int): "delta degrees of freedom": the divisor used in the
+            calculation of `var` and `std` is `count - ddof`.
+        axis (None or int): If None, combine all values from the array into
+            a single scalar result; if an int, group by that axis: `0` is the
+            outermost, `1` is the first level of nested lists, etc., and
+            negative `axis` counts from the innermost: `-1` is the innermost,
+            `-2` is the next level up, etc.
+        keepdims (bool): If False, this function decreases the number of
+            dimensions by 1; if True, the output values are wrapped in a new
+            length-1 dimension so that the result of this operation may be
+            broadcasted with the original array.
+        mask_identity (bool): If True, the application of this function on
+            empty lists results in None (an option type); otherwise, the
+            calculation is followed through with the reducers' identities,
+            usually resulting in floating-point `nan`.
+        flatten_records (bool): If True, axis=None combines fields from different
+            records; otherwise, records raise an error.
+
+    Computes summary statistics in each group of elements from `x`, returning
+    records with fields
+
+       * `count`: number of values, as in #ak.count;
+       * `sum`: sum of the values, as in #ak.sum;
+       * `sum2`: sum of the squares of the values;
+       * `mean`: `sum / count`, as in #ak.mean;
+       * `var`: variance about the mean, as in #ak.var;
+       * `std`: square root of `var`, as in #ak.std;
+       * `min`: minimum value, as in #ak.min;
+       * `max`: maximum value, as in #ak.max.
+
+    The grouping is performed the same way as for reducers, but the nested
+    lists are only traversed once to find the groups for all of the
+    statistics, rather than once for each reducer; each statistic is then
+    one kernel pass over the values. With an `array` like
+
+        ak.Array([[0, 1, 2, 3],
+                  [          ],
+                  [4, 5      ]])
+
+    the statistics of the innermost lists are
+
+        >>> ak.describe(array, axis=-1).tolist()
+        [{'count': 4, 'sum': 6, 'sum2': 14, 'mean': 1.5, 'var': 1.25,
+          'std': 1.118033988749895, 'min': 0, 'max': 3},
+         None,
+         {'count': 2, 'sum': 9, 'sum2': 41, 'mean': 4.5, 'var': 0.25,
+          'std': 0.5, 'min': 4, 'max': 5}]
+
+    See #ak.sum for a complete description of handling nested lists and
+    missing values (None) in reducers.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.describe",
+        dict(
+            x=x,
+            ddof=ddof,
+            axis=axis,
+            keepdims=keepdims,
+            mask_identity=mask_identity,
+            flatten_records=flatten_records,
+        ),
+    ):
+        return _impl(x, ddof, axis, keepdims, mask_identity, flatten_records)
+
+
+def _impl(x, ddof, axis, keepdims, mask_identity, flatten_records):
+    layout = ak._v2.operations.to_layout(x, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(x)
+
+    if axis is None:
+        flat = layout.completely_flatten(
+            function_name="ak.describe", flatten_records=flatten_records
+        )
+        if len(flat) == 0:
+            data = layout.nplike.empty(0, np.float64)
+        elif len(flat) == 1:
+            data = flat[0]
+        else:
+            data = layout.nplike.concatenate(flat)
+        layout = ak._v2.contents.NumpyArray(data, nplike=layout.nplike)
+        out = layout.describe(axis=-1, mask=mask_identity, keepdims=False, ddof=ddof)
+
+    else:
+        out = layout.describe(
+            axis=axis, mask=mask_identity, keepdims=keepdims, ddof=ddof
+        )
+
+    if isinstance(out, (ak._v2.contents.Content, ak._v2.record.Record)):
+        return ak._v2._util.wrap(out, behavior)
+    else:
+        return out
@@ -0,0 +1,152 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numpy
+
+import awkward as ak
+
+
+def from_avro(source, num_threads=None, highlevel=True, behavior=None):
+    """
+    Args:
+        source (str, path-like, bytes-like, or file-like object): Avro object
+            container file to read. A filename is memory-mapped; a file-like
+            object is read in full.
+        num_threads (None or int): If greater than 1, the file's blocks are
+            split into this many groups, which are decompressed and decoded
+            in a thread pool; the decoded buffers are then concatenated.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Reads an Avro object container file into an Awkward Array.
+
+    The file's Avro schema is translated into an #ak.forms.Form and an
+    AwkwardForth program (see #ak.forth.ForthMachine64) that decodes objects
+    of that schema directly into the Form's buffers, so that no Python objects
+    are created for the data. Each block is decompressed with the file's codec
+    ("null", "deflate", "bzip2", "xz", and if python-snappy or zstandard is
+    installed, "snappy" or "zstandard") independently of the others.
+
+    The Avro types are converted as follows:
+
+      * boolean, int, long, float, double: booleans, int32, int64, float32,
+        float64 (logical types, such as dates, are not interpreted);
+      * string and bytes: strings and bytestrings;
+      * fixed: regular-length bytestrings;
+      * enum: categorical strings (see #ak.behaviors.categorical);
+      * array: variable-length lists;
+      * map: variable-length lists of records with fields `"key"` and
+        `"value"`;
+      * record: records;
+      * union: union types, or option types if one of the possibilities
+        is null.
+
+    Recursively defined types are not supported.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.from_avro",
+        dict(
+            source=source,
+            num_threads=num_threads,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(source, num_threads, highlevel, behavior)
+
+
+def _impl(source, num_threads, highlevel, behavior):
+    import awkward._v2._connect.avro
+
+    if num_threads is not None and not (
+        ak._v2._util.isint(num_threads) and num_threads > 0
+    ):
+        raise ak._v2._util.error(
+            TypeError("num_threads must be None or a positive integer")
+        )
+
+    if ak._v2._util.isstr(source) or hasattr(source, "__fspath__"):
+        data = numpy.memmap(source, dtype=numpy.uint8, mode="r")
+    elif hasattr(source, "read"):
+        data = numpy.frombuffer(source.read(), dtype=numpy.uint8)
+    else:
+        data = numpy.frombuffer(source, dtype=numpy.uint8)
+
+    schema, codec, sync, pos = awkward._v2._connect.avro.read_header(data)
+    blocks = awkward._v2._connect.avro.read_blocks(data, pos, sync)
+    generator = awkward._v2._connect.avro.ForthGenerator(schema)
+
+    if num_threads is None or num_threads == 1 or len(blocks) <= 1:
+        outputs, _ = _decode(generator, codec, data, blocks)
+
+    else:
+        import concurrent.futures
+
+        groups = _split(blocks, num_threads)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [
+                executor.submit(_decode, generator, codec, data, group)
+                for group in groups
+            ]
+            parts = [future.result() for future in futures]
+        outputs = awkward._v2._connect.avro.concatenate_outputs(generator, parts)
+
+    container = dict(generator.constants)
+    container.update(outputs)
+    return ak._v2.operations.ak_from_buffers._impl(
+        generator.form,
+        sum(num_items for num_items, _, _ in blocks),
+        container,
+        "{form_key}-{attribute}",
+        ak.nplike.Numpy.instance(),
+        False,
+        highlevel,
+        behavior,
+    )
+
+
+def _split(blocks, num_groups):
+    # contiguous groups with roughly equal numbers of (compressed) bytes
+    total = sum(stop - start for _, start, stop in blocks)
+    groups = [[]]
+    sofar = 0
+    for block in blocks:
+        if sofar >= total * len(groups) / num_groups:
+            groups.append([])
+        groups[-1].append(block)
+        sofar += block[2] - block[1]
+    return groups
+
+
+def _decode(generator, codec, data, blocks):
+    import awkward._v2._connect.avro
+    import awkward.forth
+
+    length = sum(num_items for num_items, _, _ in blocks)
+    stream = numpy.concatenate(
+        [numpy.empty(0, numpy.uint8)]
+        + [
+            numpy.frombuffer(
+                awkward._v2._connect.avro.decompress(codec, data[start:stop]),
+                dtype=numpy.uint8,
+            )
+            for _, start, stop in blocks
+        ]
+    )
+
+    machine = awkward.forth.ForthMachine64(generator.source)
+    machine.begin({"stream": stream})
+    machine.stack_push(length)
+    machine.resume()
+    if machine.input_position("stream") != len(stream):
+        raise ak._v2._util.error(
+            ValueError(
+                "Avro data do not match the schema: {} of {} bytes decoded".format(
+                    machine.input_position("stream"), len(stream)
+                )
+            )
+        )
+
+    outputs = {name: numpy.asarray(machine[name]) for name in machine.outputs}
+    return outputs, machine.variables
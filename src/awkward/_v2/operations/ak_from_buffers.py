@@ -14,6 +14,7 @@ def from_buffers(
     container,
     buffer_key="{form_key}-{attribute}",
     nplike=numpy,
+    lazy=False,
     highlevel=True,
     behavior=None,
 ):
@@ -34,6 +35,9 @@ def from_buffers(
             put into the new array. The default, #ak.nplike.Numpy, makes NumPy
             arrays, which are in main memory (e.g. not GPU). If all the values in
             `container` have the same `nplike` as this, they won't be copied.
+        lazy (bool): If True, buffers are only read from the `container` when
+            an operation needs their values; if False, all buffers are read
+            immediately.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -56,6 +60,15 @@ def from_buffers(
 
     The `buffer_key` should be the same as the one used in #ak.to_buffers.
 
+    If `lazy=True`, the array's Form, type, length, and fields can be queried
+    without calling the `container`'s `__getitem__`: each buffer is requested
+    from the `container` the first time an operation reads it, and is kept
+    for the lifetime of the array. For instance, if `container` fetches each
+    buffer from a file, selecting and computing on one field of a large
+    record reads only the buffers of that field. Lengths of nested nodes are
+    determined when first needed, by reading the `offsets` (or other index)
+    of the node that contains them, but not the data.
+
     See #ak.to_buffers for examples.
     """
     with ak._v2._util.OperationErrorContext(
@@ -66,14 +79,17 @@ def from_buffers(
             container=container,
             buffer_key=buffer_key,
             nplike=nplike,
+            lazy=lazy,
             highlevel=highlevel,
             behavior=behavior,
         ),
     ):
-        return _impl(form, length, container, buffer_key, nplike, highlevel, behavior)
+        return _impl(
+            form, length, container, buffer_key, nplike, lazy, highlevel, behavior
+        )
 
 
-def _impl(form, length, container, buffer_key, nplike, highlevel, behavior):
+def _impl(form, length, container, buffer_key, nplike, lazy, highlevel, behavior):
     if ak._v2._util.isstr(form):
         if ak._v2.types.numpytype.is_primitive(form):
             form = ak._v2.forms.NumpyForm(form)
@@ -111,7 +127,7 @@ def _impl(form, length, container, buffer_key, nplike, highlevel, behavior):
             )
         )
 
-    out = reconstitute(form, length, container, getkey, nplike)
+    out = reconstitute(form, length, container, getkey, nplike, lazy)
     return ak._v2._util.wrap(out, behavior, highlevel)
 
 
@@ -124,7 +140,47 @@ _index_to_dtype = {
 }
 
 
-def reconstitute(form, length, container, getkey, nplike):
+def _deferred(function):
+    result = []
+
+    def resolve():
+        if len(result) == 0:
+            result.append(function())
+        return result[0]
+
+    return resolve
+
+
+def _from_buffer(nplike, container, key, dtype, count, inner_shape, lazy):
+    def generate():
+        real_count = ak._v2._virtual.resolve_length(count)
+        real_length = real_count
+        for x in inner_shape:
+            real_length *= x
+        data = nplike.frombuffer(container[key], dtype=dtype, count=real_length)
+        if inner_shape != ():
+            if len(data) == 0:
+                data = data.reshape((real_count,) + inner_shape)
+            else:
+                data = data.reshape((-1,) + inner_shape)
+        return data
+
+    if lazy:
+        return ak._v2._virtual.VirtualBuffer(
+            nplike, count, inner_shape, dtype, generate
+        )
+    else:
+        return generate()
+
+
+def _values(buffer):
+    if isinstance(buffer, ak._v2._virtual.VirtualBuffer):
+        return buffer.materialize()
+    else:
+        return buffer
+
+
+def reconstitute(form, length, container, getkey, nplike, lazy=False):
     if form.has_identifier:
         raise ak._v2._util.error(
             NotImplementedError("ak.from_buffers for an array with an Identifier")
@@ -132,8 +188,21 @@ def reconstitute(form, length, container, getkey, nplike):
     else:
         identifier = None
 
+    def read(attribute, dtype, count, inner_shape=()):
+        return _from_buffer(
+            nplike, container, getkey(form, attribute), dtype, count, inner_shape, lazy
+        )
+
+    def later(function):
+        # a length that depends on buffer values is only computed if needed
+        if lazy:
+            return _deferred(function)
+        else:
+            return function()
+
     if isinstance(form, ak._v2.forms.EmptyForm):
-        if length != 0:
+        # a deferred length is not checked, since that would read a buffer
+        if not callable(length) and length != 0:
             raise ak._v2._util.error(
                 ValueError(f"EmptyForm node, but the expected length is {length}")
             )
@@ -141,31 +210,24 @@ def reconstitute(form, length, container, getkey, nplike):
 
     elif isinstance(form, ak._v2.forms.NumpyForm):
         dtype = ak._v2.types.numpytype.primitive_to_dtype(form.primitive)
-        raw_array = container[getkey(form, "data")]
-        real_length = length
-        for x in form.inner_shape:
-            real_length *= x
-        data = nplike.frombuffer(raw_array, dtype=dtype, count=real_length)
-        if form.inner_shape != ():
-            if len(data) == 0:
-                data = data.reshape((length,) + form.inner_shape)
-            else:
-                data = data.reshape((-1,) + form.inner_shape)
+        data = read("data", dtype, length, form.inner_shape)
         return ak._v2.contents.NumpyArray(data, identifier, form.parameters, nplike)
 
     elif isinstance(form, ak._v2.forms.UnmaskedForm):
-        content = reconstitute(form.content, length, container, getkey, nplike)
+        content = reconstitute(form.content, length, container, getkey, nplike, lazy)
         return ak._v2.contents.UnmaskedArray(content, identifier, form.parameters)
 
     elif isinstance(form, ak._v2.forms.BitMaskedForm):
-        raw_array = container[getkey(form, "mask")]
-        excess_length = int(math.ceil(length / 8.0))
-        mask = nplike.frombuffer(
-            raw_array, dtype=_index_to_dtype[form.mask], count=excess_length
-        )
+        if callable(length):
+            excess_length = _deferred(
+                lambda: int(math.ceil(ak._v2._virtual.resolve_length(length) / 8.0))
+            )
+        else:
+            excess_length = int(math.ceil(length / 8.0))
+        mask = read("mask", _index_to_dtype[form.mask], excess_length)
         return ak._v2.contents.BitMaskedArray(
             ak._v2.index.Index(mask),
-            reconstitute(form.content, length, container, getkey, nplike),
+            reconstitute(form.content, length, container, getkey, nplike, lazy),
             form.valid_when,
             length,
             form.lsb_order,
@@ -174,80 +236,95 @@ def reconstitute(form, length, container, getkey, nplike):
         )
 
     elif isinstance(form, ak._v2.forms.ByteMaskedForm):
-        raw_array = container[getkey(form, "mask")]
-        mask = nplike.frombuffer(
-            raw_array, dtype=_index_to_dtype[form.mask], count=length
-        )
+        mask = read("mask", _index_to_dtype[form.mask], length)
         return ak._v2.contents.ByteMaskedArray(
             ak._v2.index.Index(mask),
-            reconstitute(form.content, length, container, getkey, nplike),
+            reconstitute(form.content, length, container, getkey, nplike, lazy),
             form.valid_when,
             identifier,
             form.parameters,
         )
 
     elif isinstance(form, ak._v2.forms.IndexedOptionForm):
-        raw_array = container[getkey(form, "index")]
-        index = nplike.frombuffer(
-            raw_array, dtype=_index_to_dtype[form.index], count=length
-        )
-        next_length = 0 if len(index) == 0 else max(0, nplike.max(index) + 1)
+        index = read("index", _index_to_dtype[form.index], length)
+
+        def next_length():
+            values = _values(index)
+            return 0 if len(values) == 0 else max(0, nplike.max(values) + 1)
+
         return ak._v2.contents.IndexedOptionArray(
             ak._v2.index.Index(index),
-            reconstitute(form.content, next_length, container, getkey, nplike),
+            reconstitute(
+                form.content, later(next_length), container, getkey, nplike, lazy
+            ),
             identifier,
             form.parameters,
         )
 
     elif isinstance(form, ak._v2.forms.IndexedForm):
-        raw_array = container[getkey(form, "index")]
-        index = nplike.frombuffer(
-            raw_array, dtype=_index_to_dtype[form.index], count=length
-        )
-        next_length = 0 if len(index) == 0 else nplike.max(index) + 1
+        index = read("index", _index_to_dtype[form.index], length)
+
+        def next_length():
+            values = _values(index)
+            return 0 if len(values) == 0 else nplike.max(values) + 1
+
         return ak._v2.contents.IndexedArray(
             ak._v2.index.Index(index),
-            reconstitute(form.content, next_length, container, getkey, nplike),
+            reconstitute(
+                form.content, later(next_length), container, getkey, nplike, lazy
+            ),
             identifier,
             form.parameters,
         )
 
     elif isinstance(form, ak._v2.forms.ListForm):
-        raw_array1 = container[getkey(form, "starts")]
-        raw_array2 = container[getkey(form, "stops")]
-        starts = nplike.frombuffer(
-            raw_array1, dtype=_index_to_dtype[form.starts], count=length
-        )
-        stops = nplike.frombuffer(
-            raw_array2, dtype=_index_to_dtype[form.stops], count=length
-        )
-        reduced_stops = stops[starts != stops]
-        next_length = 0 if len(starts) == 0 else nplike.max(reduced_stops)
+        starts = read("starts", _index_to_dtype[form.starts], length)
+        stops = read("stops", _index_to_dtype[form.stops], length)
+
+        def next_length():
+            starts_values, stops_values = _values(starts), _values(stops)
+            reduced_stops = stops_values[starts_values != stops_values]
+            return 0 if len(starts_values) == 0 else nplike.max(reduced_stops)
+
         return ak._v2.contents.ListArray(
             ak._v2.index.Index(starts),
             ak._v2.index.Index(stops),
-            reconstitute(form.content, next_length, container, getkey, nplike),
+            reconstitute(
+                form.content, later(next_length), container, getkey, nplike, lazy
+            ),
             identifier,
             form.parameters,
         )
 
     elif isinstance(form, ak._v2.forms.ListOffsetForm):
-        raw_array = container[getkey(form, "offsets")]
-        offsets = nplike.frombuffer(
-            raw_array, dtype=_index_to_dtype[form.offsets], count=length + 1
-        )
-        next_length = 0 if len(offsets) == 1 else offsets[-1]
+        if lazy:
+            count = _deferred(lambda: ak._v2._virtual.resolve_length(length) + 1)
+        else:
+            count = length + 1
+        offsets = read("offsets", _index_to_dtype[form.offsets], count)
+
+        def next_length():
+            values = _values(offsets)
+            return 0 if len(values) == 1 else values[-1]
+
         return ak._v2.contents.ListOffsetArray(
             ak._v2.index.Index(offsets),
-            reconstitute(form.content, next_length, container, getkey, nplike),
+            reconstitute(
+                form.content, later(next_length), container, getkey, nplike, lazy
+            ),
             identifier,
             form.parameters,
         )
 
     elif isinstance(form, ak._v2.forms.RegularForm):
-        next_length = length * form.size
+        if callable(length):
+            next_length = _deferred(
+                lambda: ak._v2._virtual.resolve_length(length) * form.size
+            )
+        else:
+            next_length = length * form.size
         return ak._v2.contents.RegularArray(
-            reconstitute(form.content, next_length, container, getkey, nplike),
+            reconstitute(form.content, next_length, container, getkey, nplike, lazy),
             form.size,
             length,
             identifier,
@@ -257,7 +334,7 @@ def reconstitute(form, length, container, getkey, nplike):
     elif isinstance(form, ak._v2.forms.RecordForm):
         return ak._v2.contents.RecordArray(
             [
-                reconstitute(content, length, container, getkey, nplike)
+                reconstitute(content, length, container, getkey, nplike, lazy)
                 for content in form.contents
             ],
             None if form.is_tuple else form.fields,
@@ -267,26 +344,33 @@ def reconstitute(form, length, container, getkey, nplike):
         )
 
     elif isinstance(form, ak._v2.forms.UnionForm):
-        raw_array1 = container[getkey(form, "tags")]
-        raw_array2 = container[getkey(form, "index")]
-        tags = nplike.frombuffer(
-            raw_array1, dtype=_index_to_dtype[form.tags], count=length
-        )
-        index = nplike.frombuffer(
-            raw_array2, dtype=_index_to_dtype[form.index], count=length
-        )
-        lengths = []
-        for tag in range(len(form.contents)):
-            selected_index = index[tags == tag]
-            if len(selected_index) == 0:
-                lengths.append(0)
-            else:
-                lengths.append(nplike.max(selected_index) + 1)
+        tags = read("tags", _index_to_dtype[form.tags], length)
+        index = read("index", _index_to_dtype[form.index], length)
+
+        def lengths():
+            tags_values, index_values = _values(tags), _values(index)
+            out = []
+            for tag in range(len(form.contents)):
+                selected_index = index_values[tags_values == tag]
+                if len(selected_index) == 0:
+                    out.append(0)
+                else:
+                    out.append(nplike.max(selected_index) + 1)
+            return out
+
+        lengths = later(lengths)
         return ak._v2.contents.UnionArray(
             ak._v2.index.Index(tags),
             ak._v2.index.Index(index),
             [
-                reconstitute(content, lengths[i], container, getkey, nplike)
+                reconstitute(
+                    content,
+                    _deferred(lambda i=i: lengths()[i]) if lazy else lengths[i],
+                    container,
+                    getkey,
+                    nplike,
+                    lazy,
+                )
                 for i, content in enumerate(form.contents)
             ],
             identifier,
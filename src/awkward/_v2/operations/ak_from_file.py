@@ -0,0 +1,97 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import json
+
+import numpy
+
+import awkward as ak
+
+
+def from_file(source, buffer_key=None, highlevel=True, behavior=None):
+    """
+    Args:
+        source (str or path-like): Local filename written by #ak.to_file.
+        buffer_key (None, str, or callable): The same `buffer_key` that was
+            passed to #ak.to_file. If None, the string stored in the file is
+            used; it only needs to be given if #ak.to_file was passed a
+            callable.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Opens a file written by #ak.to_file as an Awkward Array.
+
+    Only the footer is read: the file is memory-mapped (read-only) and each
+    buffer of the array is a view of the mapped region that is only made
+    when an operation first needs it (see `lazy` in #ak.from_buffers), so
+    opening takes the same time regardless of the size of the file and no
+    data are copied.
+    The operating system reads pages from disk as the array's operations
+    access them, and several processes opening the same file share the
+    operating system's cache.
+
+    The file must not be modified or truncated while the array (or any array
+    derived from it without copying) is in use.
+
+    See also #ak.to_file.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.from_file",
+        dict(
+            source=source,
+            buffer_key=buffer_key,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(source, buffer_key, highlevel, behavior)
+
+
+def _impl(source, buffer_key, highlevel, behavior):
+    magic = ak._v2.operations.ak_to_file._magic
+    footer_length = ak._v2.operations.ak_to_file._footer_length
+
+    mapped = numpy.memmap(source, dtype=numpy.uint8, mode="r")
+    trailer_start = len(mapped) - footer_length.size - len(magic)
+    if (
+        trailer_start < len(magic)
+        or mapped[: len(magic)].tobytes() != magic
+        or mapped[-len(magic) :].tobytes() != magic
+    ):
+        raise ak._v2._util.error(
+            ValueError(f"{source!r} is not a file written by ak.to_file")
+        )
+
+    (length_of_footer,) = footer_length.unpack(
+        mapped[trailer_start : trailer_start + footer_length.size].tobytes()
+    )
+    footer = json.loads(
+        mapped[trailer_start - length_of_footer : trailer_start].tobytes()
+    )
+
+    if buffer_key is None:
+        buffer_key = footer.get("buffer_key", "{form_key}-{attribute}")
+        if buffer_key is None:
+            raise ak._v2._util.error(
+                TypeError(
+                    f"{source!r} was written with a callable buffer_key; pass the "
+                    "same buffer_key to ak.from_file"
+                )
+            )
+
+    container = {
+        key: mapped[start : start + size]
+        for key, (start, size) in footer["buffers"].items()
+    }
+
+    return ak._v2.operations.ak_from_buffers._impl(
+        ak._v2.forms.from_iter(footer["form"]),
+        footer["length"],
+        container,
+        buffer_key,
+        ak.nplike.Numpy.instance(),
+        True,
+        highlevel,
+        behavior,
+    )
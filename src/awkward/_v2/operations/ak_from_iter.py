@@ -1,12 +1,22 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import operator
+
+import numpy
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
 
 
 def from_iter(
-    iterable, highlevel=True, behavior=None, allow_record=True, initial=1024, resize=1.5
+    iterable,
+    highlevel=True,
+    behavior=None,
+    allow_record=True,
+    initial=1024,
+    resize=1.5,
+    form=None,
 ):
     """
     Args:
@@ -23,6 +33,9 @@ def from_iter(
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        form (None, #ak.forms.Form, or its dict/JSON string): If not None, the
+            type of the data is known in advance: type discovery is skipped
+            and the data are converted as this Form (see below).
 
     Converts Python data into an Awkward Array.
 
@@ -48,6 +61,24 @@ def from_iter(
        * iterable, including np.ndarray: converted into
          #ak.layout.ListOffsetArray.
 
+    A list of dicts that all have the same keys and only bool, int, float, or
+    str values (such as rows from a REST API or a database cursor) is converted
+    without #ak.layout.ArrayBuilder, one column per key, with the same result.
+
+    If a `form` is given, the data are converted column by column in batches
+    of objects, directly into NumPy buffers laid out by the Form, which is
+    much faster for large datasets with a fixed schema:
+
+        >>> form = ak.Array([{"x": 1.1, "y": [1, 2]}]).layout.form
+        >>> array = ak.from_iter(messages, form=form)
+
+    Every object must then match the Form, or a ValueError is raised; values
+    are not converted from strings to numbers, from numbers to booleans, or
+    from floating-point numbers to integers. Lists
+    are built as #ak.layout.ListOffsetArray and missing values (for any option
+    type except #ak.forms.UnmaskedForm) as #ak.layout.IndexedOptionArray;
+    union types are not supported.
+
     See also #ak.to_list.
     """
     with ak._v2._util.OperationErrorContext(
@@ -59,12 +90,13 @@ def from_iter(
             allow_record=allow_record,
             initial=initial,
             resize=resize,
+            form=form,
         ),
     ):
-        return _impl(iterable, highlevel, behavior, allow_record, initial, resize)
+        return _impl(iterable, highlevel, behavior, allow_record, initial, resize, form)
 
 
-def _impl(iterable, highlevel, behavior, allow_record, initial, resize):
+def _impl(iterable, highlevel, behavior, allow_record, initial, resize, form=None):
     if isinstance(iterable, dict):
         if allow_record:
             return _impl(
@@ -74,6 +106,7 @@ def _impl(iterable, highlevel, behavior, allow_record, initial, resize):
                 False,
                 initial,
                 resize,
+                form,
             )[0]
         else:
             raise ak._v2._util.error(
@@ -82,9 +115,18 @@ def _impl(iterable, highlevel, behavior, allow_record, initial, resize):
                 )
             )
 
-    builder = ak.layout.ArrayBuilder(initial=initial, resize=resize)
-    for x in iterable:
-        builder.fromiter(x)
+    if form is None and isinstance(iterable, (list, tuple)):
+        layout = _flat_records(iterable)
+        if layout is not None:
+            return ak._v2._util.wrap(layout, behavior, highlevel)
+
+    if form is None:
+        builder = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+        for x in iterable:
+            builder.fromiter(x)
+    else:
+        builder = ak._v2._typedbuilder.TypedBuilder(form, initial, resize)
+        builder.extend(iterable)
 
     formstr, length, buffers = builder.to_buffers()
     form = ak._v2.forms.from_json(formstr)
@@ -92,3 +134,60 @@ def _impl(iterable, highlevel, behavior, allow_record, initial, resize):
     return ak._v2.operations.from_buffers(
         form, length, buffers, highlevel=highlevel, behavior=behavior
     )
+
+
+def _flat_records(iterable):
+    # A list of dicts with the same keys and only bool, int, float, or str
+    # values (rows from a REST API or database cursor) is transposed into one
+    # column per key, giving the same array as ArrayBuilder would.
+    if len(iterable) == 0 or type(iterable[0]) is not dict or len(iterable[0]) == 0:
+        return None
+
+    # dicts with as many keys as the first and all of its keys have its keys
+    fields = list(iterable[0])
+    if set(map(type, iterable)) != {dict} or set(map(len, iterable)) != {len(fields)}:
+        return None
+
+    contents = []
+    for field in fields:
+        try:
+            column = list(map(operator.itemgetter(field), iterable))
+        except KeyError:
+            return None
+        types = set(map(type, column))
+        try:
+            if types == {bool}:
+                content = numpy.array(column, dtype=np.bool_)
+            elif types == {int}:
+                content = numpy.array(column, dtype=np.int64)
+            elif types == {float} or types == {int, float}:
+                content = numpy.array(column, dtype=np.float64)
+            elif types == {str}:
+                content = _strings(column)
+            else:
+                return None
+        except (OverflowError, UnicodeEncodeError):
+            return None
+
+        if isinstance(content, numpy.ndarray):
+            content = ak._v2.contents.NumpyArray(content)
+        contents.append(content)
+
+    return ak._v2.contents.RecordArray(contents, fields, len(iterable))
+
+
+def _strings(column):
+    encoded = [x.encode("utf-8") for x in column]
+    offsets = numpy.empty(len(encoded) + 1, dtype=np.int64)
+    offsets[0] = 0
+    numpy.cumsum(
+        numpy.fromiter(map(len, encoded), np.int64, len(encoded)), out=offsets[1:]
+    )
+    return ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets),
+        ak._v2.contents.NumpyArray(
+            numpy.frombuffer(b"".join(encoded), np.uint8),
+            parameters={"__array__": "char"},
+        ),
+        parameters={"__array__": "string"},
+    )
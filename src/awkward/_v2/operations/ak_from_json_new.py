@@ -1,11 +1,13 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import json
 import pathlib
 from urllib.parse import urlparse
 
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
 
 
 def from_json(
@@ -19,6 +21,7 @@ def from_json(
     buffersize=65536,
     initial=1024,
     resize=1.5,
+    num_threads=None,
     highlevel=True,
     behavior=None,
 ):
@@ -55,6 +58,9 @@ def from_json(
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        num_threads (None or int): If greater than 1 and `line_delimited=True`,
+            the source is split at line boundaries into this many chunks, which
+            are parsed in parallel threads and concatenated.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -64,6 +70,16 @@ def from_json(
 
     FIXME: needs documentation.
 
+    If `line_delimited=True` and `num_threads` is greater than 1, the lines are
+    split into chunks of roughly equal numbers of bytes (a local file is split
+    by seeking; other sources are read into memory first) and each chunk is
+    parsed in its own thread, without holding Python's GIL. With a `schema`,
+    all chunks have the same type. Without one, each chunk's type is discovered
+    separately; if they are not all the same (for instance, a field that only
+    appears in some chunks, or integers in one chunk and floating-point numbers
+    in another), the source is parsed again in a single thread, so that the
+    type of the result is always the same as it would be with `num_threads=1`.
+
     See also #ak.to_json.
     """
     with ak._v2._util.OperationErrorContext(
@@ -79,11 +95,35 @@ def from_json(
             buffersize=buffersize,
             initial=initial,
             resize=resize,
+            num_threads=num_threads,
             highlevel=highlevel,
             behavior=behavior,
         ),
     ):
-        if schema is None:
+        if num_threads is not None and not (
+            ak._v2._util.isint(num_threads) and num_threads > 0
+        ):
+            raise ak._v2._util.error(
+                TypeError("num_threads must be None or a positive integer")
+            )
+
+        if line_delimited and num_threads is not None and num_threads > 1:
+            return _chunked(
+                source,
+                schema,
+                nan_string,
+                infinity_string,
+                minus_infinity_string,
+                complex_record_fields,
+                buffersize,
+                initial,
+                resize,
+                num_threads,
+                highlevel,
+                behavior,
+            )
+
+        elif schema is None:
             return _no_schema(
                 source,
                 line_delimited,
@@ -98,22 +138,42 @@ def from_json(
                 behavior,
             )
 
+        elif line_delimited:
+            return _chunked(
+                source,
+                schema,
+                nan_string,
+                infinity_string,
+                minus_infinity_string,
+                complex_record_fields,
+                buffersize,
+                initial,
+                resize,
+                1,
+                highlevel,
+                behavior,
+            )
+
         else:
             raise ak._v2._util.error(NotImplementedError)
 
 
 class _BytesReader:
-    __slots__ = ("data", "current")
+    __slots__ = ("data", "current", "stop")
 
-    def __init__(self, data):
+    def __init__(self, data, start=0, stop=None):
         self.data = data
-        self.current = 0
+        self.current = start
+        self.stop = len(data) if stop is None else stop
 
     def read(self, num_bytes):
         before = self.current
-        self.current += num_bytes
+        self.current = min(self.current + num_bytes, self.stop)
         return self.data[before : self.current]
 
+    def seek(self, position):
+        self.current = position
+
     def __enter__(self):
         return self
 
@@ -121,6 +181,27 @@ class _BytesReader:
         pass
 
 
+class _FileRangeReader:
+    def __init__(self, opener, start, stop):
+        self.opener = opener
+        self.current = start
+        self.stop = stop
+
+    def read(self, num_bytes):
+        num_bytes = min(num_bytes, self.stop - self.current)
+        self.current += num_bytes
+        return self.file.read(num_bytes)
+
+    def __enter__(self):
+        self.context = self.opener()
+        self.file = self.context.__enter__()
+        self.file.seek(self.current)
+        return self
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        self.context.__exit__(exception_type, exception_value, exception_traceback)
+
+
 class _NoContextManager:
     def __init__(self, file):
         self.file = file
@@ -227,3 +308,175 @@ def _no_schema(
         return ak._v2._util.wrap(layout, behavior, highlevel)
     else:
         return layout
+
+
+def _chunk_boundaries(file, start, stop, num_chunks, buffersize):
+    # positions just after the first newline at or after each of num_chunks
+    # evenly spaced positions
+    out = [start]
+    for i in range(1, num_chunks):
+        position = max(start + (stop - start) * i // num_chunks, out[-1])
+        file.seek(position)
+        while position < stop:
+            data = file.read(min(buffersize, stop - position))
+            if len(data) == 0:
+                position = stop
+                break
+            newline = data.find(b"\n")
+            if newline >= 0:
+                position += newline + 1
+                break
+            position += len(data)
+        out.append(position)
+    out.append(stop)
+    return [(a, b) for a, b in zip(out[:-1], out[1:]) if a < b]
+
+
+def _chunk_readers(source, num_chunks, buffersize):
+    if isinstance(source, bytes):
+        ranges = _chunk_boundaries(
+            _BytesReader(source), 0, len(source), num_chunks, buffersize
+        )
+        if len(ranges) == 0:
+            ranges = [(0, 0)]
+        return [lambda a=a, b=b: _BytesReader(source, a, b) for a, b in ranges]
+
+    else:
+        opener = _get_reader(source)
+        with opener() as file:
+            file.seek(0, 2)
+            ranges = _chunk_boundaries(file, 0, file.tell(), num_chunks, buffersize)
+        if len(ranges) == 0:
+            ranges = [(0, 0)]
+        return [lambda a=a, b=b: _FileRangeReader(opener, a, b) for a, b in ranges]
+
+
+def _parse_chunk(
+    reader,
+    schema,
+    nan_string,
+    infinity_string,
+    minus_infinity_string,
+    buffersize,
+    initial,
+    resize,
+):
+    if schema is None:
+        builder = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+        with reader() as obj:
+            ak._ext.fromjsonobj(
+                obj,
+                builder,
+                False,
+                buffersize,
+                nan_string,
+                infinity_string,
+                minus_infinity_string,
+            )
+        formstr, length, buffers = builder.to_buffers()
+        form = ak._v2.forms.from_json(formstr)
+        return ak._v2.operations.ak_from_buffers._impl(
+            form, length, buffers, "{form_key}-{attribute}", numpy, False, False, None
+        )
+
+    else:
+        # the specialized parser reads one JSON array, rather than lines
+        with reader() as obj:
+            lines = [x for x in _read_all(obj, buffersize).splitlines() if x.strip()]
+        return ak._v2.operations.ak_from_json_schema._impl(
+            b"[" + b",".join(lines) + b"]",
+            {"type": "array", "items": schema},
+            False,
+            None,
+            initial,
+            resize,
+        )
+
+
+def _read_all(obj, buffersize):
+    chunks = []
+    while True:
+        data = obj.read(buffersize)
+        if len(data) == 0:
+            return b"".join(chunks)
+        chunks.append(data)
+
+
+def _chunked(
+    source,
+    schema,
+    nan_string,
+    infinity_string,
+    minus_infinity_string,
+    complex_record_fields,
+    buffersize,
+    initial,
+    resize,
+    num_threads,
+    highlevel,
+    behavior,
+):
+    if isinstance(schema, bytes) or ak._v2._util.isstr(schema):
+        schema = json.loads(schema)
+
+    if not isinstance(source, (bytes, str, pathlib.Path)):
+        # a file-like object can't be shared among threads (or read twice)
+        source = source.read()
+
+    if not isinstance(source, pathlib.Path) and isinstance(source, str):
+        source = source.encode("utf8", errors="surrogateescape")
+
+    readers = _chunk_readers(source, num_threads, buffersize)
+
+    def parse(reader):
+        return _parse_chunk(
+            reader,
+            schema,
+            nan_string,
+            infinity_string,
+            minus_infinity_string,
+            buffersize,
+            initial,
+            resize,
+        )
+
+    if len(readers) <= 1:
+        layouts = [parse(reader) for reader in readers]
+    else:
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
+            layouts = list(executor.map(parse, readers))
+
+    if schema is None:
+        # chunks without lines don't constrain the type; if the others were
+        # discovered with different types, concatenating them would not give
+        # the type that one pass over the source discovers
+        nonempty = [x for x in layouts if x.length != 0]
+        if len(nonempty) != 0:
+            layouts = nonempty
+        if any(x.form != layouts[0].form for x in layouts[1:]):
+            return _no_schema(
+                source,
+                True,
+                nan_string,
+                infinity_string,
+                minus_infinity_string,
+                complex_record_fields,
+                buffersize,
+                initial,
+                resize,
+                highlevel,
+                behavior,
+            )
+
+    if len(layouts) == 1:
+        layout = layouts[0]
+    else:
+        layout = ak._v2.operations.ak_concatenate._impl(
+            layouts, 0, True, False, False, None
+        )
+
+    layout = _record_to_complex(layout, complex_record_fields)
+
+    return ak._v2._util.wrap(layout, behavior, highlevel)
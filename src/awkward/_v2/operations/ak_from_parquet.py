@@ -12,6 +12,8 @@ def from_parquet(
     max_block=256_000_000,
     footer_sample_size=1_000_000,
     generate_bitmasks=False,
+    filter=None,
+    num_threads=None,
     highlevel=True,
     behavior=None,
 ):
@@ -34,6 +36,12 @@ def from_parquet(
             metadata, `generate_bitmasks=True` creates empty bitmasks for nullable
             types that don't have bitmasks in the Arrow/Parquet data, so that the
             Form (BitMaskedForm vs UnmaskedForm) is predictable.
+        filter (None, tuple, or list of tuples): Condition(s) like
+            `("pt", ">", 30)` used to skip row groups, based on the minimum and
+            maximum values recorded in the Parquet metadata. See below.
+        num_threads (None or int): If greater than 1, row groups are read and
+            converted concurrently in a pool of this many threads; the output
+            is the same as with sequential reading.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -46,7 +54,21 @@ def from_parquet(
     use #ak.metadata_from_parquet to find column names and the range of row groups
     that a dataset has.
 
-    See also #ak.to_parquet, #ak.metadata_from_parquet.
+    A `filter` is a `(column, operator, value)` tuple or a list of them, which
+    must all be satisfied. The `column` is a column name with nested records
+    separated by dots (lists are ignored, so a column in a list of records is
+    also named like `"muons.pt"`), the `operator` is one of `"=="`, `"!="`,
+    `"<"`, `"<="`, `">"`, `">="`, `"in"`, and the `value` is a scalar (or a
+    collection of scalars for `"in"`). A row group is skipped, without reading
+    any of its data, if its statistics show that none of its values can
+    satisfy the condition. Row groups without statistics are always read.
+    This does not remove rows (or list items) that fail the condition from
+    the row groups that are read: apply the cut to the output for that.
+
+    To process a dataset that doesn't fit into memory, use
+    #ak.iter_parquet to read it one row group or batch of rows at a time.
+
+    See also #ak.to_parquet, #ak.metadata_from_parquet, #ak.iter_parquet.
     """
     with ak._v2._util.OperationErrorContext(
         "ak._v2.from_parquet",
@@ -59,12 +81,21 @@ def from_parquet(
             max_block=max_block,
             footer_sample_size=footer_sample_size,
             generate_bitmasks=generate_bitmasks,
+            filter=filter,
+            num_threads=num_threads,
             highlevel=highlevel,
             behavior=behavior,
         ),
     ):
         import awkward._v2._connect.pyarrow  # noqa: F401
 
+        if num_threads is not None and not (
+            ak._v2._util.isint(num_threads) and num_threads >= 1
+        ):
+            raise ak._v2._util.error(
+                TypeError("num_threads must be None or a positive integer")
+            )
+
         parquet_columns, subform, actual_paths, fs, subrg, meta = _metadata(
             path,
             storage_options,
@@ -74,6 +105,8 @@ def from_parquet(
             max_block,
             footer_sample_size,
         )
+        if filter is not None:
+            actual_paths, subrg = _filter_row_groups(actual_paths, subrg, fs, filter)
         return _load(
             actual_paths,
             parquet_columns,
@@ -87,6 +120,7 @@ def from_parquet(
             behavior,
             fs,
             meta,
+            num_threads,
         )
 
 
@@ -125,7 +159,7 @@ def _metadata(
 
         if columns is not None:
             list_indicator = "list.item"
-            for column_metadata in file_for_metadata.schema:
+            for column_metadata in parquetfile_for_metadata.schema:
                 if (
                     column_metadata.max_repetition_level > 0
                     and ".list.element." in column_metadata.path
@@ -207,6 +241,110 @@ def _metadata(
     return parquet_columns, subform, actual_paths, fs, subrg, metadata
 
 
+_filter_operators = {
+    "==": lambda low, high, value: low <= value <= high,
+    "!=": lambda low, high, value: not low == high == value,
+    "<": lambda low, high, value: low < value,
+    "<=": lambda low, high, value: low <= value,
+    ">": lambda low, high, value: high > value,
+    ">=": lambda low, high, value: high >= value,
+    "in": lambda low, high, value: any(low <= x <= high for x in value),
+}
+
+
+def _filter_column_name(path_in_schema):
+    # "muons.list.item.pt" -> "muons.pt"
+    parts = path_in_schema.split(".")
+    out = []
+    i = 0
+    while i < len(parts):
+        if parts[i] == "list" and parts[i + 1 : i + 2] in (["item"], ["element"]):
+            i += 2
+        else:
+            out.append(parts[i])
+            i += 1
+    return ".".join(out)
+
+
+def _filter_row_groups(actual_paths, subrg, fs, filter):
+    import pyarrow.parquet as pyarrow_parquet
+
+    if isinstance(filter, tuple):
+        filter = [filter]
+    for condition in filter:
+        if not (
+            isinstance(condition, tuple)
+            and len(condition) == 3
+            and ak._v2._util.isstr(condition[0])
+            and condition[1] in _filter_operators
+        ):
+            raise ak._v2._util.error(
+                TypeError(
+                    "filter must be a (column, operator, value) tuple or a list of them, "
+                    "with operator in {}, not {}".format(
+                        ", ".join(repr(x) for x in _filter_operators), repr(condition)
+                    )
+                )
+            )
+
+    out_paths, out_subrg = [], []
+    for path, row_groups in zip(actual_paths, subrg):
+        with fs.open(path, "rb") as file:
+            metadata = pyarrow_parquet.ParquetFile(file).metadata
+
+        if row_groups is None:
+            row_groups = range(metadata.num_row_groups)
+
+        selected = []
+        for row_group in row_groups:
+            if _row_group_may_pass(metadata.row_group(row_group), filter, path):
+                selected.append(row_group)
+
+        if len(selected) != 0:
+            out_paths.append(path)
+            out_subrg.append(selected)
+
+    return out_paths, out_subrg
+
+
+def _row_group_may_pass(row_group_metadata, filter, path):
+    columns = {}
+    for i in range(row_group_metadata.num_columns):
+        column_metadata = row_group_metadata.column(i)
+        columns[_filter_column_name(column_metadata.path_in_schema)] = column_metadata
+
+    for column, operator, value in filter:
+        if column not in columns:
+            raise ak._v2._util.error(
+                ValueError(
+                    "filter column {} not found in {}; available columns: {}".format(
+                        repr(column), repr(path), ", ".join(repr(x) for x in columns)
+                    )
+                )
+            )
+        statistics = columns[column].statistics
+        if statistics is None or not statistics.has_min_max:
+            continue
+        try:
+            if not _filter_operators[operator](statistics.min, statistics.max, value):
+                return False
+        except TypeError as err:
+            raise ak._v2._util.error(
+                TypeError(
+                    "filter value {} cannot be compared with column {} "
+                    "(minimum {}, maximum {}): {}".format(
+                        repr(value),
+                        repr(column),
+                        repr(statistics.min),
+                        repr(statistics.max),
+                        str(err),
+                    )
+                )
+            )
+
+    return True
+
+
 def _load(
     actual_paths,
     parquet_columns,
@@ -220,27 +358,30 @@ def _load(
     behavior,
     fs,
     meta,
+    num_threads=None,
 ):
-    arrays = []
-    for i, p in enumerate(actual_paths):
-        arrays.append(
-            _read_parquet_file(
-                p,
-                fs=fs,
-                parquet_columns=parquet_columns,
-                row_groups=subrg[i],
-                max_gap=max_gap,
-                max_block=max_block,
-                footer_sample_size=footer_sample_size,
-                generate_bitmasks=generate_bitmasks,
-                metadata=meta,
-            )
+    def read(path, row_groups):
+        return _read_parquet_file(
+            path,
+            fs=fs,
+            parquet_columns=parquet_columns,
+            row_groups=row_groups,
+            max_gap=max_gap,
+            max_block=max_block,
+            footer_sample_size=footer_sample_size,
+            generate_bitmasks=generate_bitmasks,
+            metadata=meta,
         )
 
+    if num_threads is None or num_threads == 1:
+        arrays = [read(p, subrg[i]) for i, p in enumerate(actual_paths)]
+    else:
+        arrays = _read_concurrently(read, actual_paths, subrg, fs, num_threads)
+
     if len(arrays) == 0:
         numpy = ak.nplike.Numpy.instance()
         return ak._v2.operations.ak_from_buffers._impl(
-            subform, 0, _DictOfEmptyBuffers(), "", numpy, highlevel, behavior
+            subform, 0, _DictOfEmptyBuffers(), "", numpy, False, highlevel, behavior
         )
     elif len(arrays) == 1 and isinstance(arrays[0], ak._v2.record.Record):
         return ak._v2._util.wrap(arrays[0], behavior, highlevel)
@@ -250,6 +391,28 @@ def _load(
         )
 
 
+def _read_concurrently(read, actual_paths, subrg, fs, num_threads):
+    import concurrent.futures
+    import pyarrow.parquet as pyarrow_parquet
+
+    def num_row_groups(path):
+        with fs.open(path, "rb") as file:
+            return pyarrow_parquet.ParquetFile(file).num_row_groups
+
+    # the unit of work is one row group; pyarrow and NumPy release the GIL
+    with concurrent.futures.ThreadPoolExecutor(num_threads) as executor:
+        unknown = [p for p, rgs in zip(actual_paths, subrg) if rgs is None]
+        counts = dict(zip(unknown, executor.map(num_row_groups, unknown)))
+
+        tasks = []
+        for p, rgs in zip(actual_paths, subrg):
+            if rgs is None:
+                rgs = range(counts[p])
+            tasks.extend((p, [rg]) for rg in rgs)
+
+        return list(executor.map(lambda task: read(*task), tasks))
+
+
 def _read_parquet_file(
     path,
     fs,
@@ -260,6 +423,33 @@ def _read_parquet_file(
     max_block,
     metadata,
     generate_bitmasks,
+):
+    arrow_table = _read_parquet_table(
+        path,
+        fs,
+        parquet_columns,
+        row_groups,
+        footer_sample_size,
+        max_gap,
+        max_block,
+    )
+
+    return ak._v2.operations.ak_from_arrow._impl(
+        arrow_table,
+        generate_bitmasks,
+        False,
+        None,
+    )
+
+
+def _read_parquet_table(
+    path,
+    fs,
+    parquet_columns,
+    row_groups,
+    footer_sample_size,
+    max_gap,
+    max_block,
 ):
     import fsspec.parquet
     import pyarrow.parquet as pyarrow_parquet
@@ -281,12 +471,7 @@ def _read_parquet_file(
         else:
             arrow_table = parquetfile.read_row_groups(row_groups, parquet_columns)
 
-    return ak._v2.operations.ak_from_arrow._impl(
-        arrow_table,
-        generate_bitmasks,
-        False,
-        None,
-    )
+    return arrow_table
 
 
 class _DictOfEmptyBuffers:
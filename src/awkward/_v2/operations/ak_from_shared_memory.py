@@ -0,0 +1,60 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numpy
+
+import awkward as ak
+
+
+def from_shared_memory(handle, highlevel=True, behavior=None):
+    """
+    Args:
+        handle (#ak.SharedMemoryHandle): The output of #ak.to_shared_memory,
+            possibly pickled and sent to another process.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns an array that views the shared memory block referred to by
+    `handle`, without copying it. The block is attached at most once per
+    process, however many arrays are made from it, and stays attached until
+    #ak.SharedMemoryHandle.close is called.
+
+    The block is shared with the process that wrote it (and any others that
+    read it), so the buffers of the output array are read-only.
+
+    See #ak.to_shared_memory for an example.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.from_shared_memory",
+        dict(handle=handle, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(handle, highlevel, behavior)
+
+
+def _impl(handle, highlevel, behavior):
+    if not isinstance(handle, ak._v2.operations.ak_to_shared_memory.SharedMemoryHandle):
+        raise ak._v2._util.error(
+            TypeError(
+                f"'handle' must be made by ak.to_shared_memory, not {type(handle)}"
+            )
+        )
+
+    mapped = numpy.frombuffer(handle._attach().buf, dtype=numpy.uint8)
+    mapped.flags.writeable = False
+
+    container = {
+        key: mapped[start : start + size]
+        for key, (start, size) in handle._buffers.items()
+    }
+
+    return ak._v2.operations.ak_from_buffers._impl(
+        handle.form,
+        handle.length,
+        container,
+        "{form_key}-{attribute}",
+        ak.nplike.Numpy.instance(),
+        False,
+        highlevel,
+        behavior,
+    )
@@ -0,0 +1,201 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numpy
+
+import awkward as ak
+
+
+def iter_json(
+    source,
+    batch_size=None,
+    batch_bytes=None,
+    nan_string=None,
+    infinity_string=None,
+    minus_infinity_string=None,
+    complex_record_fields=None,
+    buffersize=65536,
+    initial=1024,
+    resize=1.5,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        source (bytes/str, pathlib.Path, or file-like object): Data source of
+            line-delimited JSON, as in #ak.from_json. A file-like object (such
+            as `sys.stdin.buffer` or a pipe) is read until it returns no data.
+        batch_size (None or int): Maximum number of lines in each yielded array.
+        batch_bytes (None or int): Approximate maximum number of bytes of JSON
+            in each yielded array (a line longer than this is yielded alone).
+        nan_string (None or str): If not None, strings with this value will be
+            interpreted as floating-point NaN values.
+        infinity_string (None or str): If not None, strings with this value will
+            be interpreted as floating-point positive infinity values.
+        minus_infinity_string (None or str): If not None, strings with this value
+            will be interpreted as floating-point negative infinity values.
+        complex_record_fields (None or (str, str)): If not None, defines a pair of
+            field names to interpret 2-field records as complex numbers.
+        buffersize (int): Number of bytes in each read from source.
+        initial (int): Initial size (in bytes) of buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions).
+        resize (float): Resize multiplier for buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
+            should be strictly greater than 1.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.layout.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Iterates over line-delimited JSON, yielding an array as soon as
+    `batch_size` lines or `batch_bytes` bytes (whichever comes first) have
+    been read. If neither is given, an array is yielded for the complete lines
+    in each read of `buffersize` bytes. Empty lines are skipped.
+
+    Only the current batch (and the incomplete line at its end) is held in
+    memory, so that an unbounded stream can be processed:
+
+        >>> for batch in ak.iter_json(sys.stdin.buffer, batch_size=10000):
+        ...     process(batch)
+
+    The type of each batch is discovered from its own data, so batches may
+    have different types.
+
+    See also #ak.from_json.
+    """
+    import awkward._v2.operations.ak_from_json_new  # noqa: F401
+
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.iter_json",
+        dict(
+            source=source,
+            batch_size=batch_size,
+            batch_bytes=batch_bytes,
+            nan_string=nan_string,
+            infinity_string=infinity_string,
+            minus_infinity_string=minus_infinity_string,
+            complex_record_fields=complex_record_fields,
+            buffersize=buffersize,
+            initial=initial,
+            resize=resize,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        for name, value in [("batch_size", batch_size), ("batch_bytes", batch_bytes)]:
+            if value is not None and not (ak._v2._util.isint(value) and value > 0):
+                raise ak._v2._util.error(
+                    TypeError(f"{name} must be None or a positive integer")
+                )
+
+        reader = ak._v2.operations.ak_from_json_new._get_reader(source)
+
+    # the context is not held across yields: the caller's operations need it
+    return _batches(
+        reader,
+        batch_size,
+        batch_bytes,
+        nan_string,
+        infinity_string,
+        minus_infinity_string,
+        complex_record_fields,
+        buffersize,
+        initial,
+        resize,
+        highlevel,
+        behavior,
+    )
+
+
+def _cut(buffer, newlines, num_newlines, batch_size, batch_bytes):
+    # position just after the last line of the next batch, or None if the
+    # buffer does not have enough lines yet
+    if num_newlines == 0:
+        return None
+
+    if batch_size is not None and num_newlines >= batch_size:
+        newlines = numpy.concatenate(newlines)
+        cut = newlines[batch_size - 1] + 1
+        if batch_bytes is not None and cut > batch_bytes:
+            cut = None
+        else:
+            return cut
+
+    if batch_bytes is not None:
+        if len(buffer) < batch_bytes:
+            return None
+        newlines = numpy.concatenate(newlines)
+        fits = newlines[newlines < batch_bytes]
+        if len(fits) == 0:
+            return newlines[0] + 1
+        else:
+            return fits[-1] + 1
+
+    if batch_size is None:
+        return newlines[-1][-1] + 1 if len(newlines[-1]) != 0 else None
+
+    return None
+
+
+def _batches(
+    reader,
+    batch_size,
+    batch_bytes,
+    nan_string,
+    infinity_string,
+    minus_infinity_string,
+    complex_record_fields,
+    buffersize,
+    initial,
+    resize,
+    highlevel,
+    behavior,
+):
+    buffer = bytearray()
+    newlines = []
+    num_newlines = 0
+
+    def parse(data):
+        with ak._v2._util.OperationErrorContext(
+            "ak._v2.iter_json",
+            dict(batch_size=batch_size, batch_bytes=batch_bytes),
+        ):
+            return ak._v2.operations.ak_from_json_new._no_schema(
+                data,
+                True,
+                nan_string,
+                infinity_string,
+                minus_infinity_string,
+                complex_record_fields,
+                buffersize,
+                initial,
+                resize,
+                highlevel,
+                behavior,
+            )
+
+    with reader() as obj:
+        while True:
+            data = obj.read(buffersize)
+            if len(data) == 0:
+                break
+
+            found = numpy.flatnonzero(numpy.frombuffer(data, numpy.uint8) == 10)
+            newlines.append(found + len(buffer))
+            num_newlines += len(found)
+            buffer += data
+
+            while True:
+                cut = _cut(buffer, newlines, num_newlines, batch_size, batch_bytes)
+                if cut is None:
+                    break
+                batch = bytes(buffer[:cut])
+                del buffer[:cut]
+                remaining = numpy.concatenate(newlines)
+                remaining = remaining[remaining >= cut] - cut
+                newlines = [remaining]
+                num_newlines = len(remaining)
+                if batch.strip() != b"":
+                    yield parse(batch)
+
+    if bytes(buffer).strip() != b"":
+        yield parse(bytes(buffer))
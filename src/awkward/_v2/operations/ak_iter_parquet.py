@@ -0,0 +1,285 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+
+def iter_parquet(
+    path,
+    columns=None,
+    row_groups=None,
+    batch_size=None,
+    read_ahead=False,
+    storage_options=None,
+    max_gap=64_000,
+    max_block=256_000_000,
+    footer_sample_size=1_000_000,
+    generate_bitmasks=False,
+    filter=None,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        path (str): Local filename or remote URL, passed to fsspec for resolution.
+            May contain glob patterns.
+        columns (None, str, or list of str): Glob pattern(s) with bash-like curly
+            brackets for matching column names. Nested records are separated by dots.
+            If a list of patterns, the logical-or is matched. If None, all columns
+            are read.
+        row_groups (None or set of int): Row groups to read; must be non-negative.
+            Order is ignored: the arrays are yielded in the order specified by
+            Parquet metadata. If None, all row groups/all rows are read.
+        batch_size (None or int): If None, one array is yielded per row group;
+            otherwise, arrays of at most `batch_size` rows are yielded (a batch
+            does not cross file boundaries). Either way, data are read one row
+            group at a time.
+        read_ahead (bool): If True, the next array is read in a background
+            thread while the current one is being processed, so that at most
+            two arrays are in memory at a time.
+        storage_options: Passed to `fsspec.parquet.open_parquet_file`.
+        max_gap (int): Passed to `fsspec.parquet.open_parquet_file`.
+        max_block (int): Passed to `fsspec.parquet.open_parquet_file`.
+        footer_sample_size (int): Passed to `fsspec.parquet.open_parquet_file`.
+        generate_bitmasks (bool): If enabled and Arrow/Parquet does not have Awkward
+            metadata, `generate_bitmasks=True` creates empty bitmasks for nullable
+            types that don't have bitmasks in the Arrow/Parquet data, so that the
+            Form (BitMaskedForm vs UnmaskedForm) is predictable.
+        filter (None, tuple, or list of tuples): Condition(s) like
+            `("pt", ">", 30)` used to skip row groups, based on the minimum and
+            maximum values recorded in the Parquet metadata. See #ak.from_parquet.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.layout.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Iterates over data from a local or remote Parquet file or collection of files,
+    yielding one array per row group or per `batch_size` rows.
+
+    Unlike #ak.from_parquet, the data need not fit into memory: only the batch
+    being yielded (and the next one, if `read_ahead`) is held at a time. All
+    arrays have the same Form.
+
+        >>> for batch in ak.iter_parquet("events-*.parquet", columns="muons.*"):
+        ...     process(batch)
+
+    See also #ak.from_parquet, #ak.metadata_from_parquet.
+    """
+    import awkward._v2._connect.pyarrow  # noqa: F401
+
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.iter_parquet",
+        dict(
+            path=path,
+            columns=columns,
+            row_groups=row_groups,
+            batch_size=batch_size,
+            read_ahead=read_ahead,
+            storage_options=storage_options,
+            max_gap=max_gap,
+            max_block=max_block,
+            footer_sample_size=footer_sample_size,
+            generate_bitmasks=generate_bitmasks,
+            filter=filter,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        if batch_size is not None:
+            if not ak._v2._util.isint(batch_size):
+                raise ak._v2._util.error(
+                    TypeError("batch_size must be None or a positive integer")
+                )
+            if batch_size <= 0:
+                raise ak._v2._util.error(
+                    ValueError(
+                        f"batch_size must be None or a positive integer, not {batch_size}"
+                    )
+                )
+
+        (
+            parquet_columns,
+            subform,
+            actual_paths,
+            fs,
+            subrg,
+            meta,
+        ) = ak._v2.operations.ak_from_parquet._metadata(
+            path,
+            storage_options,
+            row_groups,
+            columns,
+            max_gap,
+            max_block,
+            footer_sample_size,
+        )
+        if filter is not None:
+            (
+                actual_paths,
+                subrg,
+            ) = ak._v2.operations.ak_from_parquet._filter_row_groups(
+                actual_paths, subrg, fs, filter
+            )
+
+    # the context is not held across yields: the caller's operations need it
+    tasks = _tasks(
+        actual_paths,
+        parquet_columns,
+        subrg,
+        batch_size,
+        max_gap,
+        max_block,
+        footer_sample_size,
+        generate_bitmasks,
+        highlevel,
+        behavior,
+        fs,
+    )
+    if read_ahead:
+        return _read_ahead(tasks)
+    else:
+        return _sequential(tasks)
+
+
+def _tasks(
+    actual_paths,
+    parquet_columns,
+    subrg,
+    batch_size,
+    max_gap,
+    max_block,
+    footer_sample_size,
+    generate_bitmasks,
+    highlevel,
+    behavior,
+    fs,
+):
+    # yields functions that each read one array, or return None if there's
+    # nothing left to read in the current file
+    import pyarrow.parquet as pyarrow_parquet
+
+    def convert(arrow_data, path, row_groups):
+        with ak._v2._util.OperationErrorContext(
+            "ak._v2.iter_parquet",
+            dict(path=path, row_groups=row_groups, batch_size=batch_size),
+        ):
+            return ak._v2.operations.ak_from_arrow._impl(
+                arrow_data, generate_bitmasks, highlevel, behavior
+            )
+
+    for path, row_groups in zip(actual_paths, subrg):
+        if row_groups is None:
+            with fs.open(path, "rb") as file:
+                row_groups = range(pyarrow_parquet.ParquetFile(file).num_row_groups)
+
+        if batch_size is None:
+            for row_group in row_groups:
+
+                def task(path=path, row_group=row_group):
+                    arrow_table = ak._v2.operations.ak_from_parquet._read_parquet_table(
+                        path,
+                        fs=fs,
+                        parquet_columns=parquet_columns,
+                        row_groups=[row_group],
+                        max_gap=max_gap,
+                        max_block=max_block,
+                        footer_sample_size=footer_sample_size,
+                    )
+                    return convert(arrow_table, path, [row_group])
+
+                yield task
+
+        else:
+            batches = _batches(
+                path,
+                fs,
+                parquet_columns,
+                row_groups,
+                batch_size,
+                max_gap,
+                max_block,
+                footer_sample_size,
+            )
+            finished = []
+
+            def task(
+                path=path, row_groups=row_groups, batches=batches, finished=finished
+            ):
+                try:
+                    batch = next(batches)
+                except StopIteration:
+                    finished.append(path)
+                    return None
+                else:
+                    return convert(batch, path, row_groups)
+
+            # each task must finish before the next is requested
+            while len(finished) == 0:
+                yield task
+
+
+def _batches(
+    path,
+    fs,
+    parquet_columns,
+    row_groups,
+    batch_size,
+    max_gap,
+    max_block,
+    footer_sample_size,
+):
+    # yields lists of record batches with batch_size rows in total (the last
+    # may have fewer), reading one row group at a time; rows left over from
+    # one row group are completed with rows from the next
+    import fsspec.parquet
+    import pyarrow.parquet as pyarrow_parquet
+
+    pending, num_pending = [], 0
+    for row_group in row_groups:
+        with fsspec.parquet.open_parquet_file(
+            path,
+            fs=fs,
+            engine="pyarrow",
+            columns=parquet_columns,
+            row_groups=[row_group],
+            max_gap=max_gap,
+            max_block=max_block,
+            footer_sample_size=footer_sample_size,
+        ) as file:
+            for batch in pyarrow_parquet.ParquetFile(file).iter_batches(
+                batch_size=batch_size,
+                row_groups=[row_group],
+                columns=parquet_columns,
+            ):
+                while num_pending + batch.num_rows >= batch_size:
+                    needed = batch_size - num_pending
+                    yield pending + [batch.slice(0, needed)]
+                    pending, num_pending = [], 0
+                    batch = batch.slice(needed)
+                if batch.num_rows != 0:
+                    pending.append(batch)
+                    num_pending += batch.num_rows
+
+    if num_pending != 0:
+        yield pending
+
+
+def _sequential(tasks):
+    for task in tasks:
+        out = task()
+        if out is not None:
+            yield out
+
+
+def _read_ahead(tasks):
+    import concurrent.futures
+
+    # one worker, so that tasks run in order and at most one is in flight
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        task = next(tasks, None)
+        future = None if task is None else executor.submit(task)
+        while future is not None:
+            out = future.result()
+            task = next(tasks, None)
+            future = None if task is None else executor.submit(task)
+            if out is not None:
+                yield out
@@ -13,6 +13,7 @@ def min(
     initial=None,
     mask_identity=True,
     flatten_records=False,
+    num_threads=None,
 ):
     """
     Args:
@@ -35,6 +36,10 @@ def min(
             results in the operation's identity.
         flatten_records (bool): If True, axis=None combines fields from different
             records; otherwise, records raise an error.
+        num_threads (None or int): Number of threads that the reduction is
+            split across (groups of lists are reduced in parallel); if None,
+            the number set by #ak.reducer_threads or #ak.set_reducer_threads
+            (initially 1) is used.
 
     Returns the minimum value in each group of elements from `array` (many
     types supported, including all Awkward Arrays and Records). The identity
@@ -60,9 +65,11 @@ def min(
             initial=initial,
             mask_identity=mask_identity,
             flatten_records=flatten_records,
+            num_threads=num_threads,
         ),
     ):
-        return _impl(array, axis, keepdims, initial, mask_identity, flatten_records)
+        with ak._v2._reducers.threads(num_threads):
+            return _impl(array, axis, keepdims, initial, mask_identity, flatten_records)
 
 
 # @ak._v2._connect.numpy.implements("nanmin")
@@ -73,6 +80,7 @@ def nanmin(
     initial=None,
     mask_identity=True,
     flatten_records=False,
+    num_threads=None,
 ):
     """
     Args:
@@ -95,6 +103,10 @@ def nanmin(
             results in the operation's identity.
         flatten_records (bool): If True, axis=None combines fields from different
             records; otherwise, records raise an error.
+        num_threads (None or int): Number of threads that the reduction is
+            split across (groups of lists are reduced in parallel); if None,
+            the number set by #ak.reducer_threads or #ak.set_reducer_threads
+            (initially 1) is used.
 
     Like #ak.min, but treating NaN ("not a number") values as missing.
 
@@ -115,11 +127,13 @@ def nanmin(
             initial=initial,
             mask_identity=mask_identity,
             flatten_records=flatten_records,
+            num_threads=num_threads,
         ),
     ):
         array = ak._v2.operations.ak_nan_to_none._impl(array, False, None)
 
-        return _impl(array, axis, keepdims, initial, mask_identity, flatten_records)
+        with ak._v2._reducers.threads(num_threads):
+            return _impl(array, axis, keepdims, initial, mask_identity, flatten_records)
 
 
 def _impl(array, axis, keepdims, initial, mask_identity, flatten_records):
@@ -6,7 +6,14 @@ np = ak.nplike.NumpyMetadata.instance()
 
 
 # @ak._v2._connect.numpy.implements("prod")
-def prod(array, axis=None, keepdims=False, mask_identity=False, flatten_records=False):
+def prod(
+    array,
+    axis=None,
+    keepdims=False,
+    mask_identity=False,
+    flatten_records=False,
+    num_threads=None,
+):
     """
     Args:
         array: Array-like data (anything #ak.to_layout recognizes).
@@ -24,6 +31,10 @@ def prod(array, axis=None, keepdims=False, mask_identity=False, flatten_records=
             results in the operation's identity.
         flatten_records (bool): If True, axis=None combines fields from different
             records; otherwise, records raise an error.
+        num_threads (None or int): Number of threads that the reduction is
+            split across (groups of lists are reduced in parallel); if None,
+            the number set by #ak.reducer_threads or #ak.set_reducer_threads
+            (initially 1) is used.
 
     Multiplies elements of `array` (many types supported, including all
     Awkward Arrays and Records). The identity of multiplication is `1` and it
@@ -45,14 +56,21 @@ def prod(array, axis=None, keepdims=False, mask_identity=False, flatten_records=
             keepdims=keepdims,
             mask_identity=mask_identity,
             flatten_records=flatten_records,
+            num_threads=num_threads,
         ),
     ):
-        return _impl(array, axis, keepdims, mask_identity, flatten_records)
+        with ak._v2._reducers.threads(num_threads):
+            return _impl(array, axis, keepdims, mask_identity, flatten_records)
 
 
 # @ak._v2._connect.numpy.implements("nanprod")
 def nanprod(
-    array, axis=None, keepdims=False, mask_identity=False, flatten_records=False
+    array,
+    axis=None,
+    keepdims=False,
+    mask_identity=False,
+    flatten_records=False,
+    num_threads=None,
 ):
     """
     Args:
@@ -71,6 +89,10 @@ def nanprod(
             results in the operation's identity.
         flatten_records (bool): If True, axis=None combines fields from different
             records; otherwise, records raise an error.
+        num_threads (None or int): Number of threads that the reduction is
+            split across (groups of lists are reduced in parallel); if None,
+            the number set by #ak.reducer_threads or #ak.set_reducer_threads
+            (initially 1) is used.
 
     Like #ak.prod, but treating NaN ("not a number") values as missing.
 
@@ -90,11 +112,13 @@ def nanprod(
             keepdims=keepdims,
             mask_identity=mask_identity,
             flatten_records=flatten_records,
+            num_threads=num_threads,
         ),
     ):
         array = ak._v2.operations.ak_nan_to_none._impl(array, False, None)
 
-        return _impl(array, axis, keepdims, mask_identity, flatten_records)
+        with ak._v2._reducers.threads(num_threads):
+            return _impl(array, axis, keepdims, mask_identity, flatten_records)
 
 
 def _impl(array, axis, keepdims, mask_identity, flatten_records):
@@ -0,0 +1,51 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import contextlib
+
+import awkward as ak
+
+
+@contextlib.contextmanager
+def reducer_threads(num_threads):
+    """
+    Args:
+        num_threads (int): Number of threads that reductions are split across
+            (groups of lists are reduced in parallel).
+
+    Context manager that sets the number of threads used by the reducers
+    (#ak.sum, #ak.prod, #ak.min, #ak.max, #ak.argmin, #ak.argmax, #ak.count,
+    #ak.count_nonzero, #ak.any, #ak.all, and the statistics built on them)
+    that are called in this thread, within the `with` block.
+
+        >>> with ak.reducer_threads(4):
+        ...     totals = ak.sum(array, axis=-1)
+        ...     largest = ak.max(array, axis=-1)
+
+    A reducer that is given an explicit `num_threads` argument uses that
+    instead. Outside of any `with` block, the default that is set by
+    #ak.set_reducer_threads is used.
+    """
+    if num_threads is None:
+        raise ak._v2._util.error(
+            TypeError("num_threads must be a positive integer, not None")
+        )
+    with ak._v2._reducers.threads(num_threads):
+        yield
+
+
+def set_reducer_threads(num_threads):
+    """
+    Args:
+        num_threads (None or int): Number of threads that reductions are
+            split across; if None, the number of CPUs (`os.cpu_count()`).
+
+    Sets the number of threads used by reducers that are called without a
+    `num_threads` argument and outside of an #ak.reducer_threads block, in
+    all threads. Initially, it is 1 (reductions are not split).
+
+    Returns the previous setting, so that it can be restored.
+    """
+    ak._v2._reducers._check_num_threads(num_threads)
+    previous = ak._v2._reducers.num_threads
+    ak._v2._reducers.num_threads = num_threads
+    return previous
@@ -0,0 +1,82 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import json
+import struct
+
+import numpy
+
+import awkward as ak
+
+_magic = b"awkward\x00"
+_alignment = 64
+_footer_length = struct.Struct("<Q")
+
+
+def to_file(array, destination, buffer_key="{form_key}-{attribute}"):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        destination (str or path-like): Local filename to write.
+        buffer_key (str or callable): Passed to #ak.to_buffers. A string
+            is stored in the file, so #ak.from_file does not need it; a
+            callable must also be passed to #ak.from_file.
+
+    Writes an Awkward Array to a single local file that #ak.from_file can
+    open without reading or copying its data.
+
+    The file is the output of #ak.to_buffers laid out on disk: each buffer
+    starts at a 64-byte aligned offset, followed by a JSON footer containing
+    the Form, the length, the `buffer_key` (if it is a string), and the
+    position of each buffer. The layout is
+
+        magic | padding | buffer | padding | buffer | ... | footer | footer size | magic
+
+    where `magic` is the 8 bytes `b"awkward\\x00"` and `footer size` is a
+    little-endian uint64. Since the data are stored as raw buffers, numbers
+    are in the byte order of the machine that wrote them.
+
+    This format is meant for caching intermediate results on a local disk
+    between processing stages, rather than for long-term storage or exchange
+    with other programs (see #ak.to_parquet for that).
+
+    See also #ak.from_file.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.to_file",
+        dict(array=array, destination=destination, buffer_key=buffer_key),
+    ):
+        return _impl(array, destination, buffer_key)
+
+
+def _impl(array, destination, buffer_key):
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    form, length, container = ak._v2.operations.ak_to_buffers._impl(
+        layout, None, buffer_key, "node{id}", 0, ak.nplike.Numpy.instance()
+    )
+
+    buffers = {}
+    with open(destination, "wb") as file:
+        file.write(_magic)
+        position = len(_magic)
+        for key, buffer in container.items():
+            data = numpy.ascontiguousarray(buffer).reshape(-1).view(numpy.uint8)
+
+            padding = -position % _alignment
+            file.write(b"\x00" * padding)
+            position += padding
+
+            file.write(data.data)
+            buffers[key] = [position, len(data)]
+            position += len(data)
+
+        footer = json.dumps(
+            {
+                "form": form.tolist(verbose=True),
+                "length": length,
+                "buffer_key": buffer_key if ak._v2._util.isstr(buffer_key) else None,
+                "buffers": buffers,
+            }
+        ).encode("utf-8")
+        file.write(footer)
+        file.write(_footer_length.pack(len(footer)))
+        file.write(_magic)
@@ -5,6 +5,8 @@ import pathlib
 from urllib.parse import urlparse
 from numbers import Number
 
+import numpy
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
@@ -65,11 +67,16 @@ def to_json(
     Records) into JSON text. Returns bytes (encoded JSON) if `file` is None;
     otherwise, this function returns nothing and writes to a file.
 
-    This function converts the array into Python objects with #ak.to_list, performs
-    some conversions to make the data JSON serializable (`nan_string`, `infinity_string`,
-    `minus_infinity_string`, `complex_record_fields`, `convert_bytes`, `convert_other`),
-    then uses `json.dumps` to return a string or `json.dump` to write to a file
-    (depending on the value of `file`).
+    Unless `num_indent_spaces` is set (without `line_delimited`), the JSON text is
+    assembled column by column from the array's buffers, without creating Python
+    objects for the data, and written to `file` in chunks of 65536 top-level
+    elements, so the full text never has to be held in memory. Arrays with custom
+    behaviors that override `__getitem__`, dates/times, and other types that
+    #ak.to_list would not convert from the buffers alone are instead converted
+    into Python objects with #ak.to_list, made JSON serializable (`nan_string`,
+    `infinity_string`, `minus_infinity_string`, `complex_record_fields`,
+    `convert_bytes`, `convert_other`), then passed to `json.dumps` or `json.dump`.
+    Both give the same output.
 
     If `line_delimited` is True or a line-delimiter string like `"\r\n"`/`os.linesep`,
     the output is line-delimited JSON, variously referred to as "ldjson", "ndjson", and
@@ -182,14 +189,7 @@ def _impl(
     else:
         raise ak._v2._util.error(TypeError(f"unrecognized array type: {repr(array)}"))
 
-    jsondata = out.to_json(
-        nan_string=nan_string,
-        infinity_string=infinity_string,
-        minus_infinity_string=minus_infinity_string,
-        complex_record_fields=complex_record_fields,
-        convert_bytes=convert_bytes,
-        behavior=ak._v2._util.behavior_of(array),
-    )
+    behavior = ak._v2._util.behavior_of(array)
 
     if line_delimited and not ak._v2._util.isstr(line_delimited):
         line_delimited = "\n"
@@ -218,6 +218,39 @@ def _impl(
             def opener():
                 return _NoContextManager(file)
 
+    if line_delimited or num_indent_spaces is None:
+        columnar = _Columnar(
+            behavior,
+            separators,
+            nan_string,
+            infinity_string,
+            minus_infinity_string,
+            complex_record_fields,
+            convert_bytes,
+            convert_other,
+        )
+        if columnar.supported(out):
+            is_record = isinstance(
+                array, (ak._v2.highlevel.Record, ak._v2.record.Record)
+            )
+            if file is None:
+                pieces = []
+                columnar.write(out, pieces.append, line_delimited, is_record)
+                return "".join(pieces)
+            else:
+                with opener() as openfile:
+                    columnar.write(out, openfile.write, line_delimited, is_record)
+                return None
+
+    jsondata = out.to_json(
+        nan_string=nan_string,
+        infinity_string=infinity_string,
+        minus_infinity_string=minus_infinity_string,
+        complex_record_fields=complex_record_fields,
+        convert_bytes=convert_bytes,
+        behavior=behavior,
+    )
+
     try:
         if line_delimited:
             if file is None:
@@ -291,6 +324,251 @@ def _impl(
         raise ak._v2._util.error(err)
 
 
+_chunk_length = 65536
+
+
+class _Columnar:
+    # Writes JSON text directly from a layout's buffers: each node turns its
+    # content's JSON strings (one per element, computed for the whole column
+    # at once) into its own, so that no Python objects are made for the data.
+    # The array is processed in chunks of top-level elements, so that output
+    # can be streamed to a file.
+
+    def __init__(
+        self,
+        behavior,
+        separators,
+        nan_string,
+        infinity_string,
+        minus_infinity_string,
+        complex_record_fields,
+        convert_bytes,
+        convert_other,
+    ):
+        self.behavior = behavior
+        self.item_separator, self.key_separator = separators
+        self.nonfinite = [
+            (numpy.isnan, nan_string),
+            (numpy.isposinf, infinity_string),
+            (numpy.isneginf, minus_infinity_string),
+        ]
+        if (
+            isinstance(complex_record_fields, tuple)
+            and len(complex_record_fields) == 2
+            and isinstance(complex_record_fields[0], str)
+            and isinstance(complex_record_fields[1], str)
+        ):
+            self.complex_record_fields = complex_record_fields
+        else:
+            self.complex_record_fields = None
+        self.convert_bytes = convert_bytes
+        self.dumps = json.JSONEncoder(
+            skipkeys=True,
+            ensure_ascii=True,
+            check_circular=False,
+            allow_nan=False,
+            indent=None,
+            separators=separators,
+            default=convert_other,
+            sort_keys=False,
+        ).encode
+
+    def supported(self, layout):
+        # layouts that #ak.to_list would not convert from the buffers alone
+        # (custom behaviors, dates, etc.) go through Python objects instead
+        if not isinstance(layout.nplike, ak.nplike.Numpy):
+            return False
+
+        if layout.parameter("__array__") in ("string", "bytestring") and (
+            layout.is_ListType or layout.is_RegularType
+        ):
+            return (
+                layout.parameter("__array__") == "string"
+                or self.convert_bytes is not None
+            )
+
+        if layout.parameter("__array__") in ("char", "byte"):
+            return False
+
+        cls = ak._v2._util.arrayclass(layout, self.behavior)
+        if cls.__getitem__ is not ak._v2.highlevel.Array.__getitem__:
+            return False
+
+        if layout.is_UnknownType:
+            return True
+
+        elif layout.is_NumpyType:
+            dtype = layout.dtype
+            if dtype.kind in ("b", "i", "u"):
+                return True
+            elif dtype.kind == "f":
+                return dtype.itemsize <= 8
+            elif dtype.kind == "c":
+                return dtype.itemsize <= 16 and self.complex_record_fields is not None
+            else:
+                return False
+
+        elif layout.is_RecordType or layout.is_UnionType:
+            return all(self.supported(x) for x in layout.contents)
+
+        else:
+            return self.supported(layout.content)
+
+    def write(self, layout, write, line_delimited, is_record):
+        first = True
+        if not line_delimited and not is_record:
+            write("[")
+
+        for start in range(0, layout.length, _chunk_length):
+            chunk = layout[start : start + _chunk_length].packed()
+            strings = self.strings(chunk)
+
+            if line_delimited:
+                write(line_delimited.join(strings))
+                write(line_delimited)
+            elif is_record:
+                write(strings[0])
+            else:
+                if not first:
+                    write(self.item_separator)
+                write(self.item_separator.join(strings))
+            first = False
+
+        if not line_delimited and not is_record:
+            write("]")
+
+    def strings(self, layout):
+        if layout.is_UnknownType:
+            return []
+
+        elif layout.is_NumpyType:
+            data = layout.data
+            if len(data.shape) != 1:
+                return self.strings(layout.toRegularArray())
+            return self.numbers(data)
+
+        elif layout.is_RegularType:
+            size = layout.size
+            starts = numpy.arange(layout.length, dtype=np.int64) * size
+            return self.lists(layout, starts, starts + size)
+
+        elif layout.is_ListType:
+            return self.lists(
+                layout, numpy.asarray(layout.starts), numpy.asarray(layout.stops)
+            )
+
+        elif layout.is_OptionType:
+            layout = layout.toIndexedOptionArray64()
+            # index -1 picks the "null" at the end of the table
+            table = self.table(self.strings(layout.content) + ["null"])
+            return table[numpy.asarray(layout.index)].tolist()
+
+        elif layout.is_IndexedType:
+            table = self.table(self.strings(layout.content))
+            return table[numpy.asarray(layout.index)].tolist()
+
+        elif layout.is_RecordType:
+            template = self.template(layout.fields)
+            columns = [
+                self.strings(layout.content(i)) for i in range(len(layout.contents))
+            ]
+            if len(columns) == 0:
+                return [template] * layout.length
+            return [template % x for x in zip(*columns)]
+
+        elif layout.is_UnionType:
+            tags = numpy.asarray(layout.tags)
+            index = numpy.asarray(layout.index)
+            out = numpy.empty(len(tags), dtype=object)
+            for tag, content in enumerate(layout.contents):
+                mask = tags == tag
+                out[mask] = self.table(self.strings(content))[index[mask]]
+            return out.tolist()
+
+        else:
+            return self.strings(layout.content)
+
+    def numbers(self, data):
+        if data.dtype.kind == "b":
+            return numpy.where(data, "true", "false").tolist()
+
+        elif data.dtype.kind in ("i", "u"):
+            return list(map(str, data.tolist()))
+
+        elif data.dtype.kind == "c":
+            template = self.template(self.complex_record_fields)
+            return [
+                template % x
+                for x in zip(self.numbers(data.real), self.numbers(data.imag))
+            ]
+
+        else:
+            # float32 is widened as in #ak.to_list; float.__repr__ is what json uses
+            data = data.astype(np.float64)
+            out = list(map(float.__repr__, data.tolist()))
+            for isnonfinite, replacement in self.nonfinite:
+                positions = numpy.nonzero(isnonfinite(data))[0]
+                if len(positions) != 0:
+                    if replacement is None:
+                        raise ak._v2._util.error(
+                            ValueError(
+                                "Out of range float values are not JSON compliant: "
+                                + repr(data[positions[0]].item())
+                            )
+                        )
+                    replacement = self.dumps(replacement)
+                    for i in positions:
+                        out[i] = replacement
+            return out
+
+    def lists(self, layout, starts, stops):
+        starts, stops = starts.tolist(), stops.tolist()
+
+        if layout.parameter("__array__") == "string":
+            data = ak._v2._util.tobytes(layout.content.data)
+            encode = json.encoder.encode_basestring_ascii
+            return [
+                encode(data[start:stop].decode(errors="surrogateescape"))
+                for start, stop in zip(starts, stops)
+            ]
+
+        elif layout.parameter("__array__") == "bytestring":
+            data = ak._v2._util.tobytes(layout.content.data)
+            convert_bytes, dumps = self.convert_bytes, self.dumps
+            try:
+                return [
+                    dumps(convert_bytes(data[start:stop]))
+                    for start, stop in zip(starts, stops)
+                ]
+            except Exception as err:
+                raise ak._v2._util.error(err)
+
+        else:
+            content = self.strings(layout.content)
+            join = self.item_separator.join
+            return [
+                "[" + join(content[start:stop]) + "]"
+                for start, stop in zip(starts, stops)
+            ]
+
+    def template(self, fields):
+        encode = json.encoder.encode_basestring_ascii
+        return (
+            "{"
+            + self.item_separator.join(
+                encode(field).replace("%", "%%") + self.key_separator + "%s"
+                for field in fields
+            )
+            + "}"
+        )
+
+    @staticmethod
+    def table(strings):
+        out = numpy.empty(len(strings), dtype=object)
+        out[:] = strings
+        return out
+
+
 class _NoContextManager:
     def __init__(self, file):
         self.file = file
@@ -33,13 +33,6 @@ def to_parquet(
     parquet_extra_options=None,
     hook_after_write=None,
 ):
-    import awkward._v2._connect.pyarrow
-
-    pyarrow_parquet = awkward._v2._connect.pyarrow.import_pyarrow_parquet(
-        "ak.to_parquet"
-    )
-    fsspec = awkward._v2._connect.pyarrow.import_fsspec("ak.to_parquet")
-
     if isinstance(data, (ak._v2.highlevel.Record, ak._v2.record.Record)):
         iterator = iter([data])
     elif isinstance(data, Iterable) and not isinstance(data, Sized):
@@ -53,167 +46,339 @@ def to_parquet(
             )
         )
 
-    row_group = 0
-    array = next(iterator)
-    layout = ak._v2.operations.ak_to_layout.to_layout(
-        array, allow_record=True, allow_other=False
-    )
-    table = ak._v2.operations.ak_to_arrow_table._impl(
-        layout,
-        list_to32,
-        string_to32,
-        bytestring_to32,
-        emptyarray_to,
-        categorical_as_dictionary,
-        extensionarray,
-        count_nulls,
-    )
-
-    if parquet_compliant_nested:
-        list_indicator = "list.element"
-    else:
-        list_indicator = "list.item"
+    with ParquetWriter(
+        destination,
+        list_to32=list_to32,
+        string_to32=string_to32,
+        bytestring_to32=bytestring_to32,
+        emptyarray_to=emptyarray_to,
+        categorical_as_dictionary=categorical_as_dictionary,
+        extensionarray=extensionarray,
+        count_nulls=count_nulls,
+        compression=compression,
+        compression_level=compression_level,
+        row_group_size=row_group_size,
+        data_page_size=data_page_size,
+        parquet_flavor=parquet_flavor,
+        parquet_version=parquet_version,
+        parquet_page_version=parquet_page_version,
+        parquet_metadata_statistics=parquet_metadata_statistics,
+        parquet_dictionary_encoding=parquet_dictionary_encoding,
+        parquet_byte_stream_split=parquet_byte_stream_split,
+        parquet_coerce_timestamps=parquet_coerce_timestamps,
+        parquet_old_int96_timestamps=parquet_old_int96_timestamps,
+        parquet_compliant_nested=parquet_compliant_nested,
+        parquet_extra_options=parquet_extra_options,
+    ) as writer:
+        for row_group, array in enumerate(iterator):
+            layout, table = writer._write(array)
+            if hook_after_write is not None:
+                hook_after_write(
+                    row_group=row_group,
+                    array=array,
+                    layout=layout,
+                    table=table,
+                    writer=writer._writer,
+                )
 
-    if table.column_names == [""]:
-        column_prefix = ("",)
-    else:
-        column_prefix = ()
+    if writer._writer is None:
+        raise ak._v2._util.error(
+            ValueError(
+                "'data' is an empty iterable: at least one array is needed to "
+                "determine the Parquet schema (no file was written)"
+            )
+        )
 
-    if isinstance(layout, ak._v2.record.Record):
-        form = layout.array.form
-    else:
-        form = layout.form
 
-    def parquet_columns(specifier, only=None):
-        if specifier is None:
-            selected_form = form
-        else:
-            selected_form = form.select_columns(specifier)
+class ParquetWriter:
+    """
+    Args:
+        destination (str): Local filename or remote URL, passed to fsspec.
 
-        parquet_column_names = selected_form.columns(
-            list_indicator=list_indicator, column_prefix=column_prefix
-        )
-        if only is not None:
-            column_types = selected_form.column_types()
-            assert len(parquet_column_names) == len(column_types)
-            if only == "string":
-                return [
-                    x
-                    for x, y in zip(parquet_column_names, column_types)
-                    if y == "string"
-                ]
-            elif only == "floating":
-                return [
-                    x
-                    for x, y in zip(parquet_column_names, column_types)
-                    if isinstance(y, np.dtype) and issubclass(y.type, np.floating)
-                ]
-        else:
-            return parquet_column_names
-
-    if compression is True:
-        compression = "zstd"
-    elif compression is False or compression is None:
-        compression = "none"
-    elif isinstance(compression, Mapping):
-        replacement = {}
-        for specifier, value in compression.items():
-            replacement.update({x: value for x in parquet_columns(specifier)})
-        compression = replacement
-
-    if isinstance(compression_level, Mapping):
-        replacement = {}
-        for specifier, value in compression_level.items():
-            replacement.update({x: value for x in parquet_columns(specifier)})
-        compression_level = replacement
-
-    if parquet_metadata_statistics is True:
-        parquet_metadata_statistics = True
-    elif parquet_metadata_statistics is False or parquet_metadata_statistics is None:
-        parquet_metadata_statistics = False
-    elif isinstance(parquet_metadata_statistics, Mapping):
-        replacement = {}
-        for specifier, value in parquet_metadata_statistics.items():
-            replacement.update({x: value for x in parquet_columns(specifier)})
-        parquet_metadata_statistics = [x for x, value in replacement.items() if value]
-    elif isinstance(parquet_metadata_statistics, Sequence):
-        replacement = []
-        for specifier in parquet_metadata_statistics:
-            replacement.extend([x for x in parquet_columns(specifier)])
-        parquet_metadata_statistics = replacement
-
-    if parquet_dictionary_encoding is True:
-        parquet_dictionary_encoding = parquet_columns(None, only="string")
-    elif parquet_dictionary_encoding is False or parquet_dictionary_encoding is None:
-        parquet_dictionary_encoding = False
-    elif isinstance(parquet_dictionary_encoding, Mapping):
-        replacement = {}
-        for specifier, value in parquet_dictionary_encoding.items():
-            replacement.update(
-                {x: value for x in parquet_columns(specifier, only="string")}
-            )
-        parquet_dictionary_encoding = [x for x, value in replacement.items() if value]
-
-    if parquet_byte_stream_split is True:
-        parquet_byte_stream_split = parquet_columns(None, only="floating")
-    elif parquet_byte_stream_split is False or parquet_byte_stream_split is None:
-        parquet_byte_stream_split = False
-    elif isinstance(parquet_byte_stream_split, Mapping):
-        replacement = {}
-        for specifier, value in parquet_byte_stream_split.items():
-            replacement.update(
-                {x: value for x in parquet_columns(specifier, only="floating")}
+    All other arguments are the same as #ak.to_parquet's.
+
+    Writes successive arrays to a Parquet file that stays open between calls,
+    so that an output larger than memory can be written from a streaming job.
+    Each call to #write converts one array (or record) to an Arrow table and
+    writes it as its own row group (or several, if it is longer than
+    `row_group_size`). All arrays must have the same type; the file's schema,
+    compression, statistics, and encoding options are determined by the first.
+
+        >>> with ak.ParquetWriter("output.parquet", compression="zstd") as writer:
+        ...     for batch in ak.iter_parquet("input-*.parquet"):
+        ...         writer.write(process(batch))
+
+    The file is complete when #close is called (or the `with` block exits).
+
+    See also #ak.to_parquet.
+    """
+
+    def __init__(
+        self,
+        destination,
+        list_to32=False,
+        string_to32=True,
+        bytestring_to32=True,
+        emptyarray_to=None,
+        categorical_as_dictionary=False,
+        extensionarray=True,
+        count_nulls=True,
+        compression="zstd",
+        compression_level=None,
+        row_group_size=64 * 1024 * 1024,
+        data_page_size=None,
+        parquet_flavor=None,
+        parquet_version="1.0",
+        parquet_page_version="1.0",
+        parquet_metadata_statistics=True,
+        parquet_dictionary_encoding=False,
+        parquet_byte_stream_split=False,
+        parquet_coerce_timestamps=None,
+        parquet_old_int96_timestamps=None,
+        parquet_compliant_nested=False,
+        parquet_extra_options=None,
+    ):
+        import awkward._v2._connect.pyarrow
+
+        awkward._v2._connect.pyarrow.import_pyarrow_parquet("ak.to_parquet")
+        awkward._v2._connect.pyarrow.import_fsspec("ak.to_parquet")
+
+        self._destination = destination
+        self._list_to32 = list_to32
+        self._string_to32 = string_to32
+        self._bytestring_to32 = bytestring_to32
+        self._emptyarray_to = emptyarray_to
+        self._categorical_as_dictionary = categorical_as_dictionary
+        self._extensionarray = extensionarray
+        self._count_nulls = count_nulls
+        self._compression = compression
+        self._compression_level = compression_level
+        self._row_group_size = row_group_size
+        self._data_page_size = data_page_size
+        self._parquet_flavor = parquet_flavor
+        self._parquet_version = parquet_version
+        self._parquet_page_version = parquet_page_version
+        self._parquet_metadata_statistics = parquet_metadata_statistics
+        self._parquet_dictionary_encoding = parquet_dictionary_encoding
+        self._parquet_byte_stream_split = parquet_byte_stream_split
+        self._parquet_coerce_timestamps = parquet_coerce_timestamps
+        self._parquet_old_int96_timestamps = parquet_old_int96_timestamps
+        self._parquet_compliant_nested = parquet_compliant_nested
+        self._parquet_extra_options = parquet_extra_options
+
+        self._file = None
+        self._writer = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    @property
+    def destination(self):
+        return self._destination
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def write(self, array):
+        """
+        Args:
+            array: Array or record to write as the next row group(s).
+        """
+        self._write(array)
+
+    def _write(self, array):
+        if self._closed:
+            raise ak._v2._util.error(
+                ValueError(f"ParquetWriter for {self._destination!r} is closed")
             )
-        parquet_byte_stream_split = [x for x, value in replacement.items() if value]
-
-    if parquet_extra_options is None:
-        parquet_extra_options = {}
-
-    with fsspec.open(destination, "wb") as file:
-        with pyarrow_parquet.ParquetWriter(
-            destination,
-            table.schema,
-            filesystem=file.fs,
-            flavor=parquet_flavor,
-            version=parquet_version,
-            use_dictionary=parquet_dictionary_encoding,
-            compression=compression,
-            write_statistics=parquet_metadata_statistics,
-            use_deprecated_int96_timestamps=parquet_old_int96_timestamps,
-            compression_level=compression_level,
-            use_byte_stream_split=parquet_byte_stream_split,
-            data_page_version=parquet_page_version,
-            use_compliant_nested_type=parquet_compliant_nested,
-            data_page_size=data_page_size,
-            coerce_timestamps=parquet_coerce_timestamps,
-            **parquet_extra_options,
-        ) as writer:
-            while True:
-                writer.write_table(table, row_group_size=row_group_size)
-                if hook_after_write is not None:
-                    hook_after_write(
-                        row_group=row_group,
-                        array=array,
-                        layout=layout,
-                        table=table,
-                        writer=writer,
+
+        layout = ak._v2.operations.ak_to_layout.to_layout(
+            array, allow_record=True, allow_other=False
+        )
+        table = ak._v2.operations.ak_to_arrow_table._impl(
+            layout,
+            self._list_to32,
+            self._string_to32,
+            self._bytestring_to32,
+            self._emptyarray_to,
+            self._categorical_as_dictionary,
+            self._extensionarray,
+            self._count_nulls,
+        )
+
+        if self._writer is None:
+            self._open(layout, table)
+        elif not table.schema.equals(self._writer.schema):
+            raise ak._v2._util.error(
+                ValueError(
+                    "all arrays written to a ParquetWriter must have the same type; "
+                    "this one has Arrow schema\n\n{}\n\nbut the file has\n\n{}".format(
+                        table.schema, self._writer.schema
                     )
+                )
+            )
 
-                row_group += 1
+        self._writer.write_table(table, row_group_size=self._row_group_size)
+        return layout, table
+
+    def close(self):
+        """
+        Finishes the Parquet file. If no arrays were written, no file is created.
+        """
+        if not self._closed:
+            self._closed = True
+            if self._writer is not None:
                 try:
-                    array = next(iterator)
-                except StopIteration:
-                    break
-                layout = ak._v2.operations.ak_to_layout.to_layout(
-                    array, allow_record=True, allow_other=False
+                    self._writer.close()
+                finally:
+                    self._file.__exit__(None, None, None)
+
+    def _open(self, layout, table):
+        import fsspec
+        import pyarrow.parquet as pyarrow_parquet
+
+        if self._parquet_compliant_nested:
+            list_indicator = "list.element"
+        else:
+            list_indicator = "list.item"
+
+        if table.column_names == [""]:
+            column_prefix = ("",)
+        else:
+            column_prefix = ()
+
+        if isinstance(layout, ak._v2.record.Record):
+            form = layout.array.form
+        else:
+            form = layout.form
+
+        def parquet_columns(specifier, only=None):
+            if specifier is None:
+                selected_form = form
+            else:
+                selected_form = form.select_columns(specifier)
+
+            parquet_column_names = selected_form.columns(
+                list_indicator=list_indicator, column_prefix=column_prefix
+            )
+            if only is not None:
+                column_types = selected_form.column_types()
+                assert len(parquet_column_names) == len(column_types)
+                if only == "string":
+                    return [
+                        x
+                        for x, y in zip(parquet_column_names, column_types)
+                        if y == "string"
+                    ]
+                elif only == "floating":
+                    return [
+                        x
+                        for x, y in zip(parquet_column_names, column_types)
+                        if isinstance(y, np.dtype) and issubclass(y.type, np.floating)
+                    ]
+            else:
+                return parquet_column_names
+
+        compression = self._compression
+        if compression is True:
+            compression = "zstd"
+        elif compression is False or compression is None:
+            compression = "none"
+        elif isinstance(compression, Mapping):
+            replacement = {}
+            for specifier, value in compression.items():
+                replacement.update({x: value for x in parquet_columns(specifier)})
+            compression = replacement
+
+        compression_level = self._compression_level
+        if isinstance(compression_level, Mapping):
+            replacement = {}
+            for specifier, value in compression_level.items():
+                replacement.update({x: value for x in parquet_columns(specifier)})
+            compression_level = replacement
+
+        parquet_metadata_statistics = self._parquet_metadata_statistics
+        if parquet_metadata_statistics is True:
+            parquet_metadata_statistics = True
+        elif (
+            parquet_metadata_statistics is False or parquet_metadata_statistics is None
+        ):
+            parquet_metadata_statistics = False
+        elif isinstance(parquet_metadata_statistics, Mapping):
+            replacement = {}
+            for specifier, value in parquet_metadata_statistics.items():
+                replacement.update({x: value for x in parquet_columns(specifier)})
+            parquet_metadata_statistics = [
+                x for x, value in replacement.items() if value
+            ]
+        elif isinstance(parquet_metadata_statistics, Sequence):
+            replacement = []
+            for specifier in parquet_metadata_statistics:
+                replacement.extend([x for x in parquet_columns(specifier)])
+            parquet_metadata_statistics = replacement
+
+        parquet_dictionary_encoding = self._parquet_dictionary_encoding
+        if parquet_dictionary_encoding is True:
+            parquet_dictionary_encoding = parquet_columns(None, only="string")
+        elif (
+            parquet_dictionary_encoding is False or parquet_dictionary_encoding is None
+        ):
+            parquet_dictionary_encoding = False
+        elif isinstance(parquet_dictionary_encoding, Mapping):
+            replacement = {}
+            for specifier, value in parquet_dictionary_encoding.items():
+                replacement.update(
+                    {x: value for x in parquet_columns(specifier, only="string")}
                 )
-                table = ak._v2.operations.ak_to_arrow_table._impl(
-                    layout,
-                    list_to32,
-                    string_to32,
-                    bytestring_to32,
-                    emptyarray_to,
-                    categorical_as_dictionary,
-                    extensionarray,
-                    count_nulls,
+            parquet_dictionary_encoding = [
+                x for x, value in replacement.items() if value
+            ]
+
+        parquet_byte_stream_split = self._parquet_byte_stream_split
+        if parquet_byte_stream_split is True:
+            parquet_byte_stream_split = parquet_columns(None, only="floating")
+        elif parquet_byte_stream_split is False or parquet_byte_stream_split is None:
+            parquet_byte_stream_split = False
+        elif isinstance(parquet_byte_stream_split, Mapping):
+            replacement = {}
+            for specifier, value in parquet_byte_stream_split.items():
+                replacement.update(
+                    {x: value for x in parquet_columns(specifier, only="floating")}
                 )
+            parquet_byte_stream_split = [x for x, value in replacement.items() if value]
+
+        parquet_extra_options = self._parquet_extra_options
+        if parquet_extra_options is None:
+            parquet_extra_options = {}
+
+        self._file = fsspec.open(self._destination, "wb")
+        file = self._file.__enter__()
+        opened = False
+        try:
+            self._writer = pyarrow_parquet.ParquetWriter(
+                self._destination,
+                table.schema,
+                filesystem=file.fs,
+                flavor=self._parquet_flavor,
+                version=self._parquet_version,
+                use_dictionary=parquet_dictionary_encoding,
+                compression=compression,
+                write_statistics=parquet_metadata_statistics,
+                use_deprecated_int96_timestamps=self._parquet_old_int96_timestamps,
+                compression_level=compression_level,
+                use_byte_stream_split=parquet_byte_stream_split,
+                data_page_version=self._parquet_page_version,
+                use_compliant_nested_type=self._parquet_compliant_nested,
+                data_page_size=self._data_page_size,
+                coerce_timestamps=self._parquet_coerce_timestamps,
+                **parquet_extra_options,
+            )
+            opened = True
+        finally:
+            if not opened:
+                self._file.__exit__(None, None, None)
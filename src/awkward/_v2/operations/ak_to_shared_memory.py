@@ -0,0 +1,235 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+import sys
+
+import numpy
+
+import awkward as ak
+
+_alignment = 64
+
+# shared memory blocks attached by from_shared_memory in this process, by name
+_attached = {}
+
+
+def to_shared_memory(array):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+
+    Copies the buffers of `array` (see #ak.to_buffers) into one block of
+    `multiprocessing.shared_memory`, each buffer 64-byte aligned, and returns
+    a #ak.SharedMemoryHandle for it.
+
+    The handle is small and can be pickled, so it can be sent to worker
+    processes, which call #ak.from_shared_memory to get an array that views
+    the block without copying it. The data are copied once, here, rather than
+    once per worker.
+
+        >>> handle = ak.to_shared_memory(array)
+        >>> with concurrent.futures.ProcessPoolExecutor() as executor:
+        ...     results = list(executor.map(analyze, [handle] * 8))
+        >>> handle.unlink()
+
+    where `analyze` starts with `array = ak.from_shared_memory(handle)`.
+
+    The block exists until #ak.SharedMemoryHandle.unlink is called by its
+    owner (the process that called this function), or until the handle is
+    used as a context manager and its `with` block ends. Arrays made by
+    #ak.from_shared_memory must not be used after the block is unlinked and
+    closed.
+
+    Requires Python 3.8 or later.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.to_shared_memory",
+        dict(array=array),
+    ):
+        return _impl(array)
+
+
+def _impl(array):
+    from multiprocessing import shared_memory
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    packed = ak._v2.operations.packed(layout, highlevel=False)
+    form, length, container = ak._v2.operations.ak_to_buffers._impl(
+        packed,
+        None,
+        "{form_key}-{attribute}",
+        "node{id}",
+        0,
+        ak.nplike.Numpy.instance(),
+    )
+
+    buffers = {}
+    datas = []
+    position = 0
+    for key, buffer in container.items():
+        data = numpy.ascontiguousarray(buffer).reshape(-1).view(numpy.uint8)
+        position += -position % _alignment
+        buffers[key] = (position, len(data))
+        datas.append(data)
+        position += len(data)
+
+    # a block of size zero is not allowed
+    block = shared_memory.SharedMemory(create=True, size=max(position, 1))
+    filled = False
+    try:
+        target = numpy.frombuffer(block.buf, dtype=numpy.uint8)
+        for data, (start, size) in zip(datas, buffers.values()):
+            target[start : start + size] = data
+        del target
+        filled = True
+    finally:
+        if not filled:
+            block.close()
+            block.unlink()
+
+    handle = SharedMemoryHandle(
+        block.name, form.to_json(), length, buffers, _resource_tracker()
+    )
+    handle._block = block
+    handle._owner = True
+    return handle
+
+
+def _resource_tracker():
+    # identifies this process's multiprocessing resource tracker by its pipe,
+    # which is shared with forked and spawned child processes; only needed
+    # before Python 3.13, which has SharedMemory(track=False)
+    if sys.version_info >= (3, 13) or os.name != "posix":
+        return None
+    from multiprocessing import resource_tracker
+
+    # not public API: if it isn't there, attached blocks are left registered,
+    # as they would be by multiprocessing itself
+    try:
+        fd = resource_tracker._resource_tracker._fd
+    except AttributeError:
+        return None
+    if fd is None:
+        return None
+    stat = os.fstat(fd)
+    return stat.st_dev, stat.st_ino
+
+
+class SharedMemoryHandle:
+    """
+    A reference to an array in `multiprocessing.shared_memory`, made by
+    #ak.to_shared_memory. Pickling it sends only its name, Form, length, and
+    buffer positions; pass it to #ak.from_shared_memory to get the array.
+    """
+
+    def __init__(self, name, form, length, buffers, tracker=None):
+        self._name = name
+        self._form = form
+        self._length = length
+        self._buffers = buffers
+        self._tracker = tracker
+        self._block = None
+        self._owner = False
+
+    def __getstate__(self):
+        return self._name, self._form, self._length, self._buffers, self._tracker
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __repr__(self):
+        return "<SharedMemoryHandle {} length={} nbytes={}{}>".format(
+            repr(self._name),
+            self._length,
+            self.nbytes,
+            " owner" if self._owner else "",
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        try:
+            if self._owner:
+                self.unlink()
+        finally:
+            if exception_type is None:
+                self.close()
+            else:
+                # arrays referenced by the traceback can keep the block in
+                # use; don't hide the exception that is propagating
+                try:
+                    self.close()
+                except BufferError:
+                    pass
+
+    @property
+    def name(self):
+        """
+        Name of the shared memory block.
+        """
+        return self._name
+
+    @property
+    def form(self):
+        return ak._v2.forms.from_json(self._form)
+
+    @property
+    def length(self):
+        return self._length
+
+    @property
+    def nbytes(self):
+        return sum(size for _, size in self._buffers.values())
+
+    def _attach(self):
+        if self._block is None:
+            self._block = _attached.get(self._name)
+        if self._block is None:
+            from multiprocessing import shared_memory
+
+            if sys.version_info >= (3, 13):
+                self._block = shared_memory.SharedMemory(name=self._name, track=False)
+            else:
+                self._block = shared_memory.SharedMemory(name=self._name)
+                # before Python 3.13, attaching registers the block with this
+                # process's resource tracker, which would unlink it when this
+                # process exits; unless the tracker is shared with the owner
+                # (forked or spawned workers), where the registration is the
+                # owner's own, take the block out of it
+                tracker = _resource_tracker()
+                if tracker is not None and tracker != self._tracker:
+                    from multiprocessing import resource_tracker
+
+                    resource_tracker.unregister(self._block._name, "shared_memory")
+            _attached[self._name] = self._block
+        return self._block
+
+    def close(self):
+        """
+        Detaches this process from the shared memory block. Arrays made from
+        this handle by #ak.from_shared_memory in this process must be deleted
+        first (if they are in reference cycles, collected with `gc.collect()`).
+        """
+        if self._block is not None:
+            try:
+                self._block.close()
+            except BufferError:
+                raise ak._v2._util.error(
+                    BufferError(
+                        f"arrays made from shared memory block {self._name!r} "
+                        "are still in use in this process; delete them before "
+                        "closing the SharedMemoryHandle"
+                    )
+                ) from None
+            if _attached.get(self._name) is self._block:
+                del _attached[self._name]
+            self._block = None
+
+    def unlink(self):
+        """
+        Destroys the shared memory block, once all processes have closed it.
+        Should only be called once, by the process that created it.
+        """
+        self._attach().unlink()
+        self._owner = False
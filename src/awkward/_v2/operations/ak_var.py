@@ -155,6 +155,13 @@ def _impl(x, weight, ddof, axis, keepdims, mask_identity, flatten_records):
             ak._v2.operations.to_layout(weight, allow_record=False, allow_other=False)
         )
 
+    if weight is None and axis is not None and x.layout.form.columns() == [""]:
+        # count, sum, and sum of squared deviations in a single pass
+        out = ak._v2.operations.ak_describe._impl(
+            x, ddof, axis, keepdims, mask_identity, flatten_records
+        )
+        return None if out is None else out["var"]
+
     with np.errstate(invalid="ignore"):
         xmean = ak._v2.operations.ak_mean._impl(
             x, weight, axis, False, mask_identity, flatten_records
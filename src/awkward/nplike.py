@@ -3,6 +3,8 @@
 # v2: keep this file, but modernize the 'of' function; ptr_lib is gone.
 
 import ctypes
+import sys
+import time
 
 from collections.abc import Iterable
 
@@ -118,6 +120,23 @@ if hasattr(numpy, "timedelta64"):
     NumpyMetadata.timedelta64 = numpy.timedelta64
 
 
+# active ak._v2.profile(memory=True) contexts, which are told about every
+# new NumPy buffer that the nplike functions allocate
+allocation_trackers = ()
+
+
+def _allocated(out, function, args=()):
+    if (
+        len(allocation_trackers) != 0
+        and type(out) is numpy.ndarray
+        and out.flags.owndata
+        and not (len(args) != 0 and out is args[0])
+    ):
+        for tracker in allocation_trackers:
+            tracker.allocated(out, function)
+    return out
+
+
 class NumpyLike(Singleton):
     known_data = True
     known_shape = True
@@ -127,15 +146,17 @@ class NumpyLike(Singleton):
 
     def array(self, *args, **kwargs):
         # data[, dtype=[, copy=]]
-        return self._module.array(*args, **kwargs)
+        return _allocated(self._module.array(*args, **kwargs), "array", args)
 
     def asarray(self, *args, **kwargs):
         # array[, dtype=][, order=]
-        return self._module.asarray(*args, **kwargs)
+        return _allocated(self._module.asarray(*args, **kwargs), "asarray", args)
 
     def ascontiguousarray(self, *args, **kwargs):
         # array[, dtype=]
-        return self._module.ascontiguousarray(*args, **kwargs)
+        return _allocated(
+            self._module.ascontiguousarray(*args, **kwargs), "ascontiguousarray", args
+        )
 
     def isscalar(self, *args, **kwargs):
         return self._module.isscalar(*args, **kwargs)
@@ -146,37 +167,37 @@ class NumpyLike(Singleton):
 
     def zeros(self, *args, **kwargs):
         # shape/len[, dtype=]
-        return self._module.zeros(*args, **kwargs)
+        return _allocated(self._module.zeros(*args, **kwargs), "zeros")
 
     def ones(self, *args, **kwargs):
         # shape/len[, dtype=]
-        return self._module.ones(*args, **kwargs)
+        return _allocated(self._module.ones(*args, **kwargs), "ones")
 
     def empty(self, *args, **kwargs):
         # shape/len[, dtype=]
-        return self._module.empty(*args, **kwargs)
+        return _allocated(self._module.empty(*args, **kwargs), "empty")
 
     def full(self, *args, **kwargs):
         # shape/len, value[, dtype=]
-        return self._module.full(*args, **kwargs)
+        return _allocated(self._module.full(*args, **kwargs), "full")
 
     def zeros_like(self, *args, **kwargs):
         # array
-        return self._module.zeros_like(*args, **kwargs)
+        return _allocated(self._module.zeros_like(*args, **kwargs), "zeros_like")
 
     def ones_like(self, *args, **kwargs):
         # array
-        return self._module.ones_like(*args, **kwargs)
+        return _allocated(self._module.ones_like(*args, **kwargs), "ones_like")
 
     def full_like(self, *args, **kwargs):
         # array, fill_value
-        return self._module.full_like(*args, **kwargs)
+        return _allocated(self._module.full_like(*args, **kwargs), "full_like")
 
     def arange(self, *args, **kwargs):
         # stop[, dtype=]
         # start, stop[, dtype=]
         # start, stop, step[, dtype=]
-        return self._module.arange(*args, **kwargs)
+        return _allocated(self._module.arange(*args, **kwargs), "arange")
 
     def meshgrid(self, *args, **kwargs):
         # *arrays, indexing="ij"
@@ -228,7 +249,7 @@ class NumpyLike(Singleton):
 
     def concatenate(self, *args, **kwargs):
         # arrays
-        return self._module.concatenate(*args, **kwargs)
+        return _allocated(self._module.concatenate(*args, **kwargs), "concatenate")
 
     def repeat(self, *args, **kwargs):
         # array, int
@@ -390,11 +411,34 @@ class NumpyLike(Singleton):
         return self._module.datetime_as_string(*args, **kwargs)
 
 
+# active ak._v2.profile contexts, which are told about every kernel call
+profilers = ()
+
+
 class NumpyKernel:
     def __init__(self, kernel, name_and_types):
         self._kernel = kernel
         self._name_and_types = name_and_types
 
+        # casting plan: the pointer type for each argument that is passed as a
+        # pointer, None for arguments that are passed through unchanged
+        argtypes = getattr(kernel, "argtypes", None) or ()
+        self._plan = tuple(
+            t if issubclass(t, ctypes._Pointer) else None for t in argtypes
+        )
+
+        # a private handle on the same C function that takes pointers as
+        # void*, so that NumPy arrays are passed by address without casting
+        if isinstance(kernel, ctypes._CFuncPtr):
+            self._call = type(kernel)((kernel.__name__, ak._cpu_kernels.lib))
+            self._call.argtypes = [
+                t if p is None else ctypes.c_void_p
+                for t, p in zip(argtypes, self._plan)
+            ]
+            self._call.restype = kernel.restype
+        else:
+            self._call = kernel
+
     def __repr__(self):
         return "<{} {}{}>".format(
             type(self).__name__,
@@ -421,14 +465,34 @@ class NumpyKernel:
             return x
 
     def __call__(self, *args):
-        assert len(args) == len(self._kernel.argtypes)
+        assert len(args) == len(self._plan)
 
-        from awkward._v2._util import is_jax_tracer
+        # JAX tracers can only exist if JAX has been imported
+        if "jax" in sys.modules:
+            from awkward._v2._util import is_jax_tracer
 
-        if not any(is_jax_tracer(arg) for arg in args):
-            return self._kernel(
-                *(self._cast(x, t) for x, t in zip(args, self._kernel.argtypes))
-            )
+            if any(is_jax_tracer(arg) for arg in args):
+                return None
+
+        if len(profilers) != 0:
+            start = time.perf_counter()
+            out = self._call(*self._cast_all(args))
+            stop = time.perf_counter()
+            for profiler in profilers:
+                profiler.record(self._name_and_types, args, stop - start)
+            return out
+
+        return self._call(*self._cast_all(args))
+
+    def _cast_all(self, args):
+        return [
+            x
+            if t is None
+            else x.ctypes.data
+            if type(x) is numpy.ndarray
+            else self._cast(x, t)
+            for x, t in zip(args, self._plan)
+        ]
 
 
 class CupyKernel(NumpyKernel):
@@ -511,10 +575,16 @@ class Numpy(NumpyLike):
             raise TypeError("to_rectilinear argument must be iterable")
 
     def __getitem__(self, name_and_types):
-        return NumpyKernel(ak._cpu_kernels.kernel[name_and_types], name_and_types)
+        out = self._kernels.get(name_and_types)
+        if out is None:
+            out = self._kernels[name_and_types] = NumpyKernel(
+                ak._cpu_kernels.kernel[name_and_types], name_and_types
+            )
+        return out
 
     def __init__(self):
         self._module = numpy
+        self._kernels = {}
 
     @property
     def ma(self):
@@ -773,12 +843,18 @@ class Jax(NumpyLike):
             )
 
     def __getitem__(self, name_and_types):
-        return NumpyKernel(ak._cpu_kernels.kernel[name_and_types], name_and_types)
+        out = self._kernels.get(name_and_types)
+        if out is None:
+            out = self._kernels[name_and_types] = NumpyKernel(
+                ak._cpu_kernels.kernel[name_and_types], name_and_types
+            )
+        return out
 
     def __init__(self):
         from awkward._v2._connect.jax import import_jax  # noqa: F401
 
         self._module = import_jax().numpy
+        self._kernels = {}
 
     @property
     def ma(self):
@@ -2,9 +2,6 @@
 
 # v2: change to pull in classes from src/awkward/_v2/types/*.py.
 
-# Typeparser
-from awkward._typeparser.parser import from_datashape
-
 # Types
 from awkward._ext import Type
 from awkward._ext import ArrayType
@@ -17,6 +14,13 @@ from awkward._ext import UnionType
 from awkward._ext import RecordType
 
 
+# Typeparser (the generated parser is imported on first use)
+def from_datashape(typestr, high_level=False):
+    import awkward._typeparser.parser
+
+    return awkward._typeparser.parser.from_datashape(typestr, high_level)
+
+
 __all__ = [
     "from_datashape",
     "Type",
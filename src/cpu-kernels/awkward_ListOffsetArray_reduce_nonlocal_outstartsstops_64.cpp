@@ -13,38 +13,26 @@ ERROR awkward_ListOffsetArray_reduce_nonlocal_outstartsstops_64(
   int64_t outlength) {
   int64_t maxcount = (outlength == 0) ? lendistincts : lendistincts / outlength;
 
-  int64_t j = 0;
-  int64_t k = 0;
-  int64_t maxdistinct = -2;
-  int64_t lasti = -1;
-  for (int64_t i = 0;  i < lendistincts;  i++) {
-    if (maxdistinct < distincts[i]) {
-      maxdistinct = distincts[i];
-
-      int64_t extra = (i - lasti)/maxcount;
-      lasti = i;
-
-      int64_t numgappy = gaps[j];
-      if (numgappy < extra) {
-        numgappy = extra;
-      }
-
-      for (int64_t gappy = 0;  gappy < numgappy;  gappy++) {
-        outstarts[k] = i;
-        outstops[k] = i;
-        k++;
-      }
-      j++;
+  // the reduced values of group k are at k*maxcount + (position in the list),
+  // so its stop is at the first unused position (-1) in its block; an empty
+  // group starts and stops where the next non-empty group starts (gaps is
+  // not needed to find them)
+  int64_t next = lendistincts + 1;
+  for (int64_t k = outlength - 1;  k >= 0;  k--) {
+    int64_t start = k*maxcount;
+    int64_t stop = start;
+    while (stop < start + maxcount  &&  distincts[stop] != -1) {
+      stop++;
     }
-
-    if (distincts[i] != -1) {
-      outstops[k - 1] = i + 1;
+    if (stop == start) {
+      outstarts[k] = next;
+      outstops[k] = next;
+    }
+    else {
+      outstarts[k] = start;
+      outstops[k] = stop;
+      next = start;
     }
-  }
-
-  for (;  k < outlength;  k++) {
-    outstarts[k] = lendistincts + 1;
-    outstops[k] = lendistincts + 1;
   }
 
   return success();
@@ -0,0 +1,76 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import subprocess
+import sys
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def imported_after(code):
+    out = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sys.modules))"],
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    return set(out.stdout.decode().splitlines()[-1].split())
+
+
+def test_import_is_lazy():
+    modules = imported_after("import awkward")
+    assert "awkward" in modules
+    for name in [
+        "awkward._v2",
+        "awkward._connect._numba",
+        "awkward._connect._numexpr",
+        "awkward._connect._autograd",
+        "awkward._connect._jax",
+        "awkward._typeparser.generated_parser",
+        "pkg_resources",
+        "setuptools",
+    ]:
+        assert name not in modules
+
+
+def test_lazy_attributes():
+    modules = imported_after(
+        "import awkward as ak\n"
+        "assert ak._v2.Array([1, 2, 3]).tolist() == [1, 2, 3]\n"
+        "assert callable(ak.numexpr.evaluate)\n"
+        "assert callable(ak.jax.register)\n"
+        "assert callable(ak.numba.register)\n"
+        "assert callable(ak._connect._numba.register_and_check)\n"
+        "assert str(ak.types.from_datashape('int64')) == 'int64'"
+    )
+    for name in [
+        "awkward._v2",
+        "awkward._connect._numba",
+        "awkward._connect._numexpr",
+        "awkward._connect._jax",
+        "awkward._typeparser.generated_parser",
+    ]:
+        assert name in modules
+
+
+def test_dir_and_all():
+    assert "numba" in dir(ak)
+    assert "jax" in ak.__all__
+    assert "to_list" in ak.__all__
+    assert "importlib" not in ak.__all__
+    with pytest.raises(AttributeError):
+        ak.no_such_attribute
+    with pytest.raises(AttributeError):
+        ak._connect._no_such_connector
+
+
+def test_kernels_are_bound_on_first_use():
+    kernels = ak._cpu_kernels.kernel
+    signature = ("awkward_RegularArray_num", np.int64)
+    assert signature in kernels
+    assert len(kernels) > 500
+    function = kernels[signature]
+    assert function.dir == ["out", "in", "in"]
+    assert kernels[signature] is function
+    with pytest.raises(KeyError):
+        kernels["awkward_no_such_kernel", np.int64]
@@ -0,0 +1,149 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+class LoggingContainer(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requested = []
+
+    def __getitem__(self, key):
+        self.requested.append(key)
+        return super().__getitem__(key)
+
+
+def test_structure_without_reading():
+    original = ak._v2.Array(
+        [
+            {"x": 1.1, "y": [1, 2], "z": [None, "one"]},
+            {"x": 2.2, "y": [], "z": ["two"]},
+            {"x": 3.3, "y": [3], "z": []},
+        ]
+    )
+    form, length, container = ak._v2.to_buffers(original)
+    container = LoggingContainer(container)
+
+    lazy = ak._v2.from_buffers(form, length, container, lazy=True)
+    assert len(lazy) == 3
+    assert lazy.fields == ["x", "y", "z"]
+    assert str(lazy.type) == str(original.type)
+    assert lazy.layout.form == original.layout.form
+    assert container.requested == []
+
+    assert ak._v2.sum(lazy.y, axis=1).tolist() == [3, 0, 3]
+    assert set(container.requested) == {
+        "node2-offsets",
+        "node3-data",
+    }
+
+    assert lazy.tolist() == original.tolist()
+    assert set(container.requested) == set(container.keys())
+
+
+@pytest.mark.parametrize(
+    "original",
+    [
+        ak._v2.Array([[{"x": 1, "y": 1.1}], [], [{"x": 2, "y": 2.2}]]),
+        ak._v2.to_regular(ak._v2.Array([[[1, 2], [3, 4]], [], [[5, 6]]]), axis=2),
+        ak._v2.Array(
+            ak._v2.contents.ListOffsetArray(
+                ak._v2.index.Index64(np.array([0, 3, 3, 5])),
+                ak._v2.contents.BitMaskedArray(
+                    ak._v2.index.IndexU8(np.array([0b10101], np.uint8)),
+                    ak._v2.contents.NumpyArray(np.arange(5)),
+                    True,
+                    5,
+                    True,
+                ),
+            )
+        ),
+    ],
+)
+def test_nested_structure_without_reading(original):
+    form, length, container = ak._v2.to_buffers(original)
+    container = LoggingContainer(container)
+
+    lazy = ak._v2.from_buffers(form, length, container, lazy=True)
+    assert len(lazy) == 3
+    assert lazy.fields == original.fields
+    assert str(lazy.type) == str(original.type)
+    assert lazy.layout.form == original.layout.form
+    assert container.requested == []
+
+    assert lazy.tolist() == original.tolist()
+    assert set(container.requested) == set(container.keys())
+
+
+def test_buffers_read_once():
+    original = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    form, length, container = ak._v2.to_buffers(original)
+    container = LoggingContainer(container)
+
+    lazy = ak._v2.from_buffers(form, length, container, lazy=True)
+    assert (lazy + 1).tolist() == [[2, 3, 4], [], [5, 6]]
+    assert (lazy * 2).tolist() == [[2, 4, 6], [], [8, 10]]
+    assert sorted(container.requested) == ["node0-offsets", "node1-data"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [1, 2, 3],
+        [[1.1, 2.2], [], [3.3]],
+        [[[1], []], [[2, 3]]],
+        [1, None, 3],
+        ["one", "two", None],
+        [1, "two", [3, 3, 3]],
+        [(1, [1.1]), (2, [])],
+        [{"x": [None, {"y": 1}]}, {"x": []}],
+    ],
+)
+def test_round_trip(data):
+    original = ak._v2.Array(data)
+    lazy = ak._v2.from_buffers(*ak._v2.to_buffers(original), lazy=True)
+    assert lazy.tolist() == original.tolist()
+    assert str(lazy.type) == str(original.type)
+
+
+def test_regular_and_masked():
+    original = ak._v2.to_regular(ak._v2.Array([[1, 2], [3, 4], [5, 6]]), axis=1)
+    lazy = ak._v2.from_buffers(*ak._v2.to_buffers(original), lazy=True)
+    assert lazy.tolist() == [[1, 2], [3, 4], [5, 6]]
+
+    layout = ak._v2.contents.ByteMaskedArray(
+        ak._v2.index.Index8(np.array([1, 0, 1], np.int8)),
+        ak._v2.contents.NumpyArray(np.array([1.1, 2.2, 3.3])),
+        valid_when=True,
+    )
+    lazy = ak._v2.from_buffers(*ak._v2.to_buffers(layout), lazy=True)
+    assert lazy.tolist() == [1.1, None, 3.3]
+
+
+def test_virtual_buffer():
+    numpy = ak.nplike.Numpy.instance()
+    calls = []
+
+    def generate():
+        calls.append(None)
+        return np.arange(5, dtype=np.int64)
+
+    buffer = ak._v2._virtual.VirtualBuffer(numpy, 5, (), np.int64, generate)
+    layout = ak._v2.contents.NumpyArray(buffer)
+    assert layout.is_virtual
+    assert layout.length == 5
+    assert layout.dtype == np.dtype(np.int64)
+    assert calls == []
+
+    assert ak._v2.to_list(layout) == [0, 1, 2, 3, 4]
+    assert not layout.is_virtual
+    assert ak._v2.to_list(layout) == [0, 1, 2, 3, 4]
+    assert len(calls) == 1
+
+    buffer = ak._v2._virtual.VirtualBuffer(
+        numpy, 5, (), np.int64, lambda: np.arange(4, dtype=np.int64)
+    )
+    with pytest.raises(ValueError):
+        ak._v2.contents.NumpyArray(buffer).data
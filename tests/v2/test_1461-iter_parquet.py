@@ -0,0 +1,111 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    array = ak._v2.Array(
+        [{"x": i, "y": [i] * (i % 3), "z": str(i)} for i in range(100)]
+    )
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    ak._v2.to_parquet(array, filename, row_group_size=30)
+    return array, filename
+
+
+@pytest.mark.parametrize("read_ahead", [False, True])
+def test_row_groups(dataset, read_ahead):
+    array, filename = dataset
+    batches = list(ak._v2.iter_parquet(filename, read_ahead=read_ahead))
+    assert [len(x) for x in batches] == [30, 30, 30, 10]
+    assert all(x.layout.form == batches[0].layout.form for x in batches)
+    assert ak._v2.concatenate(batches).tolist() == array.tolist()
+
+    batches = list(
+        ak._v2.iter_parquet(filename, row_groups={3, 1}, read_ahead=read_ahead)
+    )
+    assert [len(x) for x in batches] == [30, 10]
+    assert batches[1].tolist() == array[90:].tolist()
+
+
+@pytest.mark.parametrize("read_ahead", [False, True])
+def test_batch_size(dataset, read_ahead):
+    array, filename = dataset
+    batches = list(ak._v2.iter_parquet(filename, batch_size=25, read_ahead=read_ahead))
+    assert [len(x) for x in batches] == [25, 25, 25, 25]
+    assert ak._v2.concatenate(batches).tolist() == array.tolist()
+
+    batches = list(
+        ak._v2.iter_parquet(
+            filename, columns="y", row_groups={0}, batch_size=7, read_ahead=read_ahead
+        )
+    )
+    assert [len(x) for x in batches] == [7, 7, 7, 7, 2]
+    assert batches[0].fields == ["y"]
+    assert ak._v2.concatenate(batches).tolist() == array[["y"]][:30].tolist()
+
+
+def test_same_as_from_parquet(dataset):
+    array, filename = dataset
+    batches = list(ak._v2.iter_parquet(filename, columns=["x", "z"]))
+    assert (
+        ak._v2.concatenate(batches).tolist()
+        == ak._v2.from_parquet(filename, columns=["x", "z"]).tolist()
+    )
+
+
+def test_multiple_files(tmp_path):
+    one = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    two = ak._v2.Array([[6], [7, 8]])
+    ak._v2.to_parquet(one, os.path.join(tmp_path, "one.parquet"))
+    ak._v2.to_parquet(two, os.path.join(tmp_path, "two.parquet"))
+
+    batches = list(ak._v2.iter_parquet(str(tmp_path), batch_size=2))
+    assert sorted(len(x) for x in batches) == [1, 2, 2]
+    assert sorted(ak._v2.concatenate(batches).tolist()) == sorted(
+        one.tolist() + two.tolist()
+    )
+
+
+def test_bad_batch_size(dataset):
+    array, filename = dataset
+    with pytest.raises(ValueError):
+        ak._v2.iter_parquet(filename, batch_size=0)
+    with pytest.raises(ValueError):
+        ak._v2.iter_parquet(filename, batch_size=-1)
+    with pytest.raises(TypeError):
+        ak._v2.iter_parquet(filename, batch_size=2.5)
+
+
+@pytest.mark.parametrize("batch_size", [None, 25])
+def test_open_parquet_file_options(dataset, batch_size, monkeypatch):
+    import fsspec.parquet
+
+    array, filename = dataset
+    original = fsspec.parquet.open_parquet_file
+    calls = []
+
+    def open_parquet_file(*args, **kwargs):
+        calls.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(fsspec.parquet, "open_parquet_file", open_parquet_file)
+
+    batches = list(
+        ak._v2.iter_parquet(
+            filename, batch_size=batch_size, max_gap=123, footer_sample_size=4567
+        )
+    )
+    assert ak._v2.concatenate(batches).tolist() == array.tolist()
+    calls = [x for x in calls if x["row_groups"] != []]  # not the metadata
+    assert len(calls) == 4
+    assert all(x["max_gap"] == 123 for x in calls)
+    assert all(x["footer_sample_size"] == 4567 for x in calls)
@@ -0,0 +1,54 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+def test_one_file(tmp_path):
+    array = ak._v2.Array(
+        [
+            {"x": i, "y": [i] * (i % 3), "z": None if i % 5 == 0 else str(i)}
+            for i in range(100)
+        ]
+    )
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    ak._v2.to_parquet(array, filename, row_group_size=15)
+
+    sequential = ak._v2.from_parquet(filename)
+    concurrent = ak._v2.from_parquet(filename, num_threads=4)
+    assert concurrent.tolist() == sequential.tolist() == array.tolist()
+    assert str(concurrent.type) == str(sequential.type)
+
+    concurrent = ak._v2.from_parquet(
+        filename, columns=["y"], row_groups={5, 0, 2}, num_threads=2
+    )
+    assert (
+        concurrent.tolist()
+        == ak._v2.from_parquet(filename, columns=["y"], row_groups={0, 2, 5}).tolist()
+    )
+
+
+def test_many_files(tmp_path):
+    one = ak._v2.Array([[1.1, 2.2], [], [3.3]])
+    two = ak._v2.Array([[4.4]])
+    ak._v2.to_parquet(one, os.path.join(tmp_path, "one.parquet"))
+    ak._v2.to_parquet(two, os.path.join(tmp_path, "two.parquet"))
+
+    assert (
+        ak._v2.from_parquet(str(tmp_path), num_threads=3).tolist()
+        == ak._v2.from_parquet(str(tmp_path)).tolist()
+    )
+
+
+def test_bad_num_threads(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    ak._v2.to_parquet(ak._v2.Array([1, 2, 3]), filename)
+    with pytest.raises(TypeError):
+        ak._v2.from_parquet(filename, num_threads=0)
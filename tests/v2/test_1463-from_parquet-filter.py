@@ -0,0 +1,73 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+@pytest.fixture
+def filename(tmp_path):
+    array = ak._v2.Array(
+        [
+            {"x": i, "muons": [{"pt": float(i + j)} for j in range(i % 3)], "s": str(i)}
+            for i in range(100)
+        ]
+    )
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    ak._v2.to_parquet(array, filename, row_group_size=25)
+    return filename
+
+
+def test_flat_column(filename):
+    assert len(ak._v2.from_parquet(filename)) == 100
+    assert ak._v2.from_parquet(filename, filter=("x", ">", 80)).x.tolist() == list(
+        range(75, 100)
+    )
+    assert ak._v2.from_parquet(filename, filter=("x", "<=", 25)).x.tolist() == list(
+        range(50)
+    )
+    assert ak._v2.from_parquet(filename, filter=("x", "==", 30)).x.tolist() == list(
+        range(25, 50)
+    )
+    assert ak._v2.from_parquet(filename, filter=("x", "in", [3, 99])).x.tolist() == (
+        list(range(25)) + list(range(75, 100))
+    )
+    assert len(ak._v2.from_parquet(filename, filter=("x", ">", 1000))) == 0
+
+
+def test_list_column(filename):
+    out = ak._v2.from_parquet(filename, filter=("muons.pt", ">=", 76))
+    assert out.x.tolist() == list(range(75, 100))
+
+
+def test_conjunction(filename):
+    out = ak._v2.from_parquet(filename, filter=[("x", ">=", 25), ("x", "<", 50)])
+    assert out.x.tolist() == list(range(25, 50))
+
+
+def test_with_row_groups_and_columns(filename):
+    out = ak._v2.from_parquet(
+        filename, columns=["x"], row_groups={0, 3}, filter=("x", ">", 10)
+    )
+    assert out.fields == ["x"]
+    assert out.x.tolist() == list(range(25)) + list(range(75, 100))
+
+
+def test_iter_parquet(filename):
+    batches = list(ak._v2.iter_parquet(filename, filter=("x", "<", 30)))
+    assert [len(x) for x in batches] == [25, 25]
+
+
+def test_errors(filename):
+    with pytest.raises(ValueError):
+        ak._v2.from_parquet(filename, filter=("nope", ">", 1))
+    with pytest.raises(TypeError):
+        ak._v2.from_parquet(filename, filter=("x", "~", 1))
+    with pytest.raises(TypeError):
+        ak._v2.from_parquet(filename, filter=("x", ">", "one"))
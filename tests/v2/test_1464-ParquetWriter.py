@@ -0,0 +1,92 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+def test_incremental(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    batches = [
+        ak._v2.Array([{"x": i, "y": [i] * (i % 3)} for i in range(start, start + 10)])
+        for start in range(0, 50, 10)
+    ]
+
+    with ak._v2.ParquetWriter(filename, compression="snappy") as writer:
+        assert not os.path.exists(filename)
+        for batch in batches:
+            writer.write(batch)
+    assert writer.closed
+
+    metadata = ak._v2.metadata_from_parquet(filename)
+    assert metadata.metadata.num_row_groups == 5
+    assert (
+        ak._v2.from_parquet(filename).tolist() == ak._v2.concatenate(batches).tolist()
+    )
+    assert [len(x) for x in ak._v2.iter_parquet(filename)] == [10] * 5
+
+
+def test_row_group_size(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    with ak._v2.ParquetWriter(filename, row_group_size=4) as writer:
+        writer.write(ak._v2.Array([[1, 2], [], [3]] * 3))
+        writer.write(ak._v2.Array([[4]]))
+
+    assert [len(x) for x in ak._v2.iter_parquet(filename)] == [4, 4, 1, 1]
+
+
+def test_sliced_batches(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    array = ak._v2.Array([[1.1, 2.2], [], [3.3], [4.4, 5.5]])
+    with ak._v2.ParquetWriter(filename) as writer:
+        writer.write(array[:2])
+        writer.write(array[2:])
+
+    assert ak._v2.from_parquet(filename).tolist() == array.tolist()
+
+
+def test_mismatched_type(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    with ak._v2.ParquetWriter(filename) as writer:
+        writer.write(ak._v2.Array([1, 2, 3]))
+        with pytest.raises(ValueError):
+            writer.write(ak._v2.Array([[1, 2, 3]]))
+        writer.write(ak._v2.Array([4]))
+
+    assert ak._v2.from_parquet(filename).tolist() == [1, 2, 3, 4]
+
+    with pytest.raises(ValueError):
+        writer.write(ak._v2.Array([5]))
+
+
+def test_hook_after_write(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    row_groups = []
+
+    def hook(row_group, array, layout, table, writer):
+        row_groups.append((row_group, len(table)))
+
+    ak._v2.to_parquet(
+        iter([ak._v2.Array([1, 2]), ak._v2.Array([3])]),
+        filename,
+        hook_after_write=hook,
+    )
+    assert row_groups == [(0, 2), (1, 1)]
+    assert ak._v2.from_parquet(filename).tolist() == [1, 2, 3]
+
+
+def test_empty_iterator(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    with pytest.raises(ValueError):
+        ak._v2.to_parquet(iter([]), filename)
+    assert not os.path.exists(filename)
+
+    with pytest.raises(ValueError):
+        ak._v2.to_parquet((x for x in []), filename)
+    assert not os.path.exists(filename)
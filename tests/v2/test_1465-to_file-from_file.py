@@ -0,0 +1,108 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [1, 2, 3],
+        [[1.1, 2.2], [], [3.3]],
+        [[[1], []], [[2, 3]]],
+        [1, None, 3],
+        ["one", "two", None],
+        [1, "two", [3, 3, 3]],
+        [(1, [1.1]), (2, [])],
+        [{"x": [None, {"y": 1}]}, {"x": []}],
+        [],
+    ],
+)
+def test_round_trip(tmp_path, data):
+    filename = os.path.join(tmp_path, "whatever.awkward")
+    original = ak._v2.Array(data)
+    ak._v2.to_file(original, filename)
+    array = ak._v2.from_file(filename)
+    assert array.tolist() == original.tolist()
+    assert str(array.type) == str(original.type)
+
+
+def test_memory_mapped(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.awkward")
+    original = ak._v2.Array(
+        [{"x": 1.1, "y": [1, 2]}, {"x": 2.2, "y": []}, {"x": 3.3, "y": [3]}]
+    )
+    ak._v2.to_file(original, filename)
+    array = ak._v2.from_file(filename)
+
+    offsets = array.layout.contents[1].offsets.data
+    data = array.layout.contents[0].data
+    for buffer in (offsets, data):
+        assert isinstance(buffer.base, np.memmap) or isinstance(
+            buffer.base.base, np.memmap
+        )
+        assert buffer.__array_interface__["data"][0] % 64 == 0
+        assert not buffer.flags.writeable
+
+    assert ak._v2.sum(array.y, axis=1).tolist() == [3, 0, 3]
+
+
+def test_regular_and_parameters(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.awkward")
+    original = ak._v2.with_name(
+        ak._v2.Array([{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}]), "Point"
+    )
+    ak._v2.to_file(original, filename)
+    array = ak._v2.from_file(filename)
+    assert array.layout.form == original.layout.form
+    assert array.tolist() == original.tolist()
+
+    original = ak._v2.from_numpy(np.arange(2 * 3 * 5).reshape(2, 3, 5))
+    ak._v2.to_file(original, filename)
+    assert ak._v2.from_file(filename).tolist() == original.tolist()
+
+
+def test_not_an_awkward_file(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.awkward")
+    with open(filename, "wb") as file:
+        file.write(b"this is not an Awkward Array file")
+    with pytest.raises(ValueError):
+        ak._v2.from_file(filename)
+
+
+def test_buffers_are_read_on_first_access(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.awkward")
+    original = ak._v2.Array([[1, None, 3], None, [4]])
+    ak._v2.to_file(original, filename)
+    array = ak._v2.from_file(filename)
+    assert str(array.type) == str(original.type)
+
+    outer = array.layout.index._virtual
+    inner = array.layout.content.content.index._virtual
+    assert not outer.is_materialized
+    assert not inner.is_materialized
+
+    assert array.tolist() == original.tolist()
+    assert outer.is_materialized
+    assert inner.is_materialized
+
+
+def test_buffer_key_is_stored(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.awkward")
+    original = ak._v2.Array([[1.1, 2.2], [], [3.3]])
+
+    ak._v2.to_file(original, filename, buffer_key="{attribute}:{form_key}")
+    assert ak._v2.from_file(filename).tolist() == original.tolist()
+
+    def buffer_key(form_key, attribute, **kwargs):
+        return f"{attribute}/{form_key}"
+
+    ak._v2.to_file(original, filename, buffer_key=buffer_key)
+    with pytest.raises(TypeError):
+        ak._v2.from_file(filename)
+    assert ak._v2.from_file(filename, buffer_key=buffer_key).tolist() == (
+        original.tolist()
+    )
@@ -0,0 +1,73 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pickle
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.mark.skipif(
+    pickle.HIGHEST_PROTOCOL < 5, reason="pickle protocol 5 requires Python 3.8"
+)
+def test_out_of_band_array():
+    original = ak._v2.Array(
+        [{"x": 1.1, "y": [1, 2]}, {"x": 2.2, "y": []}, {"x": 3.3, "y": [3]}]
+    )
+    buffers = []
+    serialized = pickle.dumps(original, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 3
+
+    array = pickle.loads(serialized, buffers=buffers)
+    assert array.tolist() == original.tolist()
+    assert array.layout.form == original.layout.form
+
+    # the unpickled array views the buffers that were passed in
+    data = np.frombuffer(buffers[0], dtype=np.uint8)
+    assert any(
+        np.shares_memory(data, np.asarray(x).view(np.uint8))
+        for x in (
+            array.layout.contents[0].data,
+            array.layout.contents[1].offsets.data,
+            array.layout.contents[1].content.data,
+        )
+    )
+
+
+@pytest.mark.skipif(
+    pickle.HIGHEST_PROTOCOL < 5, reason="pickle protocol 5 requires Python 3.8"
+)
+def test_out_of_band_record():
+    original = ak._v2.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": [2.2, 3.3]}])[1]
+    buffers = []
+    serialized = pickle.dumps(original, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) != 0
+
+    record = pickle.loads(serialized, buffers=buffers)
+    assert isinstance(record, ak._v2.Record)
+    assert record.tolist() == {"x": 2, "y": [2.2, 3.3]}
+
+
+@pytest.mark.skipif(
+    pickle.HIGHEST_PROTOCOL < 5, reason="pickle protocol 5 requires Python 3.8"
+)
+def test_data_not_in_stream():
+    original = ak._v2.Array(np.arange(100000, dtype=np.float64))
+    buffers = []
+    serialized = pickle.dumps(original, protocol=5, buffer_callback=buffers.append)
+    assert len(serialized) < 1000
+    assert sum(x.raw().nbytes for x in buffers) == 800000
+    assert pickle.loads(serialized, buffers=buffers).tolist() == original.tolist()
+
+    assert len(pickle.dumps(original, protocol=5)) > 800000
+
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_in_band(protocol):
+    original = ak._v2.Array([[1, 2, 3], [], [4, 5]], with_name="Whatever")
+    array = pickle.loads(pickle.dumps(original, protocol=protocol))
+    assert array.tolist() == original.tolist()
+    assert str(array.type) == str(original.type)
+
+    record = pickle.loads(pickle.dumps(ak._v2.Record({"x": 1}), protocol=protocol))
+    assert record.tolist() == {"x": 1}
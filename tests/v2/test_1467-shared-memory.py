@@ -0,0 +1,120 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import gc
+import multiprocessing
+import pickle
+import subprocess
+import sys
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="multiprocessing.shared_memory requires 3.8"
+)
+
+
+def sum_of_y(handle):
+    array = ak._v2.from_shared_memory(handle)
+    out = ak._v2.sum(array.y)
+    del array
+    gc.collect()
+    handle.close()
+    return out
+
+
+def test_round_trip():
+    original = ak._v2.Array(
+        [{"x": 1.1, "y": [1, 2]}, {"x": 2.2, "y": []}, {"x": 3.3, "y": [3]}]
+    )
+    with ak._v2.to_shared_memory(original) as handle:
+        assert len(pickle.dumps(handle)) < 1000
+        remote = pickle.loads(pickle.dumps(handle))
+
+        array = ak._v2.from_shared_memory(remote)
+        assert array.tolist() == original.tolist()
+        assert array.layout.form == original.layout.form
+        assert not array.layout.contents[0].data.flags.writeable
+
+        # the block is only attached once per process
+        again = ak._v2.from_shared_memory(pickle.loads(pickle.dumps(handle)))
+        assert np.shares_memory(
+            array.layout.contents[0].data, again.layout.contents[0].data
+        )
+
+        del array, again
+        gc.collect()
+        remote.close()
+
+
+def test_sliced_and_empty():
+    original = ak._v2.Array([[1, 2, 3], [], [4, 5], [6]])[1:3]
+    with ak._v2.to_shared_memory(original) as handle:
+        assert ak._v2.from_shared_memory(handle).tolist() == [[], [4, 5]]
+        assert handle.nbytes == 3 * 8 + 2 * 8
+
+    with ak._v2.to_shared_memory(ak._v2.Array([])) as handle:
+        assert ak._v2.from_shared_memory(handle).tolist() == []
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_worker_processes():
+    original = ak._v2.Array([{"x": i, "y": list(range(i % 4))} for i in range(1000)])
+    with ak._v2.to_shared_memory(original) as handle:
+        with multiprocessing.get_context("fork").Pool(2) as pool:
+            results = pool.map(sum_of_y, [handle] * 4)
+
+    assert results == [ak._v2.sum(original.y)] * 4
+
+
+def test_separate_process():
+    original = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    with ak._v2.to_shared_memory(original) as handle:
+        code = (
+            "import pickle, sys\n"
+            "import awkward as ak\n"
+            "handle = pickle.loads(sys.stdin.buffer.read())\n"
+            "array = ak._v2.from_shared_memory(handle)\n"
+            "print(array.tolist())\n"
+            "del array\n"
+            "handle.close()\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            input=pickle.dumps(handle),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+        assert out.stdout.decode().strip() == str(original.tolist())
+        assert b"leaked" not in out.stderr
+
+        # the block outlives the process that attached to it
+        again = pickle.loads(pickle.dumps(handle))
+        assert ak._v2.from_shared_memory(again).tolist() == original.tolist()
+        gc.collect()
+        again.close()
+
+
+def test_close_on_exception():
+    with pytest.raises(ZeroDivisionError):
+        with ak._v2.to_shared_memory(ak._v2.Array([1, 2, 3])) as handle:
+            1 / 0
+    assert handle._block is None
+
+    # an array that is still in use doesn't replace the exception
+    with pytest.raises(ZeroDivisionError):
+        with ak._v2.to_shared_memory(ak._v2.Array([1, 2, 3])) as handle:
+            array = ak._v2.from_shared_memory(handle)
+            1 / 0
+    del array
+    handle.close()
+    assert handle._block is None
+
+
+def test_bad_handle():
+    with pytest.raises(TypeError):
+        ak._v2.from_shared_memory("not a handle")
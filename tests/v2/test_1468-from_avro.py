@@ -0,0 +1,150 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+fastavro = pytest.importorskip("fastavro")
+
+schema = {
+    "type": "record",
+    "name": "Event",
+    "namespace": "test",
+    "fields": [
+        {"name": "b", "type": "boolean"},
+        {"name": "i", "type": "int"},
+        {"name": "l", "type": "long"},
+        {"name": "d", "type": "double"},
+        {"name": "s", "type": "string"},
+        {"name": "by", "type": "bytes"},
+        {"name": "fx", "type": {"type": "fixed", "name": "Three", "size": 3}},
+        {
+            "name": "e",
+            "type": {"type": "enum", "name": "Color", "symbols": ["R", "G", "B"]},
+        },
+        {
+            "name": "a",
+            "type": {"type": "array", "items": {"type": "array", "items": "double"}},
+        },
+        {"name": "m", "type": {"type": "map", "values": "long"}},
+        {"name": "o", "type": ["null", "string"]},
+        {"name": "u", "type": ["int", "string", "null"]},
+        {
+            "name": "r",
+            "type": {
+                "type": "record",
+                "name": "Inner",
+                "fields": [{"name": "x", "type": "float"}],
+            },
+        },
+        {"name": "r2", "type": ["null", "Inner"]},
+    ],
+}
+
+
+def make_records(n):
+    return [
+        {
+            "b": i % 2 == 0,
+            "i": -i,
+            "l": i * 10**12,
+            "d": i * 1.1,
+            "s": "x" * (i % 5),
+            "by": bytes([i % 256]),
+            "fx": b"abc",
+            "e": "RGB"[i % 3],
+            "a": [[j * 1.5] * j for j in range(i % 4)],
+            "m": {str(j): j for j in range(i % 3)},
+            "o": None if i % 2 else str(i),
+            "u": [i, str(i), None][i % 3],
+            "r": {"x": i + 0.5},
+            "r2": None if i % 3 == 0 else {"x": -i - 0.5},
+        }
+        for i in range(n)
+    ]
+
+
+def expected(records):
+    out = []
+    for record in records:
+        record = dict(record)
+        record["m"] = [{"key": k, "value": v} for k, v in record["m"].items()]
+        out.append(record)
+    return out
+
+
+def write(records, codec="null", sync_interval=16000):
+    file = io.BytesIO()
+    fastavro.writer(
+        file,
+        fastavro.parse_schema(schema),
+        records,
+        codec=codec,
+        sync_interval=sync_interval,
+    )
+    return file.getvalue()
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate", "bzip2", "xz"])
+def test_types(codec):
+    records = make_records(30)
+    array = ak._v2.from_avro(write(records, codec))
+    assert array.tolist() == expected(records)
+    assert str(array.type) == (
+        "30 * {b: bool, i: int32, l: int64, d: float64, s: string, by: bytes, "
+        "fx: bytes, e: string, a: var * var * float64, m: var * {key: string, "
+        "value: int64}, o: ?string, u: union[?int32, ?string], r: {x: float32}, "
+        "r2: ?{x: float32}}"
+    )
+    assert array.e.layout.parameter("__array__") == "categorical"
+    assert array.fx.layout.size == 3
+
+
+@pytest.mark.parametrize("num_threads", [1, 2, 3, 8])
+def test_num_threads(num_threads):
+    records = make_records(200)
+    data = write(records, "deflate", sync_interval=500)
+    single = ak._v2.from_avro(data)
+    array = ak._v2.from_avro(data, num_threads=num_threads)
+    assert array.layout.form == single.layout.form
+    assert array.tolist() == expected(records)
+
+
+def test_sources(tmp_path):
+    records = make_records(10)
+    data = write(records)
+    filename = os.path.join(tmp_path, "whatever.avro")
+    with open(filename, "wb") as file:
+        file.write(data)
+
+    assert ak._v2.from_avro(filename).tolist() == expected(records)
+    with open(filename, "rb") as file:
+        assert ak._v2.from_avro(file).tolist() == expected(records)
+
+    assert len(ak._v2.from_avro(write([]))) == 0
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak._v2.from_avro(b"not an Avro file")
+
+    recursive = {
+        "type": "record",
+        "name": "Node",
+        "fields": [
+            {"name": "value", "type": "int"},
+            {"name": "next", "type": ["null", "Node"]},
+        ],
+    }
+    file = io.BytesIO()
+    fastavro.writer(
+        file, fastavro.parse_schema(recursive), [{"value": 1, "next": None}]
+    )
+    with pytest.raises(NotImplementedError):
+        ak._v2.from_avro(file.getvalue())
+
+    with pytest.raises(TypeError):
+        ak._v2.from_avro(write([]), num_threads=0)
@@ -0,0 +1,86 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+import json
+import os
+import pathlib
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+from awkward._v2.operations.ak_from_json_new import from_json
+
+records = [{"x": i, "y": [i] * (i % 3), "s": str(i)} for i in range(1000)]
+text = "\n".join(json.dumps(x) for x in records) + "\n"
+
+
+@pytest.mark.parametrize("num_threads", [1, 2, 3, 7, 2000])
+def test_bytes(num_threads):
+    array = from_json(text, line_delimited=True, num_threads=num_threads)
+    assert array.tolist() == records
+    assert str(array.type) == "1000 * {x: int64, y: var * int64, s: string}"
+
+
+def test_file(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.json")
+    with open(filename, "w") as file:
+        file.write(text)
+
+    array = from_json(pathlib.Path(filename), line_delimited=True, num_threads=4)
+    assert array.tolist() == records
+
+    with open(filename, "rb") as file:
+        array = from_json(file, line_delimited=True, num_threads=4)
+    assert array.tolist() == records
+
+
+def test_merged_types():
+    array = from_json("1\n2\n\n3.5\n\n", line_delimited=True, num_threads=3)
+    assert array.tolist() == [1, 2, 3.5]
+    assert str(array.type) == "3 * float64"
+
+    array = from_json("", line_delimited=True, num_threads=3)
+    assert len(array) == 0
+
+
+@pytest.mark.skipif(
+    not hasattr(ak._ext, "SpecializedJSON"), reason="needs SpecializedJSON"
+)
+def test_schema():
+    schema = {
+        "type": "object",
+        "properties": {
+            "x": {"type": "integer"},
+            "y": {"type": "array", "items": {"type": "integer"}},
+            "s": {"type": "string"},
+        },
+    }
+    one = from_json(text, line_delimited=True, schema=schema)
+    four = from_json(text, line_delimited=True, schema=schema, num_threads=4)
+    assert one.layout.form == four.layout.form
+    assert one.tolist() == four.tolist() == records
+
+
+def test_bad_num_threads():
+    with pytest.raises(TypeError):
+        from_json(text, line_delimited=True, num_threads=0)
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        ['{"x": 1}', '{"x": 2}', '{"x": 3, "y": 4}', '{"x": 5}'],
+        ["[]", "[]", "[1, 2]", "[3]"],
+        ["1", "null", "2", '"three"', "4"],
+    ],
+)
+def test_same_type_as_serial(lines):
+    source = "\n".join(lines)
+    one = from_json(source, line_delimited=True, num_threads=1)
+    four = from_json(source, line_delimited=True, num_threads=4)
+    assert one.layout.form == four.layout.form
+    assert one.tolist() == four.tolist()
+
+    four = from_json(io.BytesIO(source.encode()), line_delimited=True, num_threads=4)
+    assert one.layout.form == four.layout.form
@@ -0,0 +1,66 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+import json
+import os
+import pathlib
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+records = [{"x": i, "y": [i] * (i % 3)} for i in range(100)]
+text = "\n".join(json.dumps(x) for x in records) + "\n"
+
+
+@pytest.mark.parametrize("buffersize", [7, 100, 65536])
+def test_batch_size(buffersize):
+    batches = list(ak._v2.iter_json(text, batch_size=30, buffersize=buffersize))
+    assert [len(x) for x in batches] == [30, 30, 30, 10]
+    assert ak._v2.concatenate(batches).tolist() == records
+
+
+@pytest.mark.parametrize("buffersize", [7, 100, 65536])
+def test_batch_bytes(buffersize):
+    batches = list(ak._v2.iter_json(text, batch_bytes=200, buffersize=buffersize))
+    assert all(len(x) > 0 for x in batches)
+    assert ak._v2.concatenate(batches).tolist() == records
+    for batch in batches[:-1]:
+        size = sum(len(json.dumps(x)) + 1 for x in batch.tolist())
+        assert size <= 200
+
+    both = list(
+        ak._v2.iter_json(text, batch_size=5, batch_bytes=200, buffersize=buffersize)
+    )
+    assert max(len(x) for x in both) == 5
+    assert ak._v2.concatenate(both).tolist() == records
+
+
+def test_per_read():
+    batches = list(ak._v2.iter_json(text, buffersize=256))
+    assert len(batches) > 1
+    assert ak._v2.concatenate(batches).tolist() == records
+
+
+def test_sources(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.json")
+    with open(filename, "w") as file:
+        file.write(text)
+
+    batches = list(ak._v2.iter_json(pathlib.Path(filename), batch_size=40))
+    assert [len(x) for x in batches] == [40, 40, 20]
+
+    stream = io.BytesIO(b'{"x": 1}\n\n\n{"x": 2}\n{"x": 3}')
+    batches = list(ak._v2.iter_json(stream, batch_size=2, buffersize=4))
+    assert ak._v2.concatenate(batches).tolist() == [{"x": 1}, {"x": 2}, {"x": 3}]
+    assert not stream.closed
+
+
+def test_long_line():
+    batches = list(ak._v2.iter_json("[1, 2, 3, 4, 5]\n[6]\n", batch_bytes=4))
+    assert [x.tolist() for x in batches] == [[[1, 2, 3, 4, 5]], [[6]]]
+
+
+def test_bad_batch_size():
+    with pytest.raises(TypeError):
+        ak._v2.iter_json(text, batch_size=0)
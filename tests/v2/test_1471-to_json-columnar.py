@@ -0,0 +1,116 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import json
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_json = ak._v2.operations.ak_to_json
+
+
+def through_python(array, **kwargs):
+    return json.dumps(
+        ak._v2.to_list(array),
+        separators=(
+            "," + " " * kwargs.get("num_readability_spaces", 0),
+            ":" + " " * kwargs.get("num_readability_spaces", 0),
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        ak._v2.Array([[1.1, 2.2, None], [], None, [3.3]]),
+        ak._v2.Array(
+            [
+                {"x": 1, "y": 'héllo\n"', "z": [True, False]},
+                {"x": 2, "y": "", "z": []},
+            ]
+        ),
+        ak._v2.Array([1, "two", [3], {"a%s": 4}, None]),
+        ak._v2.Array(np.arange(24, dtype=np.float32).reshape(2, 3, 4) / 7),
+        ak._v2.Array([[[1, 2], [3]], [[4]]])[:, ::-1],
+        ak._v2.Array([1.1, 2.2, 3.3])[[2, 0, 0]],
+        ak._v2.to_regular(ak._v2.Array([[1, 2], [3, 4]]), axis=1),
+        ak._v2.Array([]),
+        ak._v2.Array([{"x": {}}]),
+        ak._v2.Array(np.array([1e300, 1e-300, 1e16, 5e-324, -0.0])),
+        ak._v2.Array(np.array([0, 2**64 - 1], np.uint64)),
+    ],
+)
+@pytest.mark.parametrize("num_readability_spaces", [0, 1])
+def test_same_as_python(array, num_readability_spaces):
+    assert to_json._Columnar(
+        None, (",", ":"), None, None, None, None, None, None
+    ).supported(array.layout)
+    expected = through_python(array, num_readability_spaces=num_readability_spaces)
+    assert (
+        ak._v2.to_json(array, num_readability_spaces=num_readability_spaces) == expected
+    )
+    assert ak._v2.to_json(array, line_delimited=True) == "".join(
+        json.dumps(x, separators=(",", ":")) + "\n" for x in array.tolist()
+    )
+
+
+def test_tuple_and_record():
+    array = ak._v2.Array([(1, 2.5), (3, -0.0)])
+    assert ak._v2.to_json(array) == '[{"0":1,"1":2.5},{"0":3,"1":-0.0}]'
+
+    array = ak._v2.Array([{"x": 1, "y": [1, 2]}, {"x": 2, "y": []}])
+    assert ak._v2.to_json(array[1]) == '{"x":2,"y":[]}'
+
+
+def test_conversions():
+    array = ak._v2.Array([1.5, np.nan, np.inf, -np.inf])
+    assert (
+        ak._v2.to_json(
+            array, nan_string="NaN", infinity_string="inf", minus_infinity_string="-inf"
+        )
+        == '[1.5,"NaN","inf","-inf"]'
+    )
+    with pytest.raises(ValueError):
+        ak._v2.to_json(array)
+
+    array = ak._v2.Array([1 + 2j, 3.5 - 1j])
+    assert (
+        ak._v2.to_json(array, complex_record_fields=("r", "i"))
+        == '[{"r":1.0,"i":2.0},{"r":3.5,"i":-1.0}]'
+    )
+
+    array = ak._v2.Array([b"ab", b"\x00"])
+    assert ak._v2.to_json(array, convert_bytes=bytes.hex) == '["6162","00"]'
+
+
+def test_chunks(tmp_path):
+    array = ak._v2.Array([[i, i + 0.5] for i in range(3 * to_json._chunk_length + 5)])
+    expected = through_python(array)
+    assert ak._v2.to_json(array) == expected
+
+    filename = os.path.join(tmp_path, "whatever.json")
+    ak._v2.to_json(array, filename)
+    with open(filename) as file:
+        assert file.read() == expected
+
+    filename = os.path.join(tmp_path, "whatever.jsonl")
+    ak._v2.to_json(array, filename, line_delimited=True)
+    with open(filename) as file:
+        assert [json.loads(x) for x in file] == array.tolist()
+
+
+def test_custom_behavior_falls_back():
+    class Point(ak._v2.highlevel.Array):
+        def __getitem__(self, where):
+            return "point"
+
+    ak._v2.behavior["*", "point"] = Point
+    try:
+        array = ak._v2.Array([{"x": 1, "y": 2}, {"x": 3, "y": 4}], with_name="point")
+        assert not to_json._Columnar(
+            None, (",", ":"), None, None, None, None, None, None
+        ).supported(array.layout)
+        assert ak._v2.to_json(array) == '["point","point"]'
+    finally:
+        del ak._v2.behavior["*", "point"]
@@ -0,0 +1,74 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_option_types():
+    content = ak._v2.contents.NumpyArray(np.array([1.1, 2.2, 3.3, 4.4]))
+
+    indexedoption = ak._v2.contents.IndexedOptionArray(
+        ak._v2.index.Index64(np.array([2, -1, -1, 0, 3, -1])), content
+    )
+    assert indexedoption.to_list() == [3.3, None, None, 1.1, 4.4, None]
+
+    bytemasked = ak._v2.contents.ByteMaskedArray(
+        ak._v2.index.Index8(np.array([1, 0, 1, 0], np.int8)), content, valid_when=True
+    )
+    assert bytemasked.to_list() == [1.1, None, 3.3, None]
+
+    bitmasked = ak._v2.contents.BitMaskedArray(
+        ak._v2.index.IndexU8(np.array([0b0110], np.uint8)),
+        content,
+        valid_when=False,
+        length=3,
+        lsb_order=True,
+    )
+    assert bitmasked.to_list() == [1.1, None, None]
+
+
+def test_union():
+    array = ak._v2.Array([1, "two", [3], None, {"x": 4}, 5])
+    assert array.to_list() == [1, "two", [3], None, {"x": 4}, 5]
+
+
+def test_records_and_tuples():
+    array = ak._v2.Array([{"x": 1, "y": [1, 2]}, {"x": 2, "y": []}])
+    assert array.to_list() == [{"x": 1, "y": [1, 2]}, {"x": 2, "y": []}]
+    assert array[["x"]][1:].to_list() == [{"x": 2}]
+
+    array = ak._v2.Array([(1, "a"), (2, "b"), (3, "c")])
+    assert array[1:].to_list() == [(2, "b"), (3, "c")]
+
+    record = ak._v2.contents.RecordArray([], [], length=2)
+    assert record.to_list() == [{}, {}]
+
+
+def test_lists_and_strings():
+    array = ak._v2.Array([["a", "bc"], [], ["déf"]])
+    assert array[::-1].to_list() == [["déf"], [], ["a", "bc"]]
+    assert ak._v2.Array([b"ab", b"", b"c"]).to_list() == [b"ab", b"", b"c"]
+
+    regular = ak._v2.to_regular(ak._v2.Array([[1, 2], [3, 4], [5, 6]]), axis=1)
+    assert regular.to_list() == [[1, 2], [3, 4], [5, 6]]
+    assert ak._v2.to_regular(ak._v2.Array([[], []]), axis=1).to_list() == [[], []]
+
+    strings = ak._v2.contents.RegularArray(
+        ak._v2.contents.NumpyArray(
+            np.frombuffer(b"abcdef", np.uint8), parameters={"__array__": "char"}
+        ),
+        3,
+        parameters={"__array__": "string"},
+    )
+    assert strings.to_list() == ["abc", "def"]
+
+
+def test_large_option():
+    # missing values used to be inserted one by one
+    values = np.arange(200000, dtype=np.int64)
+    index = np.where(values % 3 == 0, -1, values)
+    array = ak._v2.contents.IndexedOptionArray(
+        ak._v2.index.Index64(index), ak._v2.contents.NumpyArray(values)
+    )
+    assert array.to_list() == [None if x % 3 == 0 else x for x in range(200000)]
@@ -0,0 +1,168 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+data = [
+    {"x": 1.1, "y": [1, 2], "s": "one", "o": None, "t": (1, b"a")},
+    {"x": 2.2, "y": [], "s": "", "o": 2, "t": (2, b"")},
+    {"x": 3.3, "y": [3], "s": "thrée", "o": 3, "t": (3, b"ccc")},
+]
+
+
+def test_from_iter():
+    form = ak._v2.from_iter(data).layout.form
+    array = ak._v2.from_iter(data, form=form)
+    assert array.tolist() == data
+    assert str(array.type) == str(ak._v2.from_iter(data).type)
+
+    array = ak._v2.from_iter(data * 1000, form=form.to_json())
+    assert len(array) == 3000
+    assert array[-3:].tolist() == data
+
+    record = ak._v2.from_iter(data[0], form=form)
+    assert isinstance(record, ak._v2.highlevel.Record)
+    assert record.tolist() == data[0]
+
+
+def test_forms():
+    form = ak._v2.forms.from_iter(
+        {
+            "class": "RegularArray",
+            "size": 2,
+            "content": {
+                "class": "ByteMaskedArray",
+                "mask": "i8",
+                "valid_when": True,
+                "content": "int32",
+            },
+        }
+    )
+    array = ak._v2.from_iter([[1, None], [3, 4]], form=form)
+    assert array.tolist() == [[1, None], [3, 4]]
+    assert str(array.type) == "2 * 2 * ?int32"
+
+    array = ak._v2.from_iter(
+        [[[1, 2], [3, 4]], [[5, 6]]],
+        form={
+            "class": "ListArray",
+            "starts": "i64",
+            "stops": "i64",
+            "content": {
+                "class": "NumpyArray",
+                "primitive": "uint8",
+                "inner_shape": [2],
+            },
+        },
+    )
+    assert array.tolist() == [[[1, 2], [3, 4]], [[5, 6]]]
+    assert str(array.type) == "2 * var * 2 * uint8"
+
+    form = {
+        "class": "ListOffsetArray",
+        "offsets": "i64",
+        "content": {"class": "EmptyArray"},
+    }
+    assert ak._v2.from_iter([[], []], form=form).tolist() == [[], []]
+
+
+def test_mismatch():
+    form = ak._v2.from_iter(data).layout.form
+    with pytest.raises(ValueError):
+        ak._v2.from_iter([{"x": 1.1}], form=form)
+    with pytest.raises(ValueError):
+        ak._v2.from_iter([1, None], form="int64")
+    with pytest.raises(ValueError):
+        ak._v2.from_iter([1, "two"], form="float64")
+    with pytest.raises(ValueError):
+        ak._v2.from_iter(
+            [[1, 2, 3]],
+            form={"class": "RegularArray", "size": 2, "content": "int64"},
+        )
+    with pytest.raises(NotImplementedError):
+        ak._v2.from_iter([1, "two"], form=ak._v2.from_iter([1, "two"]).layout.form)
+
+
+def test_ArrayBuilder():
+    form = ak._v2.from_iter(data).layout.form
+    builder = ak._v2.ArrayBuilder(form=form, initial=2)
+    for x in data * 500:
+        builder.append(x)
+    builder.extend(data)
+    assert len(builder) == 1503
+    assert str(builder.type) == "1503 * " + str(form.type)
+    assert builder.snapshot()[-6:].tolist() == data * 2
+
+    with pytest.raises(TypeError):
+        builder.integer(1)
+
+
+def test_leaf_types():
+    with pytest.raises(ValueError):
+        ak._v2.from_iter(["1.5"], form="float64")
+    with pytest.raises(ValueError):
+        ak._v2.from_iter([1, 1.7], form="int64")
+    with pytest.raises(ValueError):
+        ak._v2.from_iter([3], form="bool")
+    with pytest.raises(ValueError):
+        ak._v2.from_iter([True], form="int64")
+    with pytest.raises(ValueError):
+        ak._v2.from_iter([300], form="int8")
+    with pytest.raises(ValueError):
+        ak._v2.from_iter([-1], form="uint32")
+    with pytest.raises(ValueError):
+        ak._v2.from_iter(
+            [[1.5, 2.5]],
+            form={"class": "NumpyArray", "primitive": "int64", "inner_shape": [2]},
+        )
+
+    assert ak._v2.from_iter([1, 2.5], form="float64").tolist() == [1.0, 2.5]
+    assert ak._v2.from_iter([1, 2.5j], form="complex128").tolist() == [1, 2.5j]
+    assert ak._v2.from_iter([True, np.bool_(False)], form="bool").tolist() == [
+        True,
+        False,
+    ]
+    assert ak._v2.from_iter([np.int32(1), np.uint8(2), 3], form="int16").tolist() == [
+        1,
+        2,
+        3,
+    ]
+    assert ak._v2.from_iter([np.float32(1.5)], form="float64").tolist() == [1.5]
+
+    builder = ak._v2.ArrayBuilder(form="int64")
+    for bad in ("1", 1.7, True, None, [1]):
+        with pytest.raises(ValueError):
+            builder.append(bad)
+    assert builder.snapshot().tolist() == []
+
+
+def test_ArrayBuilder_checks_each_append():
+    form = ak._v2.from_iter(data).layout.form
+    builder = ak._v2.ArrayBuilder(form=form)
+    builder.append(data[0])
+    with pytest.raises(ValueError):
+        builder.append({"x": 1.1, "y": ["one"], "s": "", "o": None, "t": (1, b"")})
+    with pytest.raises(ValueError):
+        builder.append(dict(data[1], t=(2, "not bytes")))
+    builder.append(data[2])
+    assert builder.snapshot().tolist() == [data[0], data[2]]
+
+    # iterators in appended objects are only consumed once
+    builder = ak._v2.ArrayBuilder(form=ak._v2.from_iter([[1, 2]]).layout.form)
+    builder.append(iter([1, 2, 3]))
+    builder.append((x for x in [4]))
+    assert builder.snapshot().tolist() == [[1, 2, 3], [4]]
+
+
+def test_ArrayBuilder_keeps_valid_objects():
+    builder = ak._v2.ArrayBuilder(form="float64")
+    builder.append(1.1)
+    with pytest.raises(ValueError):
+        builder.append("bad")
+    builder.append(3.3)
+    assert builder.snapshot().tolist() == [1.1, 3.3]
+
+    with pytest.raises(ValueError):
+        builder.extend([4.4, None, 5.5])
+    assert builder.snapshot().tolist() == [1.1, 3.3, 4.4]
@@ -0,0 +1,57 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+from_iter = ak._v2.operations.ak_from_iter
+
+
+def through_builder(rows):
+    builder = ak._v2.ArrayBuilder()
+    for row in rows:
+        builder.append(row)
+    return builder.snapshot()
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [{"id": 1, "x": 1.1, "ok": True, "name": "one"}],
+        [
+            {"id": 1, "x": 1, "ok": True, "name": "one"},
+            {"name": "twö", "ok": False, "x": 2.2, "id": 2},
+            {"id": 3, "x": 3, "ok": False, "name": ""},
+        ],
+    ],
+)
+def test_same_as_builder(rows):
+    assert from_iter._flat_records(rows) is not None
+    array = ak._v2.from_iter(rows)
+    expected = through_builder(rows)
+    assert array.tolist() == expected.tolist()
+    assert str(array.type) == str(expected.type)
+    assert array.fields == ["id", "x", "ok", "name"]
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [],
+        [{}],
+        [{"x": 1}, {"y": 2}],
+        [{"x": 1}, {"x": 2, "y": 3}],
+        [{"x": 1}, {"x": None}],
+        [{"x": 1}, {"x": True}],
+        [{"x": 1}, {"x": "two"}],
+        [{"x": [1]}, {"x": [2]}],
+        [{"x": 1}, 2],
+    ],
+)
+def test_fallback(rows):
+    assert from_iter._flat_records(rows) is None
+    assert ak._v2.from_iter(rows).tolist() == through_builder(rows).tolist()
+
+
+def test_overflow():
+    assert from_iter._flat_records([{"x": 2**64}]) is None
@@ -0,0 +1,131 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(ak._v2._reducers, "_min_length_per_thread", 4)
+
+
+def jagged(dtype, seed=12345):
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(0, 7, 500)
+    counts[:10] = 0
+    counts[-10:] = 0
+    content = rng.integers(-5, 6, counts.sum())
+    if dtype == np.complex128:
+        content = content + 1j * rng.integers(-5, 6, counts.sum())
+    content = content.astype(dtype)
+    offsets = np.zeros(len(counts) + 1, np.int64)
+    offsets[1:] = np.cumsum(counts)
+    return ak._v2.Array(
+        ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "reducer",
+    [
+        ak._v2.operations.sum,
+        ak._v2.operations.prod,
+        ak._v2.operations.min,
+        ak._v2.operations.max,
+        ak._v2.operations.argmin,
+        ak._v2.operations.argmax,
+        ak._v2.operations.count,
+        ak._v2.operations.count_nonzero,
+        ak._v2.operations.any,
+        ak._v2.operations.all,
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.int64, np.float64, np.bool_, np.complex128])
+@pytest.mark.parametrize("mask_identity", [False, True])
+def test_same_as_serial(small_chunks, reducer, dtype, mask_identity):
+    if dtype == np.complex128 and reducer in (
+        ak._v2.operations.argmin,
+        ak._v2.operations.argmax,
+    ):
+        pytest.skip("complex argmin/argmax kernels are not reliable")
+    if dtype == np.bool_ and reducer in (
+        ak._v2.operations.prod,
+        ak._v2.operations.argmin,
+        ak._v2.operations.argmax,
+    ):
+        pytest.skip("not implemented for booleans")
+    array = jagged(dtype)
+    for axis in (-1, None):
+        expected = reducer(array, axis=axis, mask_identity=mask_identity)
+        result = reducer(array, axis=axis, mask_identity=mask_identity, num_threads=4)
+        assert to_list(result) == to_list(expected)
+
+
+def test_partition(small_chunks):
+    parents = ak._v2.index.Index64(np.array([0, 0, 0, 0, 2, 2, 2, 2, 2, 5, 5, 5]))
+    with ak._v2._reducers.threads(3):
+        chunks = ak._v2._reducers._partition(ak.nplike.Numpy.instance(), parents, 7)
+    assert chunks == [(0, 4, 0, 2), (4, 12, 2, 7)]
+
+    unsorted = ak._v2.index.Index64(np.array([0, 0, 0, 0, 2, 2, 2, 2, 2, 5, 5, 1]))
+    with ak._v2._reducers.threads(3):
+        assert (
+            ak._v2._reducers._partition(ak.nplike.Numpy.instance(), unsorted, 7) is None
+        )
+
+
+def test_global_default(small_chunks):
+    array = jagged(np.float64)
+    expected = to_list(ak._v2.operations.sum(array, axis=-1))
+    previous = ak._v2.set_reducer_threads(None)
+    try:
+        assert to_list(ak._v2.operations.sum(array, axis=-1)) == expected
+        assert ak._v2.set_reducer_threads(3) is None
+        assert to_list(ak._v2.operations.sum(array, axis=-1)) == expected
+        assert ak._v2._reducers._current_num_threads() == 3
+        with ak._v2.reducer_threads(2):
+            assert ak._v2._reducers._current_num_threads() == 2
+        assert ak._v2._reducers._current_num_threads() == 3
+    finally:
+        ak._v2.set_reducer_threads(previous)
+
+
+def test_context_applies_to_reducers(small_chunks, monkeypatch):
+    seen = []
+    original = ak._v2._reducers._partition
+
+    def partition(nplike, parents, outlength):
+        seen.append(ak._v2._reducers._current_num_threads())
+        return original(nplike, parents, outlength)
+
+    monkeypatch.setattr(ak._v2._reducers, "_partition", partition)
+    array = jagged(np.float64)
+    expected = to_list(ak._v2.operations.sum(array, axis=-1))
+
+    seen.clear()
+    with ak._v2.reducer_threads(4):
+        assert to_list(ak._v2.operations.sum(array, axis=-1)) == expected
+        assert ak._v2._reducers._current_num_threads() == 4
+    assert seen == [4]
+
+    seen.clear()
+    with ak._v2.reducer_threads(4):
+        ak._v2.operations.sum(array, axis=-1, num_threads=2)
+    assert seen == [2]
+
+
+def test_bad_num_threads():
+    array = jagged(np.float64)
+    for bad in (0, -1, 1.5, True):
+        with pytest.raises(TypeError):
+            ak._v2.operations.sum(array, axis=-1, num_threads=bad)
+        with pytest.raises(TypeError):
+            ak._v2.set_reducer_threads(bad)
+    with pytest.raises(TypeError):
+        with ak._v2.reducer_threads(None):
+            pass
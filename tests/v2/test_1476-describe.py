@@ -0,0 +1,175 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import concurrent.futures
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+def test_innermost():
+    array = ak._v2.Array([[0, 1, 2, 3], [], [4, 5]])
+    out = ak._v2.operations.describe(array, axis=-1)
+    assert out.fields == ["count", "sum", "sum2", "mean", "var", "std", "min", "max"]
+    assert to_list(out) == [
+        {
+            "count": 4,
+            "sum": 6,
+            "sum2": 14,
+            "mean": 1.5,
+            "var": 1.25,
+            "std": pytest.approx(np.sqrt(1.25)),
+            "min": 0,
+            "max": 3,
+        },
+        None,
+        {
+            "count": 2,
+            "sum": 9,
+            "sum2": 41,
+            "mean": 4.5,
+            "var": 0.25,
+            "std": 0.5,
+            "min": 4,
+            "max": 5,
+        },
+    ]
+
+
+def test_same_as_separate_reducers():
+    array = ak._v2.Array(
+        [[[1.1, 2.2, None], []], [[3.3], [4.4, 5.5, 6.6], None], [], [[7.7, 8.8]]]
+    )
+    for axis in (-1, -2, 0, 1, 2):
+        for mask_identity in (False, True):
+            for keepdims in (False, True):
+                out = ak._v2.operations.describe(
+                    array, axis=axis, mask_identity=mask_identity, keepdims=keepdims
+                )
+                for field, reducer in [
+                    ("count", ak._v2.operations.count),
+                    ("sum", ak._v2.operations.sum),
+                    ("min", ak._v2.operations.min),
+                    ("max", ak._v2.operations.max),
+                ]:
+                    expected = reducer(
+                        array,
+                        axis=axis,
+                        mask_identity=mask_identity,
+                        keepdims=keepdims,
+                    )
+                    assert to_list(out[field]) == to_list(expected)
+
+                expected = ak._v2.operations.sum(
+                    array**2,
+                    axis=axis,
+                    mask_identity=mask_identity,
+                    keepdims=keepdims,
+                )
+                assert to_list(
+                    ak._v2.operations.flatten(out["sum2"], axis=None)
+                ) == pytest.approx(
+                    to_list(ak._v2.operations.flatten(expected, axis=None))
+                )
+
+
+def test_var_std():
+    array = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6]])
+    regular = ak._v2.Array(np.arange(2 * 3 * 5).reshape(2, 3, 5) ** 1.5)
+    for axis in (-1, -2, 0):
+        for ddof in (0, 1):
+            out = ak._v2.operations.describe(regular, axis=axis, ddof=ddof)
+            expected = np.var(ak._v2.operations.to_numpy(regular), axis=axis, ddof=ddof)
+            assert np.allclose(ak._v2.operations.to_numpy(out["var"]), expected)
+            assert np.allclose(
+                ak._v2.operations.to_numpy(out["std"]), np.sqrt(expected)
+            )
+            assert np.allclose(
+                ak._v2.operations.to_numpy(
+                    ak._v2.operations.var(regular, axis=axis, ddof=ddof)
+                ),
+                expected,
+            )
+
+    out = ak._v2.operations.describe(array, axis=-1)
+    assert to_list(out["mean"]) == pytest.approx([2.2, None, 4.95, 6.6])
+    assert to_list(out["var"]) == pytest.approx([0.8066666666666666, None, 0.3025, 0])
+    assert to_list(ak._v2.operations.var(array, axis=-1)) == to_list(out["var"])
+    assert to_list(ak._v2.operations.std(array, axis=-1)) == to_list(out["std"])
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.int16, np.uint8, np.uint16])
+def test_small_integers(dtype):
+    array = ak._v2.Array(
+        ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(np.array([0, 2, 2, 5])),
+            ak._v2.contents.NumpyArray(np.array([100, 100, 120, 0, 90], dtype)),
+        )
+    )
+    out = ak._v2.operations.describe(array, axis=-1)
+    assert to_list(out.sum2) == [20000, None, 22500]
+    assert to_list(out.sum) == [200, None, 210]
+    assert to_list(out.var) == [0, None, pytest.approx(2600)]
+    assert to_list(out.min) == [100, None, 0]
+    assert out.min.layout.content.dtype == np.dtype(dtype)
+
+
+def test_axis_none():
+    array = ak._v2.Array([[1, 2, 3], [], [None, 4], [5.5]])
+    out = ak._v2.operations.describe(array)
+    assert isinstance(out, ak._v2.Record)
+    assert out.tolist() == {
+        "count": 5,
+        "sum": 15.5,
+        "sum2": 60.25,
+        "mean": 3.1,
+        "var": pytest.approx(np.var([1, 2, 3, 4, 5.5])),
+        "std": pytest.approx(np.std([1, 2, 3, 4, 5.5])),
+        "min": 1,
+        "max": 5.5,
+    }
+
+    assert ak._v2.operations.describe(ak._v2.Array([[], []])) is None
+    out = ak._v2.operations.describe(ak._v2.Array([[], []]), mask_identity=False)
+    assert out["count"] == 0
+    assert np.isnan(out["mean"])
+
+
+def test_typetracer():
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    typetracer = ak._v2.Array(array.layout.typetracer)
+    assert str(ak._v2.operations.describe(typetracer, axis=-1).type) == str(
+        ak._v2.operations.describe(array, axis=-1).type
+    )
+
+
+def test_concurrent_ddof():
+    array = ak._v2.Array([[1.0, 2.0, 4.0], [3.0, 7.0], [5.0, 6.0, 8.0, 9.0]])
+    expected = {
+        ddof: to_list(ak._v2.operations.var(array, axis=1, ddof=ddof))
+        for ddof in (0, 1)
+    }
+
+    def run(ddof):
+        return [
+            to_list(ak._v2.operations.var(array, axis=1, ddof=ddof)) == expected[ddof]
+            for _ in range(100)
+        ]
+
+    def run_min(initial):
+        # min with an initial value must not leak into describe's min
+        out = []
+        for _ in range(100):
+            ak._v2.operations.min(array, axis=1, initial=initial)
+            out.append(to_list(ak._v2.operations.describe(array, axis=1).min))
+        return [x == [1, 3, 5] for x in out]
+
+    with concurrent.futures.ThreadPoolExecutor(3) as executor:
+        results = [
+            executor.submit(run, 0),
+            executor.submit(run, 1),
+            executor.submit(run_min, 0.0),
+        ]
+    assert all(all(x.result()) for x in results)
@@ -0,0 +1,47 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import ctypes
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_lookup_is_cached():
+    nplike = ak.nplike.Numpy.instance()
+    kernel = nplike["awkward_Index_to_Index64", np.int64, np.int32]
+    assert nplike["awkward_Index_to_Index64", np.int64, np.int32] is kernel
+    assert nplike["awkward_Index_to_Index64", np.int64, np.uint32] is not kernel
+    assert kernel._plan == (
+        ctypes.POINTER(ctypes.c_int64),
+        ctypes.POINTER(ctypes.c_int32),
+        None,
+    )
+
+
+def test_call():
+    nplike = ak.nplike.Numpy.instance()
+    kernel = nplike["awkward_Index_to_Index64", np.int64, np.int32]
+
+    fromptr = np.arange(10, dtype=np.int32)
+    toptr = np.zeros(10, np.int64)
+    error = kernel(toptr, fromptr, 10)
+    assert error.str is None
+    assert toptr.tolist() == list(range(10))
+
+    # views are passed with their offset
+    toptr = np.zeros(10, np.int64)
+    kernel(toptr[5:], fromptr[2:], 5)
+    assert toptr.tolist() == [0, 0, 0, 0, 0, 2, 3, 4, 5, 6]
+
+    # arrays that are not plain ndarrays and ctypes pointers still work
+    toptr = np.zeros(3, np.int64).view(np.ma.MaskedArray)
+    kernel(toptr, ctypes.cast(fromptr.ctypes.data, ctypes.POINTER(ctypes.c_int32)), 3)
+    assert toptr.tolist() == [0, 1, 2]
+
+
+def test_errors():
+    # kernel errors are still reported through the returned struct
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    with pytest.raises(IndexError):
+        array[[0, 1, 2], [2, 0, 0]]
@@ -0,0 +1,64 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_records_kernel_calls():
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    with ak._v2.profile() as prof:
+        ak._v2.operations.sum(array, axis=1)
+        array[array > 2]
+
+    calls = prof.calls
+    assert len(calls) != 0
+    assert {x.operation for x in calls} == {"ak._v2.sum", "<slice>"}
+
+    (reduce_sum,) = [x for x in calls if x.kernel == "awkward_reduce_sum"]
+    assert reduce_sum.operation == "ak._v2.sum"
+    assert reduce_sum.types == (
+        np.dtype(np.int64),
+        np.dtype(np.int64),
+        np.dtype(np.int64),
+    )
+    assert 5 in reduce_sum.lengths
+    assert reduce_sum.time >= 0
+
+    summary = prof.by_operation()
+    assert set(summary) == {"ak._v2.sum", "<slice>"}
+    assert summary["ak._v2.sum"]["calls"] == sum(
+        x.operation == "ak._v2.sum" for x in calls
+    )
+    assert "awkward_reduce_sum" in summary["ak._v2.sum"]["kernels"]
+    assert prof.time == pytest.approx(sum(x.time for x in calls))
+
+    report = prof.report()
+    assert "ak._v2.sum" in report
+    assert "awkward_reduce_sum" in report
+    assert "awkward_reduce_sum" not in prof.report(kernels=False)
+
+
+def test_nesting_and_exit():
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    with ak._v2.profile() as outer:
+        ak._v2.operations.sum(array, axis=1)
+        with ak._v2.profile() as inner:
+            ak._v2.operations.max(array, axis=1)
+    assert {x.operation for x in outer.calls} == {"ak._v2.sum", "ak._v2.max"}
+    assert {x.operation for x in inner.calls} == {"ak._v2.max"}
+
+    assert ak.nplike.profilers == ()
+    before = len(outer.calls)
+    ak._v2.operations.sum(array, axis=1)
+    assert len(outer.calls) == before
+
+
+def test_threaded_reducers_keep_operation(monkeypatch):
+    monkeypatch.setattr(ak._v2._reducers, "_min_length_per_thread", 2)
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5], [6, 7, 8, 9]])
+    with ak._v2.profile() as prof:
+        ak._v2.operations.sum(array, axis=1, num_threads=2)
+    reduce_sum = [x for x in prof.calls if x.kernel == "awkward_reduce_sum"]
+    assert len(reduce_sum) == 2
+    assert {x.operation for x in reduce_sum} == {"ak._v2.sum"}
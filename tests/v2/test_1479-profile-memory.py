@@ -0,0 +1,63 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import gc
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_allocations_by_operation():
+    one = ak._v2.Array([[1, 2, 3], [], [4, 5]] * 100)
+    two = ak._v2.Array([[1.1, 2.2], [3.3], []] * 100)
+    with ak._v2.profile(memory=True) as prof:
+        ak._v2.operations.cartesian([one, two], axis=1)
+        ak._v2.operations.sum(one, axis=1)
+
+    summary = prof.memory_by_operation()
+    assert set(summary) == {"ak._v2.cartesian", "ak._v2.sum"}
+    for name, operation in summary.items():
+        allocations = [x for x in prof.allocations if x.operation == name]
+        assert operation["allocations"] == len(allocations)
+        assert operation["bytes"] == sum(x.nbytes for x in allocations)
+        assert 0 < operation["peak"] <= operation["bytes"]
+    assert prof.peak >= max(x["peak"] for x in summary.values())
+
+    report = prof.memory_report()
+    assert "ak._v2.cartesian" in report
+    assert "total peak" in report
+    assert "total peak" in str(prof)
+
+
+def test_live_bytes():
+    nplike = ak.nplike.Numpy.instance()
+    with ak._v2.profile(memory=True) as prof:
+        existing = np.arange(10)
+        assert nplike.asarray(existing) is existing
+        assert len(prof.allocations) == 0
+
+        array = nplike.empty(1000, np.int64)
+        view = array[10:]
+        assert prof.live == 8000
+        del array
+        gc.collect()
+        assert prof.live == 8000
+        del view
+        gc.collect()
+        assert prof.live == 0
+        assert prof.peak == 8000
+
+    (allocation,) = prof.allocations
+    assert allocation == ("<no operation>", "empty", np.dtype(np.int64), 8000)
+
+    nplike.empty(1000, np.int64)
+    assert len(prof.allocations) == 1
+    assert ak.nplike.allocation_trackers == ()
+
+
+def test_off_by_default():
+    with ak._v2.profile() as prof:
+        ak._v2.operations.sum(ak._v2.Array([[1, 2, 3], [], [4, 5]]), axis=1)
+    assert len(prof.calls) != 0
+    assert prof.allocations == []
+    assert "total peak" not in str(prof)
@@ -0,0 +1,106 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(ak._v2._connect.numpy, "_min_length_per_thread", 2)
+
+
+def test_chunks(small_chunks):
+    nplike = ak.nplike.Numpy.instance()
+    x = np.arange(10.0)
+    with ak._v2._connect.numpy.threads(3):
+        assert ak._v2._connect.numpy._ufunc_chunks(np.add, [x, 1], {}, nplike) == [
+            (0, 3),
+            (3, 6),
+            (6, 10),
+        ]
+        # different lengths (broadcasting), generalized ufuncs, and keyword
+        # arguments are applied to the whole buffers
+        assert (
+            ak._v2._connect.numpy._ufunc_chunks(np.add, [x, x[:1]], {}, nplike) is None
+        )
+        assert (
+            ak._v2._connect.numpy._ufunc_chunks(np.matmul, [x, x], {}, nplike) is None
+        )
+        assert (
+            ak._v2._connect.numpy._ufunc_chunks(
+                np.add, [x, x], {"dtype": np.float32}, nplike
+            )
+            is None
+        )
+    assert ak._v2._connect.numpy._ufunc_chunks(np.add, [x, 1], {}, nplike) is None
+
+
+def test_same_results(small_chunks):
+    one = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6], [7.7, 8.8, 9.9]])
+    two = ak._v2.Array([[1, 2, 3], [], [4, 5], [6], [7, 8, 9]])
+    regular = ak._v2.Array(np.arange(2 * 3 * 5).reshape(2, 3, 5))
+    records = ak._v2.Array([{"x": [1, 2], "y": 1.5}, {"x": [], "y": 2.5}] * 5)
+
+    def compute():
+        return [
+            one + two,
+            one * 2 - two,
+            np.sqrt(one),
+            two + [10, 20, 30, 40, 50],
+            np.maximum(one, two),
+            two > 4,
+            np.negative(regular),
+            regular + regular[:, :1],
+            records.x + records.y,
+        ]
+
+    expected = [to_list(x) for x in compute()]
+    for n in (1, 2, 3, 8):
+        with ak._v2._connect.numpy.threads(n):
+            assert [to_list(x) for x in compute()] == expected
+
+
+def test_dtypes(small_chunks):
+    array = ak._v2.Array(
+        ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(np.array([0, 3, 3, 10])),
+            ak._v2.contents.NumpyArray(np.arange(10, dtype=np.uint8)),
+        )
+    )
+    with ak._v2._connect.numpy.threads(4):
+        assert str((array + np.uint8(250)).type) == str((array + np.uint8(1)).type)
+        assert to_list(array + np.uint8(250)) == [
+            [250, 251, 252],
+            [],
+            [253, 254, 255, 0, 1, 2, 3],
+        ]
+        assert str(np.true_divide(array, 2).type) == "3 * var * float64"
+
+
+def test_errstate(small_chunks):
+    array = ak._v2.Array([[1.0, 0.0, -1.0], [], [0.0, 2.0, 0.0, 3.0]])
+    with ak._v2._connect.numpy.threads(3):
+        with np.errstate(divide="raise"):
+            with pytest.raises(FloatingPointError):
+                1 / array
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = 1 / array
+    assert to_list(result)[0] == [1.0, np.inf, -1.0]
+
+
+def test_num_threads(monkeypatch):
+    monkeypatch.setattr(ak._v2._connect.numpy, "num_threads", None)
+    assert ak._v2._connect.numpy._current_num_threads() >= 1
+    monkeypatch.setattr(ak._v2._connect.numpy, "num_threads", 3)
+    assert ak._v2._connect.numpy._current_num_threads() == 3
+    with ak._v2._connect.numpy.threads(2):
+        assert ak._v2._connect.numpy._current_num_threads() == 2
+    assert ak._v2._connect.numpy._current_num_threads() == 3
+
+    for bad in (0, -1, 1.5, True, "2"):
+        with pytest.raises(TypeError):
+            with ak._v2._connect.numpy.threads(bad):
+                pass
@@ -0,0 +1,152 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import tracemalloc
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(ak._v2._lazy, "_block_length", 2)
+
+
+def test_record_and_repr():
+    one = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    two = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    x = ak._v2.lazy(one)
+    expression = x * two + np.sqrt(x)
+    assert isinstance(expression, ak._v2._lazy.LazyArray)
+    assert repr(expression) == "<LazyArray add(multiply(x0, x1), sqrt(x0))>"
+    assert repr(2 * x) == "<LazyArray multiply(2, x0)>"
+    assert repr(two - x) == "<LazyArray subtract(x0, x1)>"
+    assert repr(ak._v2.lazy(two) + expression) == (
+        "<LazyArray add(x0, add(multiply(x1, x0), sqrt(x1)))>"
+    )
+
+    assert to_list(x.compute()) == to_list(one)
+    assert isinstance(expression.compute(), ak._v2.Array)
+
+    with pytest.raises(TypeError):
+        ak._v2.lazy(3)
+    with pytest.raises(ValueError):
+        expression.compute(engine="no-such-engine")
+
+
+def test_same_results(small_blocks):
+    one = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6], [7.7, 8.8, 9.9]])
+    two = ak._v2.Array([[1, 2, 3], [], [4, 5], [6], [7, 8, 9]])
+    regular = ak._v2.Array(np.arange(2 * 3 * 5).reshape(2, 3, 5))
+    option = ak._v2.Array(
+        [[1.5, None, 2.5], None, [3.5, None], [None], [4.5, 5.5, 6.5]]
+    )
+    small = ak._v2.Array(np.arange(10, dtype=np.uint8))
+    flat = np.array([10, 20, 30, 40, 50])
+    first = regular[:, :1]
+
+    def expressions(one, two, regular, option, small):
+        return [
+            one * two + np.sqrt(one),
+            (one - 1) * (one + 1) / two,
+            np.maximum(one, two) > 4,
+            two + flat,
+            flat * one - two,
+            np.negative(regular) * 2 + first,
+            option * one + two,
+            np.sin(option) ** 2 + np.cos(option) ** 2,
+            np.float32(2) * two,
+            np.uint8(250) + small,
+        ]
+
+    arrays = (one, two, regular, option, small)
+    eager = expressions(*arrays)
+    lazy = expressions(*[ak._v2.lazy(x) for x in arrays])
+    for expected, expression in zip(eager, lazy):
+        assert isinstance(expression, ak._v2._lazy.LazyArray)
+        result = expression.compute()
+        assert to_list(result) == to_list(expected)
+        assert str(result.type) == str(expected.type)
+
+
+def test_shared_leaves():
+    one = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    x = ak._v2.lazy(one)
+    y = x * 2
+    assert to_list((y + y + one).compute()) == to_list(one * 2 + one * 2 + one)
+    assert to_list((x * one).compute()) == to_list(one * one)
+
+
+def test_eager_fallback():
+    records = ak._v2.Array([{"x": 1, "y": [1.5]}, {"x": 2, "y": []}])
+    assert to_list(np.sqrt(ak._v2.lazy(records) * 4).compute()) == to_list(
+        np.sqrt(records * 4)
+    )
+    with pytest.raises(ValueError):
+        records + records
+    with pytest.raises(ValueError):
+        (ak._v2.lazy(records) + records).compute()
+    with pytest.raises(ValueError):
+        (ak._v2.lazy(records) + np.sqrt(ak._v2.lazy(records))).compute()
+
+    strings = ak._v2.Array(["one", "two", "three"])
+    assert to_list((ak._v2.lazy(strings) == strings).compute()) == [True, True, True]
+
+
+def test_typetracer():
+    one = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    two = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    tracers = [ak._v2.Array(x.layout.typetracer) for x in (one, two)]
+    x, y = [ak._v2.lazy(x) for x in tracers]
+    result = (x * y + 1 > 2).compute()
+    assert str(result.layout.form.type) == "var * bool"
+
+
+def test_errstate():
+    array = ak._v2.Array([[1.0, 0.0, -1.0], [], [0.0, 2.0]])
+    with np.errstate(divide="raise"):
+        with pytest.raises(FloatingPointError):
+            (1 / ak._v2.lazy(array) + 1).compute()
+
+
+def test_intermediates_are_not_allocated():
+    length = 1 << 20
+    one = ak._v2.Array(
+        ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(np.arange(0, length + 1, 4)),
+            ak._v2.contents.NumpyArray(np.linspace(1, 2, length)),
+        )
+    )
+    nbytes = length * 8
+
+    def peak(function):
+        tracemalloc.start()
+        try:
+            result = function(one)  # noqa: F841
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def expression(x):
+        return ((x * 2 + 1) * x - 3) / x
+
+    eager = peak(expression)
+    lazy = peak(lambda x: expression(ak._v2.lazy(x)).compute())
+    assert eager > 2 * nbytes
+    assert lazy < 1.5 * nbytes
+
+
+def test_numexpr():
+    pytest.importorskip("numexpr")
+
+    one = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    two = ak._v2.Array([[1.0, 2.0, 3.0], [], [4.0, 5.0]])
+    x = ak._v2.lazy(one)
+    expression = x * two + np.sqrt(x) - 1
+    assert to_list(expression.compute(engine="numexpr")) == pytest.approx(
+        to_list(one * two + np.sqrt(one) - 1)
+    )
+    with pytest.raises(ValueError):
+        np.floor(x).compute(engine="numexpr")
@@ -0,0 +1,34 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+def test_first_group_empty():
+    array = ak._v2.Array([[], [[0]]])
+    assert to_list(ak._v2.operations.sum(array, axis=1)) == [[], [0]]
+    assert to_list(ak._v2.operations.max(array, axis=1)) == [[], [0]]
+    assert to_list(ak._v2.operations.argmax(array, axis=1)) == [[], [0]]
+
+    array = ak._v2.Array([[], [], [[1, 2], [3]], [[4]]])
+    assert to_list(ak._v2.operations.sum(array, axis=1)) == [[], [], [4, 2], [4]]
+    assert to_list(ak._v2.operations.max(array, axis=1)) == [[], [], [3, 2], [4]]
+    assert to_list(ak._v2.operations.argmax(array, axis=1)) == [[], [], [1, 0], [0]]
+
+
+def test_random():
+    rng = np.random.default_rng(12345)
+    data = [
+        [list(range(rng.integers(0, 5))) for _ in range(rng.integers(0, 5))]
+        for _ in range(2000)
+    ]
+    expected = []
+    for outer in data:
+        length = max((len(x) for x in outer), default=0)
+        expected.append([sum(x[i] for x in outer if len(x) > i) for i in range(length)])
+    array = ak._v2.Array(data)
+    assert to_list(ak._v2.operations.sum(array, axis=1)) == expected
+    assert to_list(ak._v2.operations.sum(array[::-1], axis=1)) == expected[::-1]